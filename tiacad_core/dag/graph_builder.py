@@ -9,6 +9,7 @@ Version: 3.2.0
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, Set, List
 import hashlib
 import json
@@ -32,6 +33,10 @@ class GraphBuilder:
     2. Part → Parameter (parts reference parameters)
     3. Operation → Part (operations transform parts)
 
+    A builder accumulates state while building, so it is not safe to share
+    one between threads; use a builder per thread (or reset() between
+    builds). The module-level expression cache is thread-safe.
+
     Example:
         >>> builder = GraphBuilder()
         >>> graph = builder.build_graph(yaml_data)
@@ -40,11 +45,23 @@ class GraphBuilder:
 
     # Regex pattern for ${param} and ${expr} references
     PARAM_PATTERN = re.compile(r'\$\{([^}]+)\}')
+    # Identifiers inside a ${...} expression, e.g. "width * 2" -> ["width"]
+    IDENTIFIER_PATTERN = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
 
     def __init__(self):
         self.graph = ModelGraph()
         self.parameter_names: Set[str] = set()
 
+    def reset(self) -> None:
+        """
+        Discard the state of a previous build so the builder can be reused.
+
+        Graphs returned by earlier build_graph() calls are left untouched;
+        the next build starts from a fresh ModelGraph.
+        """
+        self.graph = ModelGraph()
+        self.parameter_names = set()
+
     def build_graph(self, yaml_data: Dict[str, Any]) -> ModelGraph:
         """
         Convert YAML to dependency graph.
@@ -349,12 +366,10 @@ class GraphBuilder:
 
         def extract(value):
             if isinstance(value, str):
-                # Find all ${...} patterns
-                for expr in self.PARAM_PATTERN.findall(value):
-                    # Extract identifiers from expression
-                    # e.g., "${width * 2}" → ["width"]
-                    identifiers = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', expr)
-                    refs.update(identifiers)
+                # Plain strings ('box', 'subtract', ...) can't reference
+                # anything; skip the regex and keep them out of the cache
+                if '${' in value:
+                    refs.update(_deps_from_expr(value))
 
             elif isinstance(value, dict):
                 for v in value.values():
@@ -431,3 +446,21 @@ class GraphBuilder:
         # Convert to stable JSON string
         json_str = json.dumps(spec, sort_keys=True)
         return hashlib.sha256(json_str.encode()).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1024)
+def _deps_from_expr(value: str) -> frozenset:
+    """
+    Identifiers referenced by the ${...} expressions in a string.
+
+    The same fragments (e.g. "${width}") recur across many parts and
+    operations, so results are memoized per string.
+
+    Example:
+        >>> _deps_from_expr("${width * 2}")
+        frozenset({'width'})
+    """
+    refs = set()
+    for expr in GraphBuilder.PARAM_PATTERN.findall(value):
+        refs.update(GraphBuilder.IDENTIFIER_PATTERN.findall(expr))
+    return frozenset(refs)
@@ -49,9 +49,7 @@ class InvalidationTracker:
         directly_changed = self._find_directly_changed(new_graph)
 
         dirty: Set[str] = set(directly_changed)
-        for node_id in directly_changed:
-            if node_id in new_graph:
-                dirty.update(new_graph.get_transitive_dependents(node_id))
+        dirty.update(new_graph.get_transitive_dependents_many(directly_changed))
 
         return dirty
 
@@ -113,8 +111,7 @@ class InvalidationTracker:
 
         directly_changed = added | modified
         dirty: Set[str] = set(directly_changed)
-        for node_id in directly_changed:
-            dirty.update(new_graph.get_transitive_dependents(node_id))
+        dirty.update(new_graph.get_transitive_dependents_many(directly_changed))
 
         clean = new_ids - dirty
         hit_rate = len(clean) / len(new_ids) if new_ids else 1.0
@@ -9,9 +9,11 @@ Version: 3.2.0
 """
 
 import networkx as nx
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Set, List, Optional, Any
+from typing import Dict, Iterable, Set, List, Optional, Any, Tuple
+import sys
 import time
 
 
@@ -25,7 +27,7 @@ class NodeType(Enum):
     CONSTRAINT = "constraint"  # constraints: flush/offset/coaxial/tangent
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """
     Node in the dependency graph.
@@ -43,6 +45,9 @@ class GraphNode:
         is_valid: Whether node's cached result is valid
         is_pattern: Whether this is a pattern operation (creates multiple parts)
         metadata: Additional node-specific data
+
+    Slotted: real models build thousands of nodes, so this keeps each one
+    small and its attribute reads cheap.
     """
     node_id: str
     node_type: NodeType
@@ -56,11 +61,16 @@ class GraphNode:
 
     def __post_init__(self):
         """Validate node_id format"""
-        if ':' not in self.node_id:
+        # Interned so the same ID shared across nodes, the NetworkX adjacency
+        # and the various ID sets is one object (and compares by identity)
+        self.node_id = sys.intern(self.node_id)
+
+        # partition() splits at the first colon without building a list
+        prefix, sep, _ = self.node_id.partition(':')
+        if not sep:
             raise ValueError(f"node_id must be in format 'type:name', got: {self.node_id}")
 
-        expected_prefix = f"{self.node_type.value}:"
-        if not self.node_id.startswith(expected_prefix):
+        if prefix != self.node_type.value:
             raise ValueError(
                 f"node_id '{self.node_id}' doesn't match type '{self.node_type.value}'"
             )
@@ -92,6 +102,22 @@ class ModelGraph:
         self.graph = nx.DiGraph()
         self.nodes: Dict[str, GraphNode] = {}
         self.valid_nodes: Set[str] = set()
+        # Kept disjoint from valid_nodes by add_node/mark_valid/mark_invalid
+        self.invalid_nodes: Set[str] = set()
+        self._type_counts: Dict[NodeType, int] = dict.fromkeys(NodeType, 0)
+        # Nodes with no dependencies / no dependents, updated as edges are added
+        self._roots: Set[str] = set()
+        self._leaves: Set[str] = set()
+        # Structure-derived results, dropped whenever a node or edge is added
+        self._topo_cache: Optional[List[str]] = None
+        self._depth_cache: Optional[int] = None
+        self._acyclic = False
+
+    def _invalidate_structure(self) -> None:
+        """Drop cached results that depend on the graph's nodes/edges"""
+        self._topo_cache = None
+        self._depth_cache = None
+        self._acyclic = False
 
     def add_node(self, node: GraphNode) -> None:
         """
@@ -108,9 +134,15 @@ class ModelGraph:
 
         self.nodes[node.node_id] = node
         self.graph.add_node(node.node_id)
+        self._type_counts[node.node_type] += 1
+        self._roots.add(node.node_id)
+        self._leaves.add(node.node_id)
+        self._invalidate_structure()
 
         if node.is_valid:
             self.valid_nodes.add(node.node_id)
+        else:
+            self.invalid_nodes.add(node.node_id)
 
     def add_dependency(self, dependent: str, dependency: str) -> None:
         """
@@ -135,28 +167,119 @@ class ModelGraph:
 
         # Add edge: dependency → dependent
         # NetworkX convention: edge (a, b) means a → b
-        self.graph.add_edge(dependency, dependent)
+        self.graph.add_edge(sys.intern(dependency), sys.intern(dependent))
+        self._roots.discard(dependent)
+        self._leaves.discard(dependency)
+        self._invalidate_structure()
+
+    def bulk_load(self,
+                  nodes: Iterable[GraphNode],
+                  dependencies: Iterable[Tuple[str, str]] = ()) -> None:
+        """
+        Add many nodes and dependency edges at once.
+
+        Equivalent to add_node() for each node followed by add_dependency()
+        for each (dependent, dependency) pair, but validates everything in
+        one pass up front and then inserts nodes and edges in bulk. If any
+        check fails nothing is added.
+
+        Args:
+            nodes: GraphNodes to add
+            dependencies: (dependent, dependency) pairs, in add_dependency()
+                argument order; endpoints may be existing or new nodes
+
+        Raises:
+            ValueError: If a node ID is duplicated or an endpoint doesn't exist
+        """
+        new_nodes: Dict[str, GraphNode] = {}
+        for node in nodes:
+            if node.node_id in self.nodes or node.node_id in new_nodes:
+                raise ValueError(f"Node '{node.node_id}' already exists in graph")
+            new_nodes[node.node_id] = node
+
+        edges = []
+        for dependent, dependency in dependencies:
+            if dependent not in self.nodes and dependent not in new_nodes:
+                raise ValueError(f"Dependent node '{dependent}' not found in graph")
+            if dependency not in self.nodes and dependency not in new_nodes:
+                raise ValueError(f"Dependency node '{dependency}' not found in graph")
+            edges.append((sys.intern(dependency), sys.intern(dependent)))
+
+        self.nodes.update(new_nodes)
+        self.graph.add_nodes_from(new_nodes)
+        self.graph.add_edges_from(edges)
+        self._roots.update(new_nodes)
+        self._leaves.update(new_nodes)
+        for dependency, dependent in edges:
+            self._roots.discard(dependent)
+            self._leaves.discard(dependency)
+        for node_id, node in new_nodes.items():
+            self._type_counts[node.node_type] += 1
+            if node.is_valid:
+                self.valid_nodes.add(node_id)
+            else:
+                self.invalid_nodes.add(node_id)
+        self._invalidate_structure()
 
     def detect_cycles(self) -> List[List[str]]:
         """
         Detect circular dependencies.
 
+        Only a single witness cycle is reported: enumerating every elementary
+        cycle (nx.simple_cycles) can take exponential time on large graphs,
+        while finding one is a linear-time DFS. Runs on every graph build.
+
         Returns:
-            List of cycles found. Each cycle is a list of node IDs.
-            Empty list if no cycles exist (valid DAG).
+            List containing one cycle if any exists, as a list of node IDs
+            in dependency-edge order (the closing edge back to the first
+            node is implied). Empty list if no cycles exist (valid DAG).
 
         Example:
             >>> cycles = graph.detect_cycles()
             >>> if cycles:
             ...     print(f"Cycle: {' -> '.join(cycles[0])}")
         """
-        try:
-            cycles = list(nx.simple_cycles(self.graph))
-            return cycles
-        except Exception:
-            # NetworkX might raise for empty graphs
+        # A previous check (or a full topological sort) already proved the
+        # current structure acyclic
+        if self._acyclic or self._topo_cache is not None:
             return []
 
+        # Iterative three-color DFS (0 = unvisited, 1 = on the current path,
+        # 2 = finished). Walks NetworkX's successor dict directly rather than
+        # through its view objects, so each visit allocates only an iterator.
+        succ = self.graph._succ
+        color = dict.fromkeys(succ, 0)
+        parent: Dict[str, str] = {}
+
+        for root in succ:
+            if color[root]:
+                continue
+            color[root] = 1
+            stack = [(root, iter(succ[root]))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    state = color[child]
+                    if state == 0:
+                        color[child] = 1
+                        parent[child] = node
+                        stack.append((child, iter(succ[child])))
+                        break
+                    if state == 1:
+                        # Back edge node -> child closes a cycle; walk the
+                        # DFS path back from node to child
+                        cycle = [node]
+                        while cycle[-1] != child:
+                            cycle.append(parent[cycle[-1]])
+                        cycle.reverse()
+                        return [cycle]
+                else:
+                    color[node] = 2
+                    stack.pop()
+
+        self._acyclic = True
+        return []
+
     def topological_sort(self, nodes: Optional[Set[str]] = None) -> List[str]:
         """
         Return nodes in build order (dependencies before dependents).
@@ -168,15 +291,51 @@ class ModelGraph:
             List of node IDs in topological order
 
         Raises:
-            nx.NetworkXError: If graph has cycles (shouldn't happen if validated)
+            nx.NetworkXUnfeasible: If graph has cycles (shouldn't happen if validated)
         """
         if nodes is None:
-            # Sort all nodes
-            return list(nx.topological_sort(self.graph))
-        else:
-            # Sort subset - need to preserve dependency relationships
-            subgraph = self.graph.subgraph(nodes)
-            return list(nx.topological_sort(subgraph))
+            # Sort all nodes; cached until the next add_node/add_dependency
+            if self._topo_cache is None:
+                self._topo_cache = self._kahn_order(self.graph._succ)
+            return list(self._topo_cache)
+
+        if self._topo_cache is not None:
+            # Any topological order restricted to a subset is a valid order
+            # of the induced subgraph
+            return [node_id for node_id in self._topo_cache if node_id in nodes]
+
+        # Sort subset - need to preserve dependency relationships
+        return self._kahn_order(self.graph.subgraph(nodes)._succ)
+
+    @staticmethod
+    def _kahn_order(succ: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Kahn's algorithm over a raw successor dict (edges to nodes outside
+        succ are ignored). Ties are broken by node insertion order.
+
+        Raises:
+            nx.NetworkXUnfeasible: If the nodes contain a cycle
+        """
+        in_degree = dict.fromkeys(succ, 0)
+        for children in succ.values():
+            for child in children:
+                if child in in_degree:
+                    in_degree[child] += 1
+
+        ready = deque(node for node, degree in in_degree.items() if degree == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for child in succ[node]:
+                if child in in_degree:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        ready.append(child)
+
+        if len(order) != len(in_degree):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return order
 
     def get_dependencies(self, node_id: str) -> Set[str]:
         """
@@ -223,8 +382,9 @@ class ModelGraph:
         if node_id not in self.nodes:
             return set()
 
-        # nx.ancestors returns all nodes with paths TO this node
-        return nx.ancestors(self.graph, node_id)
+        reachable = self._reachable(self.graph._pred, [node_id])
+        reachable.discard(node_id)
+        return reachable
 
     def get_transitive_dependents(self, node_id: str) -> Set[str]:
         """
@@ -242,8 +402,45 @@ class ModelGraph:
         if node_id not in self.nodes:
             return set()
 
-        # nx.descendants returns all nodes reachable FROM this node
-        return nx.descendants(self.graph, node_id)
+        reachable = self._reachable(self.graph._succ, [node_id])
+        reachable.discard(node_id)
+        return reachable
+
+    def get_transitive_dependents_many(self, node_ids: Iterable[str]) -> Set[str]:
+        """
+        Get all downstream nodes affected by any of several nodes.
+
+        Equivalent to the union of get_transitive_dependents() over node_ids
+        in a DAG, but a single traversal: nodes shared by several downstream
+        closures are visited once instead of once per changed node.
+
+        Args:
+            node_ids: Nodes to query (IDs not in the graph are ignored)
+
+        Returns:
+            Set of node IDs reachable through at least one edge from any of
+            node_ids
+        """
+        starts = [node_id for node_id in node_ids if node_id in self.nodes]
+        return self._reachable(self.graph._succ, starts)
+
+    @staticmethod
+    def _reachable(adjacency: Dict[str, Dict[str, Any]], starts: List[str]) -> Set[str]:
+        """
+        All nodes reachable through at least one edge from any of starts.
+
+        A plain DFS over NetworkX's raw successor/predecessor dicts
+        (graph._succ / graph._pred), equivalent to nx.descendants /
+        nx.ancestors without their per-call view objects.
+        """
+        seen: Set[str] = set()
+        stack = list(starts)
+        while stack:
+            for neighbor in adjacency[stack.pop()]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return seen
 
     def mark_invalid(self, node_id: str) -> None:
         """
@@ -255,6 +452,7 @@ class ModelGraph:
         if node_id in self.nodes:
             self.nodes[node_id].is_valid = False
             self.valid_nodes.discard(node_id)
+            self.invalid_nodes.add(node_id)
 
     def mark_valid(self, node_id: str, timestamp: Optional[float] = None) -> None:
         """
@@ -268,17 +466,23 @@ class ModelGraph:
             self.nodes[node_id].is_valid = True
             self.nodes[node_id].last_built = timestamp or time.time()
             self.valid_nodes.add(node_id)
+            self.invalid_nodes.discard(node_id)
 
     def get_invalid_nodes(self) -> Set[str]:
-        """Get all nodes marked as invalid"""
-        return {nid for nid, node in self.nodes.items() if not node.is_valid}
+        """Get all nodes marked as invalid (via add_node/mark_invalid)"""
+        return self.invalid_nodes.copy()
+
+    def get_roots(self) -> Set[str]:
+        """Get all nodes with no dependencies"""
+        return self._roots.copy()
+
+    def get_leaves(self) -> Set[str]:
+        """Get all nodes with no dependents"""
+        return self._leaves.copy()
 
     def get_node_count_by_type(self) -> Dict[NodeType, int]:
         """Get count of nodes by type"""
-        counts = {node_type: 0 for node_type in NodeType}
-        for node in self.nodes.values():
-            counts[node.node_type] += 1
-        return counts
+        return dict(self._type_counts)
 
     def get_max_depth(self) -> int:
         """
@@ -290,11 +494,20 @@ class ModelGraph:
         if not self.nodes:
             return 0
 
-        try:
-            # Find longest path using DAG longest path algorithm
-            return nx.dag_longest_path_length(self.graph)
-        except Exception:
-            return 0
+        if self._depth_cache is None:
+            try:
+                order = self.topological_sort()
+            except nx.NetworkXUnfeasible:
+                return 0
+
+            # Longest path ending at each node, in one pass over the order
+            pred = self.graph._pred
+            depth: Dict[str, int] = {}
+            for node_id in order:
+                depth[node_id] = max((depth[p] + 1 for p in pred[node_id]), default=0)
+            self._depth_cache = max(depth.values())
+
+        return self._depth_cache
 
     def __len__(self) -> int:
         """Return number of nodes"""
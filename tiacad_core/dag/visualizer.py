@@ -24,15 +24,25 @@ class GraphVisualizer:
     - Text-based summaries
     """
 
-    # Color scheme for node types (Graphviz colors)
+    # Color scheme for node types (Graphviz colors); covers every NodeType so
+    # to_dot can index it directly
     NODE_COLORS = {
         NodeType.PARAMETER: 'lightblue',
         NodeType.PART: 'lightgreen',
         NodeType.OPERATION: 'lightyellow',
         NodeType.REFERENCE: 'lightpink',
         NodeType.SKETCH: 'lavender',
+        NodeType.CONSTRAINT: 'white',
     }
 
+    # DOT line templates, formatted once per node/edge while streaming
+    _DOT_NODE = '  "{}" [label="{}", fillcolor={}];\n'.format
+    _DOT_EDGE = '  "{}" -> "{}";\n'.format
+    _DOT_PATTERN_LABEL = '{}\\n[pattern]'.format
+
+    # Write buffer for DOT export; lines are streamed straight to the file
+    _DOT_BUFFER_SIZE = 1 << 16
+
     @staticmethod
     def to_dot(graph: ModelGraph,
                output_path: str,
@@ -55,54 +65,52 @@ class GraphVisualizer:
             >>> GraphVisualizer.to_dot(graph, "deps.dot")
             >>> # Then run: dot -Tpng deps.dot -o deps.png
         """
-        # Determine which nodes to include
-        nodes_to_include = set(graph.graph.nodes())
+        # Create subgraph if filtering
         if filter_types:
             nodes_to_include = {
-                nid for nid, node in graph.nodes.items()
+                nid: node for nid, node in graph.nodes.items()
                 if node.node_type in filter_types
             }
-
-        # Create subgraph if filtering
-        if filter_types:
             subgraph = graph.graph.subgraph(nodes_to_include)
         else:
+            nodes_to_include = graph.nodes
             subgraph = graph.graph
 
-        # Write DOT file
-        with open(output_path, 'w') as f:
+        colors = GraphVisualizer.NODE_COLORS
+        node_line = GraphVisualizer._DOT_NODE
+        edge_line = GraphVisualizer._DOT_EDGE
+        pattern_label = GraphVisualizer._DOT_PATTERN_LABEL
+
+        # Write DOT file, one line at a time
+        with open(output_path, 'w', buffering=GraphVisualizer._DOT_BUFFER_SIZE) as f:
             f.write('digraph TiaCADDependencies {\n')
             f.write('  rankdir=TB;\n')  # Top to bottom layout
             f.write('  node [shape=box, style=filled];\n')
             f.write('\n')
 
-            # Write nodes with visual attributes
-            for node_id in subgraph.nodes():
-                if node_id not in graph.nodes:
-                    continue
-
-                node = graph.nodes[node_id]
-
+            # Write nodes with visual attributes (graph.nodes and the NetworkX
+            # graph share insertion order)
+            for node_id, node in nodes_to_include.items():
                 # Determine fill color
                 if highlight_invalid and not node.is_valid:
                     fillcolor = 'lightcoral'
                 else:
-                    fillcolor = GraphVisualizer.NODE_COLORS.get(node.node_type, 'white')
+                    fillcolor = colors[node.node_type]
 
-                # Node label (show name only, not full ID)
-                label = node.name
-
-                # Add pattern indicator
+                # Node label (show name only, not full ID), with a pattern
+                # indicator for pattern operations
                 if node.is_pattern:
-                    label = f"{label}\\n[pattern]"
+                    label = pattern_label(node.name)
+                else:
+                    label = node.name
 
-                f.write(f'  "{node_id}" [label="{label}", fillcolor={fillcolor}];\n')
+                f.write(node_line(node_id, label, fillcolor))
 
             f.write('\n')
 
             # Write edges
             for src, dst in subgraph.edges():
-                f.write(f'  "{src}" -> "{dst}";\n')
+                f.write(edge_line(src, dst))
 
             f.write('}\n')
 
@@ -133,11 +141,12 @@ class GraphVisualizer:
         # Count nodes by type
         type_counts = graph.get_node_count_by_type()
 
-        # Calculate statistics
+        # Calculate statistics. Max depth comes from the cached topological
+        # order, and invalid nodes are counted without copying the set.
         total_nodes = len(graph)
         total_edges = graph.graph.number_of_edges()
         max_depth = graph.get_max_depth()
-        invalid_count = len(graph.get_invalid_nodes())
+        invalid_count = len(graph.invalid_nodes)
 
         # Print formatted output
         output.write("📊 Dependency Graph\n")
@@ -230,7 +239,7 @@ class GraphVisualizer:
         if output is None:
             output = sys.stdout
 
-        roots = [nid for nid in graph.nodes if not graph.get_dependencies(nid)]
+        roots = graph.get_roots()
 
         if not roots:
             output.write("No root nodes found\n")
@@ -255,7 +264,7 @@ class GraphVisualizer:
         if output is None:
             output = sys.stdout
 
-        leaves = [nid for nid in graph.nodes if not graph.get_dependents(nid)]
+        leaves = graph.get_leaves()
 
         if not leaves:
             output.write("No leaf nodes found\n")
@@ -24,7 +24,6 @@ Usage:
 """
 
 from .base import GeometryBackend
-from .cadquery_backend import CadQueryBackend
 from .mock_backend import MockBackend, MockGeometry
 
 __all__ = [
@@ -35,6 +34,15 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    """Lazily import CadQueryBackend, which pulls in CadQuery/OCP, on first use."""
+    if name == 'CadQueryBackend':
+        from .cadquery_backend import CadQueryBackend
+        return CadQueryBackend
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Default backend management
 _default_backend = None
 
@@ -53,6 +61,7 @@ def get_default_backend() -> GeometryBackend:
     """
     global _default_backend
     if _default_backend is None:
+        from .cadquery_backend import CadQueryBackend
         _default_backend = CadQueryBackend()
     return _default_backend
 
@@ -87,4 +96,5 @@ def reset_default_backend():
         >>> reset_default_backend()  # Back to CadQuery
     """
     global _default_backend
+    from .cadquery_backend import CadQueryBackend
     _default_backend = CadQueryBackend()
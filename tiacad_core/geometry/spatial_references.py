@@ -12,8 +12,8 @@ Philosophy: Everything is a SpatialRef. Positions, faces, edges, axes - all
 represented uniformly with position and optional orientation data.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Literal
+from dataclasses import dataclass, field
+from typing import Optional, Literal, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
@@ -64,6 +64,10 @@ class SpatialRef:
     orientation: Optional[NDArray[np.float64]] = None  # (3,) normal/direction vector
     tangent: Optional[NDArray[np.float64]] = None  # (3,) tangent vector (for edges)
     ref_type: Literal['point', 'face', 'edge', 'axis'] = 'point'
+    # (orientation, tangent, rotation) from the last rotation_matrix() call
+    _rotation_cache: Optional[Tuple[object, object, NDArray[np.float64]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate and normalize vector data."""
@@ -133,6 +137,27 @@ class SpatialRef:
         # Have both orientation and tangent - full frame definition
         return Frame.from_normal_tangent(self.position, self.orientation, self.tangent)
 
+    def rotation_matrix(self) -> NDArray[np.float64]:
+        """
+        3x3 rotation block of this reference's frame (columns are the frame axes).
+
+        The matrix is cached until orientation or tangent is reassigned, so
+        a reference that is resolved once and queried repeatedly builds its
+        frame only once. The returned array is read-only.
+
+        Returns:
+            (3, 3) rotation matrix
+        """
+        cached = self._rotation_cache
+        if (cached is not None and cached[0] is self.orientation
+                and cached[1] is self.tangent):
+            return cached[2]
+
+        rotation = self.frame.to_rotation_matrix()
+        rotation.flags.writeable = False
+        self._rotation_cache = (self.orientation, self.tangent, rotation)
+        return rotation
+
     def offset(self, delta: NDArray[np.float64], in_local_frame: bool = True) -> 'SpatialRef':
         """
         Create a new SpatialRef offset from this one.
@@ -373,6 +398,20 @@ class Frame:
         mat[:3, 3] = self.origin
         return mat
 
+    def to_rotation_matrix(self) -> NDArray[np.float64]:
+        """
+        Convert frame to its 3x3 rotation matrix (columns are the frame axes).
+
+        Same as ``to_transform_matrix()[:3, :3]`` without building the
+        translation column and homogeneous row.
+
+        Returns:
+            3x3 rotation matrix
+        """
+        return np.column_stack((self.x_axis, self.y_axis, self.z_axis)).astype(
+            np.float64, copy=False
+        )
+
     def transform_point(self, point: NDArray[np.float64], from_local: bool = True) -> NDArray[np.float64]:
         """
         Transform a point between local and world coordinates.
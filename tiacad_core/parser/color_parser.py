@@ -16,10 +16,25 @@ Design: Progressive disclosure
 - Advanced: full PBR appearance definition
 """
 
-import re
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from ..materials_library import get_material_library
-from .color_utils import hsl_to_rgb, rgb_to_hex, clamp
+from .color_utils import hsl_to_rgb, hsl_to_rgb_array
+
+
+# Deletes every hex digit, so str.translate() leaves only invalid characters
+_HEX_DIGITS_DELETE = str.maketrans('', '', '0123456789abcdefABCDEF')
+
+# Marks a palette miss (palette values may legitimately be falsy/None)
+_NOT_IN_PALETTE = object()
+
+# Keys that identify HSL / RGB color objects
+_HSL_KEYS = frozenset('hsl')
+_RGB_KEYS = frozenset('rgb')
 
 
 class ColorParseError(Exception):
@@ -31,8 +46,22 @@ class ColorParseError(Exception):
         super().__init__(message)
 
 
+def _clamp_unit(value: float) -> float:
+    """clamp(value) to 0-1 without the generic min/max calls"""
+    if 0.0 < value < 1.0:
+        return value
+    return 0.0 if value <= 0.0 else 1.0
+
+
 class Color:
-    """Parsed color with RGBA values (0-1 range)"""
+    """Parsed color with RGBA values (0-1 range)
+
+    Immutable: ColorParser hands out shared instances (named and HSL colors,
+    cached string parses), so attributes can't be reassigned. Build a new
+    Color instead, e.g. Color(*c.to_rgb(), a=0.5).
+    """
+
+    __slots__ = ('r', 'g', 'b', 'a')
 
     def __init__(self, r: float, g: float, b: float, a: float = 1.0):
         """
@@ -42,10 +71,21 @@ class Color:
             b: Blue (0-1)
             a: Alpha/opacity (0-1), default 1.0
         """
-        self.r = clamp(r)
-        self.g = clamp(g)
-        self.b = clamp(b)
-        self.a = clamp(a)
+        set_slot = object.__setattr__
+        set_slot(self, 'r', _clamp_unit(r))
+        set_slot(self, 'g', _clamp_unit(g))
+        set_slot(self, 'b', _clamp_unit(b))
+        set_slot(self, 'a', _clamp_unit(a))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Color is immutable; cannot set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Color is immutable; cannot delete '{name}'")
+
+    def __reduce__(self):
+        # copy/pickle would otherwise restore the slots through __setattr__
+        return (Color, self.to_rgba())
 
     def to_rgb(self) -> Tuple[float, float, float]:
         """Return RGB tuple (0-1 range)"""
@@ -57,7 +97,12 @@ class Color:
 
     def to_hex(self) -> str:
         """Return hex string #RRGGBB"""
-        return rgb_to_hex(self.r, self.g, self.b)
+        # Same rounding as rgb_to_hex(); channels are clamped to 0-1, so each
+        # fits in a byte and bytes.hex() encodes all three in one call
+        channels = bytes((int(self.r * 255 + 0.5),
+                          int(self.g * 255 + 0.5),
+                          int(self.b * 255 + 0.5)))
+        return '#' + channels.hex().upper()
 
     def __repr__(self):
         if self.a < 1.0:
@@ -98,6 +143,23 @@ BASIC_COLORS = {
     'maroon': (0.5, 0.0, 0.0),
 }
 
+# BASIC_COLORS as ready-made Color objects, built once at import so named
+# lookups return a shared instance instead of constructing one per parse
+_BASIC_COLOR_OBJECTS = MappingProxyType({
+    name: Color(r, g, b) for name, (r, g, b) in BASIC_COLORS.items()
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _hsl_color(h: float, s: float, lightness: float, a: float) -> Color:
+    """Color for validated HSL values (h 0-360, s/l 0-100, a 0-1), memoized"""
+    r, g, b = hsl_to_rgb(h / 360, s / 100, lightness / 100)
+    return Color(r, g, b, a)
+
+
+# Most distinct string values a ColorParser memoizes
+_STRING_CACHE_SIZE = 512
+
 
 class ColorParser:
     """
@@ -120,6 +182,16 @@ class ColorParser:
         self.palette = palette or {}
         self.material_library = get_material_library()
 
+        # String values resolve purely against the palette and material
+        # library, so their results are memoized per parser in a plain dict
+        # (oldest entry evicted past _STRING_CACHE_SIZE). Call clear_cache()
+        # after changing either.
+        self._string_cache: Dict[str, Color] = {}
+
+    def clear_cache(self) -> None:
+        """Drop memoized string parse results (e.g. after editing the palette)"""
+        self._string_cache.clear()
+
     def parse(self, value: Any) -> Color:
         """
         Auto-detect format and parse color value.
@@ -128,16 +200,22 @@ class ColorParser:
             value: Color value in any supported format
 
         Returns:
-            Color object with RGBA values
+            Color object with RGBA values. Results for string values are
+            cached and shared between calls (Color is immutable).
 
         Raises:
             ColorParseError: If format is invalid
         """
+        parse_value = self._PARSERS_BY_TYPE.get(type(value))
+        if parse_value is not None:
+            return parse_value(self, value)
+
         if value is None:
             raise ColorParseError("Color value cannot be None")
 
+        # Subclasses of the supported types
         if isinstance(value, str):
-            return self._parse_string(value)
+            return self._parse_string_cached(value)
         elif isinstance(value, list):
             return self._parse_array(value)
         elif isinstance(value, dict):
@@ -149,6 +227,73 @@ class ColorParser:
                 value=value
             )
 
+    def parse_many(self, values: Sequence[Any]) -> np.ndarray:
+        """
+        Parse a batch of color values into an array.
+
+        #RRGGBB/#RRGGBBAA strings are decoded together in one vectorized
+        step, and HSL objects are converted together with
+        hsl_to_rgb_array(); every other value goes through parse().
+
+        Args:
+            values: Color values in any supported format
+
+        Returns:
+            (N, 4) float array of RGBA values (0-1 range), one row per value
+
+        Raises:
+            ColorParseError: If any value is invalid
+        """
+        rgba = np.empty((len(values), 4))
+        hex_rows = []
+        hex_bytes = []
+        hsl_rows = []
+        hsl_values = []
+
+        for i, value in enumerate(values):
+            if isinstance(value, str):
+                s = value.strip()
+                if len(s) in (7, 9) and s[0] == '#':
+                    try:
+                        channels = bytes.fromhex(s[1:])
+                    except ValueError:
+                        channels = b''
+                    # Anything else (bad digits, embedded whitespace) is left
+                    # to parse() to report
+                    if len(channels) * 2 == len(s) - 1:
+                        hex_rows.append(i)
+                        hex_bytes.append(channels if len(channels) == 4 else channels + b'\xff')
+                        continue
+            elif type(value) is dict and value.keys() >= _HSL_KEYS:
+                hsl_rows.append(i)
+                hsl_values.append(self._validated_hsl(value))
+                continue
+            rgba[i] = self.parse(value).to_rgba()
+
+        if hex_rows:
+            channels = np.frombuffer(b''.join(hex_bytes), dtype=np.uint8).reshape(-1, 4)
+            rgba[hex_rows] = channels / 255
+
+        if hsl_rows:
+            h, s, lightness, a = np.array(hsl_values, dtype=float).T
+            rgb = hsl_to_rgb_array(h / 360, s / 100, lightness / 100)
+            # Same 0-1 clamp Color applies
+            rgba[hsl_rows, :3] = np.clip(rgb, 0.0, 1.0)
+            rgba[hsl_rows, 3] = a
+
+        return rgba
+
+    def _parse_string_cached(self, s: str) -> Color:
+        """_parse_string() memoized in this parser's string cache"""
+        cache = self._string_cache
+        color = cache.get(s)
+        if color is None:
+            color = self._parse_string(s)
+            if len(cache) >= _STRING_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[s] = color
+        return color
+
     def _parse_string(self, s: str) -> Color:
         """Parse string: named color or hex"""
         s = s.strip()
@@ -174,37 +319,28 @@ class ColorParser:
 
         hex_digits = hex_str[1:]
 
-        # Validate hex characters
-        if not re.match(r'^[0-9A-Fa-f]+$', hex_digits):
-            raise ColorParseError(
-                f"Invalid hex color: {hex_str}. Must contain only 0-9, A-F.",
-                value=hex_str
-            )
-
-        # Parse based on length
+        # #RGB -> #RRGGBB
         if len(hex_digits) == 3:
-            # #RGB -> #RRGGBB
-            r = int(hex_digits[0] * 2, 16) / 255
-            g = int(hex_digits[1] * 2, 16) / 255
-            b = int(hex_digits[2] * 2, 16) / 255
-            return Color(r, g, b)
-
-        elif len(hex_digits) == 6:
-            # #RRGGBB
-            r = int(hex_digits[0:2], 16) / 255
-            g = int(hex_digits[2:4], 16) / 255
-            b = int(hex_digits[4:6], 16) / 255
-            return Color(r, g, b)
-
-        elif len(hex_digits) == 8:
-            # #RRGGBBAA
-            r = int(hex_digits[0:2], 16) / 255
-            g = int(hex_digits[2:4], 16) / 255
-            b = int(hex_digits[4:6], 16) / 255
-            a = int(hex_digits[6:8], 16) / 255
-            return Color(r, g, b, a)
-
+            expanded = ''.join(c * 2 for c in hex_digits)
         else:
+            expanded = hex_digits
+
+        # Fast path: decode all channels in one call. fromhex() skips ASCII
+        # whitespace, so the byte count also has to match the digit count
+        channels = None
+        if len(expanded) in (6, 8):
+            try:
+                channels = bytes.fromhex(expanded)
+            except ValueError:
+                pass
+
+        if channels is None or len(channels) * 2 != len(expanded):
+            # Error path: report bad characters before a bad length
+            if not hex_digits or hex_digits.translate(_HEX_DIGITS_DELETE):
+                raise ColorParseError(
+                    f"Invalid hex color: {hex_str}. Must contain only 0-9, A-F.",
+                    value=hex_str
+                )
             raise ColorParseError(
                 f"Invalid hex color length: {hex_str}. "
                 f"Expected 3, 6, or 8 hex digits (got {len(hex_digits)}).",
@@ -212,6 +348,14 @@ class ColorParser:
                 suggestions=["#RGB", "#RRGGBB", "#RRGGBBAA"]
             )
 
+        # #RRGGBB or #RRGGBBAA
+        if len(channels) == 4:
+            r, g, b, a = channels
+            return Color(r / 255, g / 255, b / 255, a / 255)
+
+        r, g, b = channels
+        return Color(r / 255, g / 255, b / 255)
+
     def _parse_named(self, name: str) -> Color:
         """
         Parse named color: basic color, material name, or palette reference
@@ -221,18 +365,23 @@ class ColorParser:
         2. Basic colors (red, blue, etc.)
         3. Material library (aluminum, steel, etc.)
         """
-        name = name.strip().lower()
-
-        # 1. Check palette first (user-defined colors take precedence)
-        if name in self.palette:
-            # Recursively parse palette value (could be hex, RGB, etc.)
-            palette_value = self.palette[name]
-            return self.parse(palette_value)
+        # Called with the already-stripped string from _parse_string; skip
+        # the lower() copy for names that are already lowercase
+        if not name.islower():
+            name = name.lower()
+
+        # 1. Check palette first (user-defined colors take precedence), with
+        # a single lookup and none at all without a palette
+        if self.palette:
+            palette_value = self.palette.get(name, _NOT_IN_PALETTE)
+            if palette_value is not _NOT_IN_PALETTE:
+                # Recursively parse palette value (could be hex, RGB, etc.)
+                return self.parse(palette_value)
 
         # 2. Check basic colors
-        if name in BASIC_COLORS:
-            r, g, b = BASIC_COLORS[name]
-            return Color(r, g, b)
+        color = _BASIC_COLOR_OBJECTS.get(name)
+        if color is not None:
+            return color
 
         # 3. Check material library
         try:
@@ -285,12 +434,12 @@ class ColorParser:
         RGB: {r: 255, g: 0, b: 0, a: 128}
         HSL: {h: 0, s: 100, l: 50, a: 0.5}
         """
-        # Check if HSL (has 'h' key)
-        if 'h' in obj:
+        # One subset test per format against the dict's key view
+        keys = obj.keys()
+        if keys >= _HSL_KEYS:
             return self._parse_hsl(obj)
 
-        # Otherwise assume RGB
-        elif 'r' in obj and 'g' in obj and 'b' in obj:
+        elif keys >= _RGB_KEYS:
             return self._parse_rgb_object(obj)
 
         else:
@@ -322,6 +471,11 @@ class ColorParser:
         lightness: 0-100 (lightness %)
         a: 0-1 (alpha, optional)
         """
+        # Convert HSL to RGB; palettes tend to repeat the same values
+        return _hsl_color(*self._validated_hsl(obj))
+
+    def _validated_hsl(self, obj: Dict[str, Any]) -> Tuple[float, float, float, float]:
+        """Return (h, s, lightness, a) from an HSL object after range checks"""
         h = obj['h']
         s = obj['s']
         lightness = obj['l']
@@ -337,9 +491,7 @@ class ColorParser:
         if not (0 <= a <= 1):
             raise ColorParseError(f"HSL alpha must be 0-1: {a}", value=obj)
 
-        # Convert HSL to RGB (normalize to 0-1 range)
-        r, g, b = hsl_to_rgb(h / 360, s / 100, lightness / 100)
-        return Color(r, g, b, a)
+        return h, s, lightness, a
 
     def _validate_range(self, *values, value_range: Tuple[float, float]):
         """Validate that all values are in range"""
@@ -375,3 +527,12 @@ class ColorParser:
                 suggestions.append(f"{palette_name} (from palette)")
 
         return suggestions[:5]  # Limit to 5 suggestions
+
+    # Parser per exact value type, so parse() resolves the common YAML types
+    # with one dict lookup. Plain functions rather than bound methods, so a
+    # parser holds no reference cycle back to itself.
+    _PARSERS_BY_TYPE = {
+        str: _parse_string_cached,
+        list: _parse_array,
+        dict: _parse_object,
+    }
@@ -7,6 +7,8 @@ and manipulations.
 
 from typing import Tuple
 
+import numpy as np
+
 
 def hsl_to_rgb(h: float, s: float, lightness: float) -> Tuple[float, float, float]:
     """
@@ -65,6 +67,46 @@ def hsl_to_rgb(h: float, s: float, lightness: float) -> Tuple[float, float, floa
     return (r, g, b)
 
 
+# Hue offsets of the r, g, b channels in hsl_to_rgb
+_HUE_OFFSETS = np.array([1/3, 0.0, -1/3])
+
+
+def hsl_to_rgb_array(h: np.ndarray, s: np.ndarray, lightness: np.ndarray) -> np.ndarray:
+    """
+    Vectorized hsl_to_rgb over arrays of N colors (all 0-1 range)
+
+    Evaluates the same CSS Color Module Level 3 formula for every color at
+    once; achromatic colors (s == 0) fall out of it as (l, l, l).
+
+    Args:
+        h: Hues, shape (N,)
+        s: Saturations, shape (N,)
+        lightness: Lightnesses, shape (N,)
+
+    Returns:
+        (N, 3) array of RGB values in 0-1 range
+
+    Examples:
+        >>> hsl_to_rgb_array(np.array([0.0]), np.array([1.0]), np.array([0.5]))
+        array([[1., 0., 0.]])
+    """
+    q = np.where(lightness < 0.5, lightness * (1 + s), lightness + s - lightness * s)
+    p = 2 * lightness - q
+    p = p[:, None]
+    q = q[:, None]
+
+    # Per-channel hue, wrapped into 0-1
+    t = h[:, None] + _HUE_OFFSETS
+    t = np.where(t < 0, t + 1, t)
+    t = np.where(t > 1, t - 1, t)
+
+    return np.select(
+        [t < 1/6, t < 1/2, t < 2/3],
+        [p + (q - p) * 6 * t, np.broadcast_to(q, t.shape), p + (q - p) * (2/3 - t) * 6],
+        default=np.broadcast_to(p, t.shape),
+    )
+
+
 def hex_to_rgb(hex_str: str) -> Tuple[float, float, float, float]:
     """
     Convert hex color string to RGBA tuple
@@ -146,9 +188,10 @@ def rgb_to_hex(r: float, g: float, b: float) -> str:
         >>> rgb_to_hex(0.5, 0.5, 0.5)
         '#808080'
     """
-    r_int = int(r * 255)
-    g_int = int(g * 255)
-    b_int = int(b * 255)
+    # Round to the nearest 0-255 step (truncating would turn 0.5 into 7F)
+    r_int = int(r * 255 + 0.5)
+    g_int = int(g * 255 + 0.5)
+    b_int = int(b * 255 + 0.5)
     return f"#{r_int:02X}{g_int:02X}{b_int:02X}"
 
 
@@ -188,8 +188,8 @@ class ExtrudeBuilder:
                 logger.warning(f"Extrude direction {direction} differs from sketch plane "
                                f"{sketch.plane} normal ({expected}). This may produce unexpected results.")
 
-            add_shapes = [s for s in sketch.shapes if s.operation == 'add']
-            subtract_shapes = [s for s in sketch.shapes if s.operation == 'subtract']
+            add_shapes = sketch.add_shapes
+            subtract_shapes = sketch.subtract_shapes
 
             geometry = self._build_shape_solid(
                 add_shapes[0], self._make_sketch_workplane(sketch.plane, sketch.origin), distance, taper
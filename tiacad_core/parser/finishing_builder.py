@@ -14,14 +14,21 @@ Version: 0.1.0-alpha (Phase 2)
 """
 
 import logging
+import numbers
 from typing import Dict, Any, List, Union, Optional
 
+import numpy as np
+
 from ..part import Part, PartRegistry
 from ..utils.exceptions import TiaCADError
 from .parameter_resolver import ParameterResolver
 
 logger = logging.getLogger(__name__)
 
+# Rows are the unit vectors for _AXIS_NAMES, in the same order
+_AXIS_NAMES = ('X', 'Y', 'Z')
+_CANONICAL_AXES = np.eye(3)
+
 
 class FinishingBuilderError(TiaCADError):
     """Error during finishing operations"""
@@ -404,19 +411,20 @@ class FinishingBuilder:
                     operation_name=operation_name
                 )
 
-            # Map standard unit vectors to axis strings
-            if axis == [1, 0, 0] or axis == [1.0, 0.0, 0.0]:
-                return 'X'
-            elif axis == [0, 1, 0] or axis == [0.0, 1.0, 0.0]:
-                return 'Y'
-            elif axis == [0, 0, 1] or axis == [0.0, 0.0, 1.0]:
-                return 'Z'
-            else:
-                raise FinishingBuilderError(
-                    f"Unsupported axis vector {axis} in operation '{operation_name}'. "
-                    f"Only standard unit vectors supported: [1,0,0], [0,1,0], [0,0,1]",
-                    operation_name=operation_name
-                )
+            # Map standard unit vectors (within float tolerance) to axis strings:
+            # the dominant component picks the candidate axis, one allclose confirms it.
+            # Components must already be numbers; np.asarray would coerce '1' to 1.0.
+            if all(isinstance(c, numbers.Real) for c in axis):
+                vector = np.asarray(axis, dtype=np.float64)
+                idx = int(np.argmax(np.abs(vector)))
+                if np.allclose(vector, _CANONICAL_AXES[idx]):
+                    return _AXIS_NAMES[idx]
+
+            raise FinishingBuilderError(
+                f"Unsupported axis vector {axis} in operation '{operation_name}'. "
+                f"Only standard unit vectors supported: [1,0,0], [0,1,0], [0,0,1]",
+                operation_name=operation_name
+            )
 
         raise FinishingBuilderError(
             f"Invalid axis type in operation '{operation_name}'. "
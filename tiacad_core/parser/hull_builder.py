@@ -15,6 +15,7 @@ import io
 import logging
 import os
 import tempfile
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import cadquery as cq
 import numpy as np
@@ -37,6 +38,24 @@ class HullBuilderError(TiaCADError):
         self.operation_name = operation_name
 
 
+@lru_cache(maxsize=128)
+def _tessellated_vertices(shape: cq.Shape) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Tessellated (x, y, z) vertices of a CadQuery shape.
+
+    Shapes hash and compare by OCCT identity (same TShape and location),
+    so the same source part hulled by several operations is tessellated
+    only once. Holding the key keeps the shape alive while it is cached.
+    """
+    vertices_tuple, _ = shape.tessellate(0.1)
+    return tuple((v.x, v.y, v.z) for v in vertices_tuple)
+
+
+def clear_hull_cache() -> None:
+    """Drop memoized hull source tessellations and the shapes they keep alive."""
+    _tessellated_vertices.cache_clear()
+
+
 class HullBuilder:
     """
     Executes convex hull operations on Part objects.
@@ -44,6 +63,10 @@ class HullBuilder:
     Creates convex hull around multiple parts, producing a shrink-wrapped
     geometry that encloses all inputs.
 
+    Source tessellations are memoized process-wide, which keeps up to 128
+    source shapes (OCCT solids) alive; long-running callers can release them
+    with clear_hull_cache().
+
     Usage:
         builder = HullBuilder(part_registry, parameter_resolver)
         builder.execute_hull_operation('hull_enclosure', {
@@ -187,9 +210,7 @@ class HullBuilder:
             HullBuilderError: If vertex extraction fails
         """
         try:
-            solid = geometry.val()
-            vertices_tuple, _ = solid.tessellate(0.1)
-            vertices = [(v.x, v.y, v.z) for v in vertices_tuple]
+            vertices = list(_tessellated_vertices(geometry.val()))
 
             if not vertices:
                 raise HullBuilderError("No vertices found in geometry")
@@ -170,12 +170,12 @@ class LoftBuilder:
             base_offset = 0.0
 
             for i, profile in enumerate(profiles):
-                subtract_shapes = [s for s in profile.shapes if s.operation == 'subtract']
+                subtract_shapes = profile.subtract_shapes
                 if subtract_shapes:
                     logger.warning(f"Loft does not support subtract operations in profile '{profile.name}'. "
                                    f"Subtract shapes will be ignored.")
 
-                add_shapes = [s for s in profile.shapes if s.operation == 'add']
+                add_shapes = profile.add_shapes
                 if not add_shapes:
                     raise LoftBuilderError(f"Profile '{profile.name}' has no additive shapes",
                                            operation_name=context)
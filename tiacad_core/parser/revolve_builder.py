@@ -221,8 +221,8 @@ class RevolveBuilder:
             RevolveBuilderError: If revolution fails
         """
         try:
-            add_shapes = [s for s in sketch.shapes if s.operation == 'add']
-            subtract_shapes = [s for s in sketch.shapes if s.operation == 'subtract']
+            add_shapes = sketch.add_shapes
+            subtract_shapes = sketch.subtract_shapes
             ax, ay, az = _AXIS_VECTORS[axis]
             ox, oy, oz = origin
             axis_start = cq.Vector(ox, oy, oz)
@@ -119,7 +119,7 @@ class SketchBuilder:
         shapes_spec = resolved_spec.get('shapes', [])
 
         # Validate plane
-        if not isinstance(plane, str) or plane.upper() not in ['XY', 'XZ', 'YZ']:
+        if not isinstance(plane, str) or plane.upper() not in Sketch2D.VALID_PLANES:
             line, col = self._get_line_info(['sketches', name, 'plane'])
             raise SketchBuilderError(
                 f"Invalid plane '{plane}' for sketch '{name}'. "
@@ -239,8 +239,8 @@ class SweepBuilder:
                     operation_name=context
                 )
 
-            add_shapes = [s for s in profile_sketch.shapes if s.operation == 'add']
-            subtract_shapes = [s for s in profile_sketch.shapes if s.operation == 'subtract']
+            add_shapes = profile_sketch.add_shapes
+            subtract_shapes = profile_sketch.subtract_shapes
 
             path_wire = Wire.makePolygon([cq.Vector(*pt) for pt in path_points])
 
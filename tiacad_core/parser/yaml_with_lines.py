@@ -53,7 +53,12 @@ class LineTracker:
         return self.line_map.get(path_str)
 
 
-class LinePreservingLoader(yaml.SafeLoader):
+# LibYAML's C parser when PyYAML was built with it (same safe constructors,
+# much faster scanning); the pure-Python SafeLoader otherwise
+_SafeLoaderBase = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class LinePreservingLoader(_SafeLoaderBase):
     """
     YAML loader that preserves line and column information.
 
@@ -63,6 +63,10 @@ class Part:
     current_position: Optional[Tuple[float, float, float]] = None
     current_orientation: Optional[np.ndarray] = None
     backend: Optional['GeometryBackend'] = None
+    # (geometry, backend, bounds) from the last get_bounds() call
+    _bounds_cache: Optional[Tuple[Any, Any, Dict[str, Tuple[float, float, float]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize current_position to geometry center if not set"""
@@ -117,12 +121,21 @@ class Part:
         Note:
             If backend is provided, uses backend.get_bounding_box().
             Otherwise falls back to utils function for backward compatibility.
+            The result is cached until geometry or backend is reassigned, so
+            repeated measurements don't re-traverse the BRep. Geometry is
+            treated as immutable; transforms always produce a new object.
         """
+        cached = self._bounds_cache
+        if cached is not None and cached[0] is self.geometry and cached[1] is self.backend:
+            return dict(cached[2])
+
         if self.backend is not None:
-            return self.backend.get_bounding_box(self.geometry)
+            bounds = self.backend.get_bounding_box(self.geometry)
         else:
             # Backward compatibility: use utils function
-            return utils_get_bounding_box(self.geometry)
+            bounds = utils_get_bounding_box(self.geometry)
+        self._bounds_cache = (self.geometry, self.backend, bounds)
+        return dict(bounds)
 
     def get_center(self) -> Tuple[float, float, float]:
         """Get current geometric center
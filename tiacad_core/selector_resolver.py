@@ -15,8 +15,9 @@ Examples:
     "not <Z" → all faces except bottom
 """
 
-from typing import List, Any
+from typing import List, Any, NamedTuple, Tuple
 from enum import Enum
+from functools import lru_cache
 import re
 
 
@@ -27,6 +28,12 @@ class FeatureType(Enum):
     VERTEX = "vertex"
 
 
+class ParsedSelector(NamedTuple):
+    """Immutable result of parse_selector()"""
+    type: str
+    parts: Tuple[str, ...]
+
+
 class SelectorResolver:
     """Resolves YAML selectors to geometric features
 
@@ -82,16 +89,42 @@ class SelectorResolver:
 
     def _has_and(self, selector: str) -> bool:
         """Check if selector contains 'and' combinator"""
-        return bool(self.AND_COMBINATOR.search(selector))
+        # Plain substring check covers the common single-space spelling
+        # without touching the regex engine.
+        return ' and ' in selector or bool(self.AND_COMBINATOR.search(selector))
 
     def _has_or(self, selector: str) -> bool:
         """Check if selector contains 'or' combinator"""
-        return bool(self.OR_COMBINATOR.search(selector))
+        return ' or ' in selector or bool(self.OR_COMBINATOR.search(selector))
 
     def _has_not(self, selector: str) -> bool:
         """Check if selector starts with 'not'"""
         return bool(self.NOT_COMBINATOR.match(selector))
 
+    @staticmethod
+    def _split_combinator(selector: str, token: str, pattern: re.Pattern):
+        """Split selector on a binary combinator
+
+        Uses str.partition for the usual space-separated spelling and only
+        falls back to the regex when the operator is surrounded by other
+        whitespace (tabs, newlines). Either way, a second operator on either
+        side (with any whitespace around it) rejects the selector.
+
+        Returns:
+            (left, right) tuple, or None if the selector does not contain
+            exactly one operator
+        """
+        left, sep, right = selector.partition(token)
+        if sep:
+            if pattern.search(left) or pattern.search(right):
+                return None
+            return left, right
+
+        parts = pattern.split(selector)
+        if len(parts) != 2:
+            return None
+        return parts[0], parts[1]
+
     def _resolve_simple(self,
                         selector: str,
                         feature_type: FeatureType) -> List[Any]:
@@ -141,8 +174,8 @@ class SelectorResolver:
         Returns:
             List of features matching ALL selectors
         """
-        parts = self.AND_COMBINATOR.split(selector)
-        if len(parts) != 2:
+        parts = self._split_combinator(selector, ' and ', self.AND_COMBINATOR)
+        if parts is None:
             raise ValueError(
                 f"Invalid 'and' expression: '{selector}'. "
                 f"Expected exactly one 'and' operator."
@@ -169,8 +202,8 @@ class SelectorResolver:
         Returns:
             List of features matching ANY selector
         """
-        parts = self.OR_COMBINATOR.split(selector)
-        if len(parts) != 2:
+        parts = self._split_combinator(selector, ' or ', self.OR_COMBINATOR)
+        if parts is None:
             raise ValueError(
                 f"Invalid 'or' expression: '{selector}'. "
                 f"Expected exactly one 'or' operator."
@@ -215,40 +248,42 @@ class SelectorResolver:
         return list(all_features - matching_features)
 
 
-def parse_selector(selector_string: str) -> dict:
+@lru_cache(maxsize=1024)
+def parse_selector(selector_string: str) -> ParsedSelector:
     """Parse a selector string into components
 
     This is a helper function for understanding selector structure
-    without needing geometry.
+    without needing geometry. Results are memoized, so the returned
+    ParsedSelector is immutable; use ``._asdict()`` for a plain dict.
 
     Args:
         selector_string: Selector string
 
     Returns:
-        Dictionary with:
+        ParsedSelector with:
             - type: 'simple', 'and', 'or', 'not'
-            - parts: List of component selectors
+            - parts: Tuple of component selectors
 
     Examples:
         parse_selector(">Z") →
-            {'type': 'simple', 'parts': ['>Z']}
+            ParsedSelector(type='simple', parts=('>Z',))
 
         parse_selector("|Z and >X") →
-            {'type': 'and', 'parts': ['|Z', '>X']}
+            ParsedSelector(type='and', parts=('|Z', '>X'))
     """
     selector = selector_string.strip()
 
-    if re.match(r'^not\s+', selector):
-        inner = re.sub(r'^not\s+', '', selector).strip()
-        return {'type': 'not', 'parts': [inner]}
+    if SelectorResolver.NOT_COMBINATOR.match(selector):
+        inner = SelectorResolver.NOT_COMBINATOR.sub('', selector).strip()
+        return ParsedSelector('not', (inner,))
 
     elif ' and ' in selector:
-        parts = [p.strip() for p in selector.split(' and ')]
-        return {'type': 'and', 'parts': parts}
+        parts = tuple(p.strip() for p in selector.split(' and '))
+        return ParsedSelector('and', parts)
 
     elif ' or ' in selector:
-        parts = [p.strip() for p in selector.split(' or ')]
-        return {'type': 'or', 'parts': parts}
+        parts = tuple(p.strip() for p in selector.split(' or '))
+        return ParsedSelector('or', parts)
 
     else:
-        return {'type': 'simple', 'parts': [selector]}
+        return ParsedSelector('simple', (selector,))
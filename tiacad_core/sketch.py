@@ -14,12 +14,20 @@ Author: TIA
 Version: 0.1.0-alpha (Phase 3)
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Tuple, Optional
-import cadquery as cq
+from enum import StrEnum
+from functools import lru_cache
+from typing import List, Tuple, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
 
 from .utils.exceptions import TiaCADError
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,15 +38,41 @@ class SketchError(TiaCADError):
         self.sketch_name = sketch_name
 
 
+class ShapeOperation(StrEnum):
+    """How a shape contributes to its sketch.
+
+    A str subclass, so existing ``shape.operation == 'add'`` comparisons keep
+    working; the sketch module itself compares members by identity.
+    """
+    ADD = 'add'
+    SUBTRACT = 'subtract'
+
+
+def _check_positive(shape: str, **values: float) -> None:
+    """Raise SketchError for the first non-positive dimension in values.
+
+    The message (e.g. "Rectangle width must be positive, got 0") is only
+    formatted when a check fails.
+    """
+    for name, value in values.items():
+        if value <= 0:
+            raise SketchError(f"{shape} {name} must be positive, got {value}")
+
+
 class Shape2D:
     """
     Base class for 2D shapes in a sketch.
 
     Attributes:
         shape_type: Type of shape (rectangle, circle, polygon)
-        operation: Operation mode ('add' or 'subtract')
+        operation: Operation mode (ShapeOperation.ADD or ShapeOperation.SUBTRACT)
     """
 
+    __slots__ = ('shape_type', 'operation')
+
+    shape_type: str
+    operation: ShapeOperation
+
     def __init__(self, shape_type: str, operation: str = 'add'):
         """
         Initialize 2D shape.
@@ -48,12 +82,13 @@ class Shape2D:
             operation: 'add' to add material, 'subtract' to remove (default: 'add')
         """
         self.shape_type = shape_type
-        self.operation = operation
 
-        if operation not in ['add', 'subtract']:
+        try:
+            self.operation = ShapeOperation(operation)
+        except ValueError:
             raise SketchError(
                 f"Invalid operation '{operation}'. Must be 'add' or 'subtract'"
-            )
+            ) from None
 
     def build(self, workplane: cq.Workplane) -> cq.Workplane:
         """
@@ -85,6 +120,13 @@ class Rectangle2D(Shape2D):
         operation: 'add' or 'subtract'
     """
 
+    __slots__ = ('width', 'height', 'cx', 'cy')
+
+    width: float
+    height: float
+    cx: float
+    cy: float
+
     def __init__(self, width: float, height: float,
                  center: Tuple[float, float] = (0, 0),
                  operation: str = 'add'):
@@ -100,12 +142,18 @@ class Rectangle2D(Shape2D):
         super().__init__('rectangle', operation)
         self.width = width
         self.height = height
-        self.center = center
+        self.cx, self.cy = center
+
+        _check_positive("Rectangle", width=width, height=height)
 
-        if width <= 0:
-            raise SketchError(f"Rectangle width must be positive, got {width}")
-        if height <= 0:
-            raise SketchError(f"Rectangle height must be positive, got {height}")
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Center point [x, y] (stored as separate cx/cy scalars)"""
+        return (self.cx, self.cy)
+
+    @center.setter
+    def center(self, value: Tuple[float, float]):
+        self.cx, self.cy = value
 
     def build(self, workplane: cq.Workplane) -> cq.Workplane:
         """Build rectangle on workplane."""
@@ -114,15 +162,15 @@ class Rectangle2D(Shape2D):
 
         # CadQuery's rect() centers the rectangle at current position
         # So we need to move to the desired center first
-        if self.center != (0, 0):
-            wp = wp.center(self.center[0], self.center[1])
+        if self.cx or self.cy:
+            wp = wp.center(self.cx, self.cy)
 
         # Create rectangle
         wp = wp.rect(self.width, self.height)
 
         logger.debug(
-            f"Built rectangle {self.width}x{self.height} at {self.center}, "
-            f"operation={self.operation}"
+            "Built rectangle %sx%s at (%s, %s), operation=%s",
+            self.width, self.height, self.cx, self.cy, self.operation
         )
 
         return wp
@@ -144,6 +192,12 @@ class Circle2D(Shape2D):
         operation: 'add' or 'subtract'
     """
 
+    __slots__ = ('radius', 'cx', 'cy')
+
+    radius: float
+    cx: float
+    cy: float
+
     def __init__(self, radius: float,
                  center: Tuple[float, float] = (0, 0),
                  operation: str = 'add'):
@@ -157,25 +211,33 @@ class Circle2D(Shape2D):
         """
         super().__init__('circle', operation)
         self.radius = radius
-        self.center = center
+        self.cx, self.cy = center
 
-        if radius <= 0:
-            raise SketchError(f"Circle radius must be positive, got {radius}")
+        _check_positive("Circle", radius=radius)
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Center point [x, y] (stored as separate cx/cy scalars)"""
+        return (self.cx, self.cy)
+
+    @center.setter
+    def center(self, value: Tuple[float, float]):
+        self.cx, self.cy = value
 
     def build(self, workplane: cq.Workplane) -> cq.Workplane:
         """Build circle on workplane."""
         # Move to center point
         wp = workplane.workplane(offset=0)
 
-        if self.center != (0, 0):
-            wp = wp.center(self.center[0], self.center[1])
+        if self.cx or self.cy:
+            wp = wp.center(self.cx, self.cy)
 
         # Create circle
         wp = wp.circle(self.radius)
 
         logger.debug(
-            f"Built circle radius={self.radius} at {self.center}, "
-            f"operation={self.operation}"
+            "Built circle radius=%s at (%s, %s), operation=%s",
+            self.radius, self.cx, self.cy, self.operation
         )
 
         return wp
@@ -193,10 +255,16 @@ class Polygon2D(Shape2D):
 
     Attributes:
         points: List of [x, y] points defining polygon
+        points_arr: Points as a contiguous (N, 2) float64 array
         closed: Whether to close the polygon (default: True)
         operation: 'add' or 'subtract'
     """
 
+    __slots__ = ('_points', 'points_arr', 'closed')
+
+    points_arr: np.ndarray
+    closed: bool
+
     def __init__(self, points: List[Tuple[float, float]],
                  closed: bool = True,
                  operation: str = 'add'):
@@ -212,25 +280,46 @@ class Polygon2D(Shape2D):
         self.points = points
         self.closed = closed
 
+    @property
+    def points(self) -> List[Tuple[float, float]]:
+        """Polygon points as given (assign a new list to change them)"""
+        return self._points
+
+    @points.setter
+    def points(self, points: List[Tuple[float, float]]):
         if len(points) < 3:
             raise SketchError(
                 f"Polygon must have at least 3 points, got {len(points)}"
             )
 
+        # Convert once up front so malformed points fail here rather than
+        # deep inside CadQuery, and build() can hand the array straight over.
+        try:
+            points_arr = np.ascontiguousarray(points, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise SketchError(f"Polygon points must be numeric [x, y] pairs: {e}")
+        if points_arr.ndim != 2 or points_arr.shape[1] != 2:
+            raise SketchError(
+                f"Polygon points must be [x, y] pairs, got array of shape "
+                f"{points_arr.shape}"
+            )
+        self._points = points
+        self.points_arr = points_arr
+
     def build(self, workplane: cq.Workplane) -> cq.Workplane:
         """Build polygon on workplane."""
         wp = workplane.workplane(offset=0)
 
         # Create polyline
-        wp = wp.polyline(self.points)
+        wp = wp.polyline(self.points_arr)
 
         # Close if needed
         if self.closed:
             wp = wp.close()
 
         logger.debug(
-            f"Built polygon with {len(self.points)} points, "
-            f"closed={self.closed}, operation={self.operation}"
+            "Built polygon with %d points, closed=%s, operation=%s",
+            len(self.points), self.closed, self.operation
         )
 
         return wp
@@ -242,6 +331,34 @@ class Polygon2D(Shape2D):
         )
 
 
+@lru_cache(maxsize=256)
+def _text_solid(text: str, size: float, distance: float, font: str,
+                font_path: Optional[str], kind: str, halign: str, valign: str):
+    """
+    Build extruded text on the global XY plane at the origin.
+
+    Glyph outline generation and the prism are the expensive part of
+    CadQuery's Workplane.text(); memoizing them lets repeated labels
+    (part numbers, version strings) be placed by a transform instead.
+
+    The cache lives for the whole process and is keyed on font_path, not on
+    the font file's contents: call clear_text_cache() after replacing a font
+    file on disk.
+    """
+    import cadquery as cq
+
+    return cq.Compound.makeText(
+        text, size, distance,
+        font=font, fontPath=font_path, kind=kind,
+        halign=halign, valign=valign, position=cq.Plane.XY(),
+    )
+
+
+def clear_text_cache() -> None:
+    """Drop all memoized text solids (e.g. after a font file changed)."""
+    _text_solid.cache_clear()
+
+
 class Text2D(Shape2D):
     """
     2D Text shape for sketches.
@@ -262,9 +379,37 @@ class Text2D(Shape2D):
         operation: 'add' or 'subtract'
     """
 
-    VALID_STYLES = ['regular', 'bold', 'italic', 'bold-italic']
-    VALID_HALIGN = ['left', 'center', 'right']
-    VALID_VALIGN = ['top', 'center', 'baseline', 'bottom']
+    __slots__ = (
+        'text', 'size', 'font', 'font_path', 'style', 'halign', 'valign',
+        'px', 'py', 'spacing',
+    )
+
+    text: str
+    size: float
+    font: str
+    font_path: Optional[str]
+    style: str
+    halign: str
+    valign: str
+    px: float
+    py: float
+    spacing: float
+
+    VALID_STYLES = ('regular', 'bold', 'italic', 'bold-italic')
+    VALID_HALIGN = ('left', 'center', 'right')
+    VALID_VALIGN = ('top', 'center', 'baseline', 'bottom')
+
+    # O(1) lookups for validation; the tuples above keep a stable order for
+    # error messages. CadQuery's text() only knows 'regular', 'bold' and
+    # 'italic', so bold-italic maps to bold.
+    _STYLE_TO_CQ_KIND = {
+        'regular': 'regular',
+        'bold': 'bold',
+        'italic': 'italic',
+        'bold-italic': 'bold',
+    }
+    _HALIGN_SET = frozenset(VALID_HALIGN)
+    _VALIGN_SET = frozenset(VALID_VALIGN)
 
     def __init__(self,
                  text: str,
@@ -301,21 +446,22 @@ class Text2D(Shape2D):
         if not text or not text.strip():
             raise SketchError("Text cannot be empty")
 
-        # Validate Unicode
-        try:
-            text.encode('utf-8')
-        except UnicodeEncodeError as e:
-            raise SketchError(f"Invalid Unicode in text: {e}")
+        # Validate Unicode (only non-ASCII text can hold unencodable
+        # lone surrogates)
+        if not text.isascii():
+            try:
+                text.encode('utf-8')
+            except UnicodeEncodeError as e:
+                raise SketchError(f"Invalid Unicode in text: {e}")
 
         self.text = text
 
         # Validate size
-        if size <= 0:
-            raise SketchError(f"Text size must be positive, got {size}")
+        _check_positive("Text", size=size)
         if size < 0.5:
             logger.warning(
-                f"Text size {size}mm is very small and may not render well. "
-                f"Consider using size >= 1mm"
+                "Text size %smm is very small and may not render well. "
+                "Consider using size >= 1mm", size
             )
         self.size = size
 
@@ -324,7 +470,7 @@ class Text2D(Shape2D):
         self.font_path = font_path
 
         # Validate style
-        if style not in self.VALID_STYLES:
+        if style not in self._STYLE_TO_CQ_KIND:
             raise SketchError(
                 f"Invalid text style '{style}'. "
                 f"Must be one of: {', '.join(self.VALID_STYLES)}"
@@ -332,12 +478,12 @@ class Text2D(Shape2D):
         self.style = style
 
         # Validate alignment
-        if halign not in self.VALID_HALIGN:
+        if halign not in self._HALIGN_SET:
             raise SketchError(
                 f"Invalid horizontal alignment '{halign}'. "
                 f"Must be one of: {', '.join(self.VALID_HALIGN)}"
             )
-        if valign not in self.VALID_VALIGN:
+        if valign not in self._VALIGN_SET:
             raise SketchError(
                 f"Invalid vertical alignment '{valign}'. "
                 f"Must be one of: {', '.join(self.VALID_VALIGN)}"
@@ -346,12 +492,20 @@ class Text2D(Shape2D):
         self.valign = valign
 
         # Position and spacing
-        self.position = position
+        self.px, self.py = position
 
-        if spacing <= 0:
-            raise SketchError(f"Text spacing must be positive, got {spacing}")
+        _check_positive("Text", spacing=spacing)
         self.spacing = spacing
 
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Position [x, y] (stored as separate px/py scalars)"""
+        return (self.px, self.py)
+
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        self.px, self.py = value
+
     def build(self, workplane: cq.Workplane, extrusion_distance: Optional[float] = None) -> cq.Workplane:
         """
         Build text on workplane.
@@ -372,39 +526,38 @@ class Text2D(Shape2D):
         wp = workplane.workplane(offset=0)
 
         # Move to position if not at origin
-        if self.position != (0, 0):
-            wp = wp.center(self.position[0], self.position[1])
+        if self.px or self.py:
+            wp = wp.center(self.px, self.py)
 
         # Map TiaCAD style names to CadQuery 'kind' parameter
-        # CadQuery expects: 'regular', 'bold', 'italic'
-        # For bold-italic, we'll use bold and handle with font name
-        cq_kind = self.style
-        if self.style == 'bold-italic':
-            cq_kind = 'bold'  # CadQuery doesn't have bold-italic directly
+        cq_kind = self._STYLE_TO_CQ_KIND[self.style]
 
         # Determine distance to use
         # If extrusion_distance is provided (from extrude operation), use it
         # Otherwise, use minimal placeholder (0.1mm) for standalone text
         distance = extrusion_distance if extrusion_distance is not None else 0.1
 
-        # Build text - creates 3D geometry directly
-        # CadQuery text() method always requires a distance parameter
+        # Build text - creates 3D geometry directly. Equivalent to
+        # wp.text(...) with its default combine='cut', clean=True, but the
+        # glyph solid comes from a cache and is only placed on wp's plane:
+        # cut from the base solid if there is one, otherwise the text alone.
         try:
-            wp = wp.text(
-                self.text,
-                fontsize=self.size,
-                distance=distance,
-                font=self.font,
-                fontPath=self.font_path,
-                kind=cq_kind,
-                halign=self.halign,
-                valign=self.valign
-            )
+            text_solid = _text_solid(
+                self.text, self.size, distance, self.font, self.font_path,
+                cq_kind, self.halign, self.valign,
+            ).transformShape(wp.plane.rG)
+            try:
+                wp.findSolid()
+            except ValueError:
+                wp = wp.newObject([text_solid.clean()])
+            else:
+                wp = wp.cut(text_solid, clean=True)
 
             logger.debug(
-                f"Built text '{self.text}' size={self.size} at {self.position}, "
-                f"distance={distance}, font={self.font}, style={self.style}, "
-                f"operation={self.operation}"
+                "Built text '%s' size=%s at (%s, %s), distance=%s, font=%s, "
+                "style=%s, operation=%s",
+                self.text, self.size, self.px, self.py, distance, self.font,
+                self.style, self.operation
             )
         except Exception as e:
             # Provide helpful error for font issues
@@ -437,11 +590,13 @@ class Sketch2D:
         name: Sketch name
         plane: Coordinate plane ('XY', 'XZ', or 'YZ')
         origin: 3D origin point [x, y, z]
-        shapes: List of Shape2D objects
+        shapes: Tuple of Shape2D objects
+        add_shapes: Shapes with operation 'add', in sketch order
+        subtract_shapes: Shapes with operation 'subtract', in sketch order
         profile: CadQuery Workplane with combined 2D geometry (built on demand)
     """
 
-    VALID_PLANES = ['XY', 'XZ', 'YZ']
+    VALID_PLANES = frozenset({'XY', 'XZ', 'YZ'})
 
     def __init__(self, name: str, plane: str, origin: Tuple[float, float, float],
                  shapes: List[Shape2D]):
@@ -466,7 +621,8 @@ class Sketch2D:
         # Validate plane
         if self.plane not in self.VALID_PLANES:
             raise SketchError(
-                f"Invalid plane '{plane}'. Must be one of: {self.VALID_PLANES}",
+                f"Invalid plane '{plane}'. "
+                f"Must be one of: {', '.join(sorted(self.VALID_PLANES))}",
                 sketch_name=name
             )
 
@@ -478,7 +634,25 @@ class Sketch2D:
             )
 
         logger.info(
-            f"Created sketch '{name}' on {plane} plane with {len(shapes)} shapes"
+            "Created sketch '%s' on %s plane with %d shapes", name, plane, len(shapes)
+        )
+
+    @property
+    def shapes(self) -> Tuple[Shape2D, ...]:
+        """Shapes in sketch order (assign a new sequence to change them)"""
+        return self._shapes
+
+    @shapes.setter
+    def shapes(self, shapes: Sequence[Shape2D]):
+        # Partition once per assignment so build_profile() and the operation
+        # builders don't each re-scan the shape list. Everything is stored as
+        # tuples so the partitions can't drift from shapes via in-place edits.
+        self._shapes = tuple(shapes)
+        self.add_shapes = tuple(
+            s for s in self._shapes if s.operation is ShapeOperation.ADD
+        )
+        self.subtract_shapes = tuple(
+            s for s in self._shapes if s.operation is ShapeOperation.SUBTRACT
         )
 
     def build_profile(self) -> cq.Workplane:
@@ -496,19 +670,15 @@ class Sketch2D:
             SketchError: If sketch validation fails
         """
         # Validate that sketch has at least one additive shape
-        add_shapes = [s for s in self.shapes if s.operation == 'add']
-        if not add_shapes:
+        if not self.add_shapes:
             raise SketchError(
                 f"Sketch '{self.name}' must have at least one 'add' shape",
                 sketch_name=self.name
             )
 
-        # Count shapes by type
-        subtract_shapes = [s for s in self.shapes if s.operation == 'subtract']
-
         logger.info(
-            f"Validated sketch '{self.name}': {len(add_shapes)} add, "
-            f"{len(subtract_shapes)} subtract shapes"
+            "Validated sketch '%s': %d add, %d subtract shapes",
+            self.name, len(self.add_shapes), len(self.subtract_shapes)
         )
 
         # Mark as validated
@@ -15,6 +15,7 @@ Philosophy: One unified resolver for all reference types. Clean, simple dispatch
 """
 
 from typing import Union, Dict, Any, Optional
+import math
 import numpy as np
 import logging
 
@@ -463,8 +464,10 @@ class SpatialResolver:
                     "Parts must have a backend for spatial reference resolution."
                 )
 
+            backend = part.backend
+
             # Select faces using backend
-            faces = part.backend.select_faces(part.geometry, selector)
+            faces = backend.select_faces(part.geometry, selector)
 
             if len(faces) == 0:
                 raise SpatialResolverError(
@@ -474,22 +477,19 @@ class SpatialResolver:
             # Get first matching face
             face = faces[0]
 
-            # Get face center using backend
-            center_tuple = part.backend.get_face_center(face)
-            center = np.array(center_tuple)
-
-            # Get face normal using backend
-            normal_tuple = part.backend.get_face_normal(face)
-            normal = np.array(normal_tuple)
+            # Center and normal come back from the backend as plain tuples;
+            # normalize on the scalars and build each array once.
+            center = np.array(backend.get_face_center(face), dtype=float)
+            nx, ny, nz = backend.get_face_normal(face)
 
             # Normalize (should already be normalized, but just to be safe)
-            normal_length = np.linalg.norm(normal)
+            normal_length = math.sqrt(nx * nx + ny * ny + nz * nz)
             if normal_length > 1e-10:
-                normal = normal / normal_length
+                nx, ny, nz = nx / normal_length, ny / normal_length, nz / normal_length
 
             return SpatialRef(
                 position=center,
-                orientation=normal,
+                orientation=np.array((nx, ny, nz), dtype=float),
                 ref_type='face'
             )
 
@@ -526,8 +526,10 @@ class SpatialResolver:
                     "Parts must have a backend for spatial reference resolution."
                 )
 
+            backend = part.backend
+
             # Select edges using backend
-            edges = part.backend.select_edges(part.geometry, selector)
+            edges = backend.select_edges(part.geometry, selector)
 
             if len(edges) == 0:
                 raise SpatialResolverError(
@@ -538,24 +540,25 @@ class SpatialResolver:
             edge = edges[0]
 
             # Get position based on 'at' parameter using backend
-            position_tuple = part.backend.get_edge_point(edge, at)
-            position = np.array(position_tuple)
+            position = np.array(backend.get_edge_point(edge, at), dtype=float)
 
             # Get tangent using backend
-            tangent_tuple = part.backend.get_edge_tangent(edge)
-            tangent = np.array(tangent_tuple)
+            tx, ty, tz = backend.get_edge_tangent(edge)
 
             # Normalize (should already be normalized, but just to be safe)
-            tangent_length = np.linalg.norm(tangent)
+            tangent_length = math.sqrt(tx * tx + ty * ty + tz * tz)
             if tangent_length < 1e-10:
                 raise SpatialResolverError(
                     "Edge has zero length, cannot compute tangent"
                 )
-            tangent = tangent / tangent_length
 
             return SpatialRef(
                 position=position,
-                orientation=tangent,  # Tangent as primary orientation
+                # Tangent as primary orientation
+                orientation=np.array(
+                    (tx / tangent_length, ty / tangent_length, tz / tangent_length),
+                    dtype=float,
+                ),
                 ref_type='edge'
             )
 
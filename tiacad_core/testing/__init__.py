@@ -27,13 +27,22 @@ See also:
 
 from .measurements import (
     measure_distance,
+    measure_distances,
+    measure_distances_grid,
+    find_neighbors_within,
     get_bounding_box_dimensions,
+    get_bounding_box_dimensions_batch,
+    clear_reference_cache,
 )
 
 from .orientation import (
     get_orientation_angles,
+    get_orientation_angles_batch,
     get_normal_vector,
+    get_normal_vectors,
     parts_aligned,
+    parts_aligned_many,
+    alignment_matrix,
 )
 
 from .dimensions import (
@@ -59,10 +68,19 @@ from .golden_step import (
 
 __all__ = [
     'measure_distance',
+    'measure_distances',
+    'measure_distances_grid',
+    'find_neighbors_within',
     'get_bounding_box_dimensions',
+    'get_bounding_box_dimensions_batch',
+    'clear_reference_cache',
     'get_orientation_angles',
+    'get_orientation_angles_batch',
     'get_normal_vector',
+    'get_normal_vectors',
     'parts_aligned',
+    'parts_aligned_many',
+    'alignment_matrix',
     'get_dimensions',
     'get_volume',
     'get_surface_area',
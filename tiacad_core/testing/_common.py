@@ -0,0 +1,128 @@
+"""Reference resolution helpers shared by the measurement and orientation utilities."""
+
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+from tiacad_core.part import Part, PartRegistry
+from tiacad_core.geometry.spatial_references import SpatialRef
+from tiacad_core.spatial_resolver import FACE_SELECTOR_MAP, SpatialResolver
+
+
+# Error context for a resolve, formatted only if resolution fails:
+# ((part_label, part, ref_label, ref), ...) renders as
+# "part_label='name', ref_label='ref'" lines.
+_Context = Tuple[Tuple[str, Part, str, str], ...]
+
+
+def _format_context(context: _Context) -> str:
+    """Render an error context tuple as "part='name', ref='ref'" lines."""
+    return "\n".join(
+        f"{part_label}='{part.name}', {ref_label}='{ref}'"
+        for part_label, part, ref_label, ref in context
+    )
+
+
+# Part-local references whose value depends only on the part's geometry (not
+# on its name, tracked position or orientation), so a resolved SpatialRef can
+# be reused for as long as the part keeps the same geometry object.
+_GEOMETRY_ONLY_REFS = frozenset({'center', *FACE_SELECTOR_MAP})
+
+# (id(geometry), ref) -> (geometry, backend, SpatialRef). Holding the geometry
+# keeps its id() from being recycled while the entry lives; entries are only
+# honoured when both geometry and backend are still the same objects. The
+# lock keeps the get/move_to_end/popitem sequences atomic across threads.
+_REF_CACHE_SIZE = 4096
+_ref_cache: "OrderedDict[Tuple[int, str], Tuple[Any, Any, SpatialRef]]" = OrderedDict()
+_ref_cache_lock = threading.Lock()
+
+
+def clear_reference_cache() -> None:
+    """Drop all memoized part-local references used by the testing helpers.
+
+    The cache is process-wide and holds strong references to up to 4096
+    part geometries (and their backends) until cleared or evicted.
+    """
+    with _ref_cache_lock:
+        _ref_cache.clear()
+
+
+def _cached_geometry_ref(part: Part, ref: str) -> Optional[SpatialRef]:
+    """Return a memoized geometry-only reference for part, if still valid."""
+    if ref not in _GEOMETRY_ONLY_REFS:
+        return None
+    key = (id(part.geometry), ref)
+    with _ref_cache_lock:
+        entry = _ref_cache.get(key)
+        if entry is None:
+            return None
+        geometry, backend, spatial_ref = entry
+        if geometry is not part.geometry or backend is not part.backend:
+            del _ref_cache[key]
+            return None
+        _ref_cache.move_to_end(key)
+    return spatial_ref
+
+
+def _store_geometry_ref(part: Part, ref: str, spatial_ref: SpatialRef) -> None:
+    """Memoize a geometry-only reference resolved for part."""
+    if ref not in _GEOMETRY_ONLY_REFS:
+        return
+    with _ref_cache_lock:
+        _ref_cache[(id(part.geometry), ref)] = (part.geometry, part.backend, spatial_ref)
+        if len(_ref_cache) > _REF_CACHE_SIZE:
+            _ref_cache.popitem(last=False)
+
+
+# Per-thread PartRegistry reused by _make_resolver when the caller passes no
+# registry, instead of allocating a fresh one on every call.
+_scratch = threading.local()
+
+
+def _scratch_registry() -> PartRegistry:
+    """Return this thread's scratch PartRegistry, emptied for reuse."""
+    registry = getattr(_scratch, 'registry', None)
+    if registry is None:
+        registry = _scratch.registry = PartRegistry()
+    else:
+        registry.clear()
+    return registry
+
+
+def _make_resolver(registry: Optional[PartRegistry], *parts: Part) -> SpatialResolver:
+    """Create a SpatialResolver, filling a scratch PartRegistry if needed."""
+    if registry is None:
+        registry = _scratch_registry()
+        for part in parts:
+            if not registry.exists(part.name):
+                registry.add(part)
+    return SpatialResolver(registry, references={})
+
+
+def _iter_refs(
+    part_refs: Sequence[Tuple[Part, str, _Context]],
+    registry: Optional[PartRegistry],
+    resolve_part_ref: Callable[[SpatialResolver, str, str, _Context], SpatialRef]
+) -> Iterator[SpatialRef]:
+    """Yield the resolved SpatialRef of each (part, ref, context) triple.
+
+    resolve_part_ref does the actual lookup so each caller can raise its own
+    error type. Contexts are plain tuples so the common, cached path never
+    formats a message string.
+    """
+    # Without a caller-supplied registry, part-local references resolve
+    # purely from each Part object, so geometry-only refs can be served from
+    # the module cache and the temporary registry/resolver built only on a
+    # miss. A caller's registry may map names to other Part objects, so that
+    # path always resolves through it.
+    use_cache = registry is None
+    resolver = None
+    for part, ref, context in part_refs:
+        spatial_ref = _cached_geometry_ref(part, ref) if use_cache else None
+        if spatial_ref is None:
+            if resolver is None:
+                resolver = _make_resolver(registry, *(p for p, _, _ in part_refs))
+            spatial_ref = resolve_part_ref(resolver, part.name, ref, context)
+            if use_cache and resolver.registry.get(part.name) is part:
+                _store_geometry_ref(part, ref, spatial_ref)
+        yield spatial_ref
@@ -6,7 +6,10 @@ between parts. Part of the Testing Confidence Plan v3.1.
 
 Key functions:
     - measure_distance: Measure distance between two parts at reference points
+    - measure_distances: Batched measure_distance over many part pairs
+    - measure_distances_grid: All-pairs distances between part references
     - get_bounding_box_dimensions: Extract width/height/depth from bounding box
+    - get_bounding_box_dimensions_batch: Same, as arrays over many parts
 
 Philosophy: Enable precise verification of attachment correctness and spatial
 relationships in tests without manual coordinate calculation.
@@ -15,7 +18,8 @@ Author: TIA (galactic-expedition-1110)
 Version: 1.0 (v3.1)
 """
 
-from typing import Dict, List, Optional, Set
+import math
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
@@ -23,6 +27,8 @@ from tiacad_core.part import Part, PartRegistry
 from tiacad_core.backend_support import require_cadquery_part
 from tiacad_core.geometry.spatial_references import SpatialRef
 from tiacad_core.spatial_resolver import SpatialResolver, SpatialResolverError
+from ._common import _Context, _format_context, _iter_refs
+from ._common import clear_reference_cache  # noqa: F401 (re-exported)
 
 
 class MeasurementError(Exception):
@@ -30,23 +36,15 @@ class MeasurementError(Exception):
     pass
 
 
-def _make_resolver(registry: Optional[PartRegistry], *parts: Part) -> SpatialResolver:
-    """Create a SpatialResolver, building a temporary PartRegistry if needed."""
-    if registry is None:
-        registry = PartRegistry()
-        for part in parts:
-            if not registry.exists(part.name):
-                registry.add(part)
-    return SpatialResolver(registry, references={})
-
-
-def _resolve_part_ref(resolver: SpatialResolver, part_name: str, ref: str, context: str):
+def _resolve_part_ref(resolver: SpatialResolver, part_name: str, ref: str, context: _Context):
     """Resolve a part reference, converting SpatialResolverError → MeasurementError."""
     ref_spec = f"{part_name}.{ref}" if "." not in ref else ref
     try:
         return resolver.resolve(ref_spec)
     except SpatialResolverError as e:
-        raise MeasurementError(f"Failed to resolve references: {e}\n{context}") from e
+        raise MeasurementError(
+            f"Failed to resolve references: {e}\n{_format_context(context)}"
+        ) from e
 
 
 def measure_distance(
@@ -72,17 +70,135 @@ def measure_distance(
     Raises:
         MeasurementError: If reference resolution fails or parts invalid
     """
-    if not isinstance(part1, Part):
-        raise MeasurementError(f"part1 must be a Part instance, got {type(part1)}")
-    if not isinstance(part2, Part):
-        raise MeasurementError(f"part2 must be a Part instance, got {type(part2)}")
+    for label, part in (("part1", part1), ("part2", part2)):
+        if not isinstance(part, Part):
+            raise MeasurementError(f"{label} must be a Part instance, got {type(part)}")
+
+    context = (("part1", part1, "ref1", ref1), ("part2", part2, "ref2", ref2))
+    # Read the two positions as scalars rather than stacking them into an
+    # array and allocating a difference temporary for a single distance.
+    p1, p2 = _iter_positions([(part1, ref1, context), (part2, ref2, context)], registry)
+    return math.dist(p1, p2)
+
+
+def measure_distances(
+    part_pairs: Sequence[Tuple[Part, Part, str, str]],
+    registry: Optional[PartRegistry] = None
+) -> NDArray[np.float64]:
+    """
+    Measure Euclidean distances for many (part1, part2, ref1, ref2) pairs.
+
+    All references are resolved through a single SpatialResolver, so a part
+    reference shared by several pairs is resolved only once, and the
+    distances are computed in one vectorized call. When no registry is
+    given, geometry-only references ('center', 'face_*') are also memoized
+    across calls for as long as the part keeps the same geometry object.
+
+    Args:
+        part_pairs: Sequence of (part1, part2, ref1, ref2) tuples
+        registry: Optional PartRegistry; if None, a temporary one holding
+            every part in part_pairs is created.
 
-    resolver = _make_resolver(registry, part1, part2)
-    context = f"part1='{part1.name}', ref1='{ref1}'\npart2='{part2.name}', ref2='{ref2}'"
-    spatial_ref1 = _resolve_part_ref(resolver, part1.name, ref1, context)
-    spatial_ref2 = _resolve_part_ref(resolver, part2.name, ref2, context)
+    Returns:
+        Array of shape (N,) with one distance per pair, in model units
 
-    return float(np.linalg.norm(spatial_ref1.position - spatial_ref2.position))
+    Raises:
+        MeasurementError: If reference resolution fails or parts invalid
+    """
+    for part1, part2, _, _ in part_pairs:
+        if not isinstance(part1, Part):
+            raise MeasurementError(f"part1 must be a Part instance, got {type(part1)}")
+        if not isinstance(part2, Part):
+            raise MeasurementError(f"part2 must be a Part instance, got {type(part2)}")
+
+    if not part_pairs:
+        return np.empty(0, dtype=np.float64)
+
+    part_refs = []
+    for part1, part2, ref1, ref2 in part_pairs:
+        context = (("part1", part1, "ref1", ref1), ("part2", part2, "ref2", ref2))
+        part_refs.append((part1, ref1, context))
+        part_refs.append((part2, ref2, context))
+
+    points = _resolve_positions(part_refs, registry).reshape(-1, 2, 3)
+    return np.linalg.norm(points[:, 0] - points[:, 1], axis=1)
+
+
+def _iter_positions(
+    part_refs: Sequence[Tuple[Part, str, _Context]],
+    registry: Optional[PartRegistry]
+):
+    """Yield the resolved position of each (part, ref, context) triple."""
+    for spatial_ref in _iter_refs(part_refs, registry, _resolve_part_ref):
+        yield spatial_ref.position
+
+
+def _resolve_positions(
+    part_refs: Sequence[Tuple[Part, str, _Context]],
+    registry: Optional[PartRegistry]
+) -> NDArray[np.float64]:
+    """Resolve (part, ref, context) triples to an (N, 3) array of positions."""
+    positions = np.empty((len(part_refs), 3), dtype=np.float64)
+    for i, position in enumerate(_iter_positions(part_refs, registry)):
+        positions[i] = position
+    return positions
+
+
+def measure_distances_grid(
+    parts: Sequence[Part],
+    ref: str = "center",
+    max_distance: Optional[float] = None,
+    registry: Optional[PartRegistry] = None
+) -> NDArray[np.float64]:
+    """
+    Measure distances between the same reference on every pair of parts.
+
+    Each part's reference is resolved once and the positions are indexed in
+    a KD-tree, so checking e.g. the spacing of a large pattern costs one
+    resolve per part instead of one per pair. With ``max_distance`` only
+    pairs within that distance are computed, which stays close to
+    O(N log N) for spread-out assemblies.
+
+    Args:
+        parts: Parts to measure between
+        ref: Reference on each part (default: "center")
+        max_distance: Optional cutoff; pairs farther apart are reported as inf
+        registry: Optional PartRegistry; if None, a temporary one is created.
+
+    Returns:
+        Symmetric (N, N) distance matrix with a zero diagonal
+
+    Raises:
+        MeasurementError: If reference resolution fails or parts invalid
+
+    Example:
+        # Verify grid spacing in pattern: every neighbour is 10mm away
+        dists = measure_distances_grid(pattern_parts, max_distance=10.5)
+        near = dists[np.isfinite(dists) & (dists > 0)]
+        assert np.allclose(near, 10.0)
+    """
+    for part in parts:
+        if not isinstance(part, Part):
+            raise MeasurementError(f"parts must be Part instances, got {type(part)}")
+
+    n = len(parts)
+    positions = _resolve_positions(
+        [(part, ref, (("part", part, "ref", ref),)) for part in parts], registry
+    )
+
+    if max_distance is None:
+        from scipy.spatial.distance import pdist, squareform
+        return squareform(pdist(positions)) if n else np.zeros((0, 0))
+
+    from scipy.spatial import cKDTree
+
+    grid = np.full((n, n), np.inf)
+    np.fill_diagonal(grid, 0.0)
+    pairs = cKDTree(positions).query_pairs(max_distance, output_type='ndarray')
+    if len(pairs):
+        i, j = pairs[:, 0], pairs[:, 1]
+        grid[i, j] = grid[j, i] = np.linalg.norm(positions[i] - positions[j], axis=1)
+    return grid
 
 
 def distance_between_refs(ref1: SpatialRef, ref2: SpatialRef) -> float:
@@ -147,10 +263,10 @@ def measure_angle(
     if not isinstance(part2, Part):
         raise MeasurementError(f"part2 must be a Part instance, got {type(part2)}")
 
-    resolver = _make_resolver(registry, part1, part2)
-    context = f"part1='{part1.name}', ref1='{ref1}'\npart2='{part2.name}', ref2='{ref2}'"
-    spatial_ref1 = _resolve_part_ref(resolver, part1.name, ref1, context)
-    spatial_ref2 = _resolve_part_ref(resolver, part2.name, ref2, context)
+    context = (("part1", part1, "ref1", ref1), ("part2", part2, "ref2", ref2))
+    spatial_ref1, spatial_ref2 = _iter_refs(
+        [(part1, ref1, context), (part2, ref2, context)], registry, _resolve_part_ref
+    )
 
     return angle_between_refs(spatial_ref1, spatial_ref2)
 
@@ -220,17 +336,63 @@ def get_bounding_box_dimensions(part: Part) -> Dict[str, float]:
             f"Failed to get bounding box for part '{part.name}': {e}"
         ) from e
 
-    min_corner = np.array(bounds['min'])
-    max_corner = np.array(bounds['max'])
-    center = np.array(bounds['center'])
+    # Plain float lists straight from the backend's scalar corners; a
+    # single part isn't worth three ndarray allocations and .tolist() calls.
+    min_corner = [float(v) for v in bounds['min']]
+    max_corner = [float(v) for v in bounds['max']]
+    xmin, ymin, zmin = min_corner
+    xmax, ymax, zmax = max_corner
 
     return {
-        'width': float(max_corner[0] - min_corner[0]),
-        'height': float(max_corner[1] - min_corner[1]),
-        'depth': float(max_corner[2] - min_corner[2]),
-        'center': center.tolist(),
-        'min': min_corner.tolist(),
-        'max': max_corner.tolist(),
+        'width': xmax - xmin,
+        'height': ymax - ymin,
+        'depth': zmax - zmin,
+        'center': [float(v) for v in bounds['center']],
+        'min': min_corner,
+        'max': max_corner,
+    }
+
+
+def get_bounding_box_dimensions_batch(parts: Sequence[Part]) -> Dict[str, NDArray[np.float64]]:
+    """
+    Bounding-box measurements for many parts in struct-of-arrays layout.
+
+    Args:
+        parts: Parts to measure
+
+    Returns:
+        Dict with 'min', 'max', 'center' as (N, 3) arrays and 'width' (X),
+        'height' (Y), 'depth' (Z) as (N,) arrays; row i belongs to parts[i].
+
+    Raises:
+        MeasurementError: If any bounding box cannot be computed
+    """
+    n = len(parts)
+    min_arr = np.empty((n, 3), dtype=np.float64)
+    max_arr = np.empty((n, 3), dtype=np.float64)
+    center_arr = np.empty((n, 3), dtype=np.float64)
+
+    for i, part in enumerate(parts):
+        if not isinstance(part, Part):
+            raise MeasurementError(f"part must be a Part instance, got {type(part)}")
+        try:
+            bounds = part.get_bounds()
+        except Exception as e:
+            raise MeasurementError(
+                f"Failed to get bounding box for part '{part.name}': {e}"
+            ) from e
+        min_arr[i] = bounds['min']
+        max_arr[i] = bounds['max']
+        center_arr[i] = bounds['center']
+
+    dims = max_arr - min_arr
+    return {
+        'width': dims[:, 0],
+        'height': dims[:, 1],
+        'depth': dims[:, 2],
+        'center': center_arr,
+        'min': min_arr,
+        'max': max_arr,
     }
 
 
@@ -251,6 +413,17 @@ def get_distance_between_points(
     Raises:
         ValueError: If points are not 3D
     """
+    # Plain 3-element lists/tuples: scalar math avoids two array
+    # allocations and the ufunc dispatch of np.linalg.norm.
+    if (
+        type(point1) in (list, tuple) and len(point1) == 3
+        and type(point2) in (list, tuple) and len(point2) == 3
+    ):
+        dx = float(point2[0]) - float(point1[0])
+        dy = float(point2[1]) - float(point1[1])
+        dz = float(point2[2]) - float(point1[2])
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
     p1 = np.asarray(point1, dtype=np.float64)
     p2 = np.asarray(point2, dtype=np.float64)
 
@@ -262,6 +435,37 @@ def get_distance_between_points(
     return float(np.linalg.norm(p2 - p1))
 
 
+def get_distances_between_points(
+    points1: NDArray[np.float64],
+    points2: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Row-wise Euclidean distances between two batches of 3D points.
+
+    Args:
+        points1: (N, 3) array-like of points
+        points2: (N, 3) array-like of points
+
+    Returns:
+        Array of shape (N,) with the distance between each pair of rows
+
+    Raises:
+        ValueError: If inputs are not (N, 3) or have different lengths
+    """
+    p1 = np.asarray(points1, dtype=np.float64)
+    p2 = np.asarray(points2, dtype=np.float64)
+
+    if p1.ndim != 2 or p1.shape[1] != 3:
+        raise ValueError(f"points1 must have shape (N, 3), got {p1.shape}")
+    if p2.shape != p1.shape:
+        raise ValueError(
+            f"points2 must match points1 shape {p1.shape}, got {p2.shape}"
+        )
+
+    d = p2 - p1
+    return np.sqrt(np.einsum('ij,ij->i', d, d))
+
+
 # Future utilities (planned for v3.1-v3.2)
 # These are stubs for future implementation
 
@@ -287,6 +491,75 @@ def _shape_distance(part1: Part, part2: Part) -> float:
     return float(calc.Value())
 
 
+def _aabb_rows(parts: Sequence[Part]) -> NDArray[np.float64]:
+    """Pack part bounding boxes into an (N, 6) [min_xyz, max_xyz] array."""
+    rows = np.empty((len(parts), 6), dtype=np.float64)
+    for i, part in enumerate(parts):
+        bounds = part.get_bounds()
+        rows[i, :3] = bounds['min']
+        rows[i, 3:] = bounds['max']
+    return rows
+
+
+def _aabb_gaps(a: NDArray[np.float64], b: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Euclidean gap between AABB rows of a (M, 6) and b (N, 6), shape (M, N).
+
+    The gap is a lower bound on the true surface-to-surface distance, so any
+    pair whose gap exceeds a tolerance can be rejected without an OCCT query.
+    """
+    sep = np.maximum(
+        np.maximum(a[:, None, :3] - b[None, :, 3:], b[None, :, :3] - a[:, None, 3:]),
+        0.0,
+    )
+    return np.sqrt(np.einsum('ijk,ijk->ij', sep, sep))
+
+
+def _neighbor_pairs(rows: NDArray[np.float64], tolerance: float) -> NDArray[np.intp]:
+    """Index pairs (i < j) of AABB rows whose boxes lie within tolerance.
+
+    Box centres go into a KD-tree: two boxes can only be within ``tolerance``
+    if their centres are within ``tolerance`` plus the two half-diagonals, so
+    a radius query with the largest half-diagonal gives a superset of the
+    candidates, which the exact AABB gap then filters.
+    """
+    if len(rows) < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    from scipy.spatial import cKDTree
+
+    centers = (rows[:, :3] + rows[:, 3:]) * 0.5
+    radius = 2.0 * float(np.max(np.linalg.norm(rows[:, 3:] - centers, axis=1)))
+    pairs = cKDTree(centers).query_pairs(radius + tolerance, output_type='ndarray')
+    if not len(pairs):
+        return pairs
+
+    a, b = rows[pairs[:, 0]], rows[pairs[:, 1]]
+    sep = np.maximum(np.maximum(a[:, :3] - b[:, 3:], b[:, :3] - a[:, 3:]), 0.0)
+    gaps = np.sqrt(np.einsum('ij,ij->i', sep, sep))
+    pairs = pairs[gaps <= tolerance]
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def find_neighbors_within(parts: Sequence[Part], tolerance: float) -> List[Tuple[int, int]]:
+    """
+    Find pairs of parts whose bounding boxes come within ``tolerance``.
+
+    This is the cheap broad phase of contact detection: every pair of parts
+    that could be in contact is returned, but some returned pairs may not
+    actually touch. Uses a KD-tree over box centres, so large assemblies
+    avoid comparing every pair of parts.
+
+    Args:
+        parts: Parts to search
+        tolerance: Maximum gap between bounding boxes
+
+    Returns:
+        Sorted list of (i, j) index pairs into ``parts`` with i < j
+    """
+    pairs = _neighbor_pairs(_aabb_rows(parts), tolerance)
+    return [(int(i), int(j)) for i, j in pairs]
+
+
 def parts_in_contact(
     part1: Part,
     part2: Part,
@@ -298,7 +571,9 @@ def parts_in_contact(
     Computes the exact minimum BREP surface-to-surface distance between the two
     solids (via OCCT ``BRepExtrema_DistShapeShape``) and returns True when it is
     within ``tolerance``. Touching faces measure 0.0; overlapping solids also
-    measure 0.0. This is a real geometric test, not a bounding-box heuristic.
+    measure 0.0. This is a real geometric test, not a bounding-box heuristic;
+    bounding boxes are only used to reject pairs that are clearly too far
+    apart before the surface query runs.
 
     Args:
         part1: First part
@@ -308,6 +583,12 @@ def parts_in_contact(
     Returns:
         True if the parts are within ``tolerance`` distance of each other
     """
+    require_cadquery_part(part1, "parts_in_contact")
+    require_cadquery_part(part2, "parts_in_contact")
+
+    rows = _aabb_rows([part1, part2])
+    if _aabb_gaps(rows[:1], rows[1:])[0, 0] > tolerance:
+        return False
     return _shape_distance(part1, part2) <= tolerance
 
 
@@ -315,8 +596,10 @@ def build_contact_graph(parts: list, tolerance: float = 0.1) -> Dict[str, Set[st
     """
     Build an adjacency graph of parts based on real contact detection.
 
-    Every pair is tested with :func:`parts_in_contact`; parts within
-    ``tolerance`` are recorded as adjacent. Nodes are part names.
+    Candidate pairs come from :func:`find_neighbors_within`; only parts whose
+    bounding boxes are within ``tolerance`` of each other get the exact
+    surface-to-surface test used by :func:`parts_in_contact`.
+    Nodes are part names.
 
     Args:
         parts: List of Part instances
@@ -326,11 +609,17 @@ def build_contact_graph(parts: list, tolerance: float = 0.1) -> Dict[str, Set[st
         Adjacency dict mapping each part name to the set of names it contacts.
     """
     adjacency: Dict[str, Set[str]] = {p.name: set() for p in parts}
-    for i, a in enumerate(parts):
-        for b in parts[i + 1:]:
-            if parts_in_contact(a, b, tolerance):
-                adjacency[a.name].add(b.name)
-                adjacency[b.name].add(a.name)
+    if len(parts) < 2:
+        return adjacency
+
+    for part in parts:
+        require_cadquery_part(part, "parts_in_contact")
+
+    for i, j in _neighbor_pairs(_aabb_rows(parts), tolerance):
+        a, b = parts[i], parts[j]
+        if _shape_distance(a, b) <= tolerance:
+            adjacency[a.name].add(b.name)
+            adjacency[b.name].add(a.name)
     return adjacency
 
 
@@ -6,8 +6,12 @@ Part of the Testing Confidence Plan v3.1 Week 2.
 
 Key functions:
     - get_orientation_angles: Extract roll/pitch/yaw angles from part
+    - get_orientation_angles_batch: Same, as arrays over many parts
     - get_normal_vector: Get normal vector from face reference
+    - get_normal_vectors: Same, stacked over several face references
     - parts_aligned: Check if parts are aligned along an axis
+    - parts_aligned_many: Batched parts_aligned over many part pairs
+    - alignment_matrix: Pairwise alignment between all parts
 
 Philosophy: Enable precise verification of rotation correctness and part
 alignment in tests without manual angle calculation.
@@ -16,12 +20,16 @@ Author: TIA (v3.1 Week 2)
 Version: 1.0 (v3.1)
 """
 
-from typing import Dict, Optional, Literal, Tuple
+import math
+from typing import Dict, Optional, Literal, Sequence, Tuple, Union
 import numpy as np
 from numpy.typing import NDArray
 
 from tiacad_core.part import Part, PartRegistry
+from tiacad_core.geometry.spatial_references import Frame
 from tiacad_core.spatial_resolver import SpatialResolver, SpatialResolverError
+from ._common import _Context, _format_context, _iter_refs
+from ._common import clear_reference_cache  # noqa: F401 (re-exported)
 
 
 class OrientationError(Exception):
@@ -34,23 +42,29 @@ class OrientationError(Exception):
 _PERP_AXES: Dict[str, Tuple[int, int]] = {'x': (1, 2), 'y': (0, 2), 'z': (0, 1)}
 
 
-def _make_resolver(registry: Optional[PartRegistry], *parts: Part) -> SpatialResolver:
-    """Create a SpatialResolver, building a temporary PartRegistry if needed."""
-    if registry is None:
-        registry = PartRegistry()
-        for part in parts:
-            if not registry.exists(part.name):
-                registry.add(part)
-    return SpatialResolver(registry, references={})
+def _check_part(value: object, label: str = "part") -> None:
+    """Raise OrientationError unless value is a Part."""
+    if not isinstance(value, Part):
+        raise OrientationError(f"{label} must be a Part instance, got {type(value)}")
 
 
-def _resolve_part_ref(resolver: SpatialResolver, part_name: str, ref: str, context: str):
+def _perp_axes(axis: str) -> Tuple[int, int]:
+    """Look up the two perpendicular coordinate indices for an axis name."""
+    try:
+        return _PERP_AXES[axis]
+    except (KeyError, TypeError):
+        raise OrientationError(f"axis must be 'x', 'y', or 'z', got '{axis}'") from None
+
+
+def _resolve_part_ref(resolver: SpatialResolver, part_name: str, ref: str, context: _Context):
     """Resolve a part reference, converting SpatialResolverError → OrientationError."""
     ref_spec = f"{part_name}.{ref}" if "." not in ref else ref
     try:
         return resolver.resolve(ref_spec)
     except SpatialResolverError as e:
-        raise OrientationError(f"Failed to resolve reference: {e}\n{context}") from e
+        raise OrientationError(
+            f"Failed to resolve reference: {e}\n{_format_context(context)}"
+        ) from e
 
 
 def get_orientation_angles(
@@ -75,19 +89,22 @@ def get_orientation_angles(
     Raises:
         OrientationError: If part is invalid or reference resolution fails
     """
-    if not isinstance(part, Part):
-        raise OrientationError(f"part must be a Part instance, got {type(part)}")
+    _check_part(part)
 
-    resolver = _make_resolver(registry, part)
-    spatial_ref = _resolve_part_ref(
-        resolver, part.name, reference,
-        f"part='{part.name}', reference='{reference}'"
-    )
+    context = (("part", part, "reference", reference),)
+    spatial_ref, = _iter_refs([(part, reference, context)], registry, _resolve_part_ref)
 
     if spatial_ref.orientation is None:
         return {'roll': 0.0, 'pitch': 0.0, 'yaw': 0.0, 'has_orientation': False}
 
-    rotation_matrix = spatial_ref.frame.to_transform_matrix()[:3, :3]
+    # Axis-aligned faces (the common case) skip the frame and Euler math.
+    if spatial_ref.tangent is None:
+        canonical = _CANONICAL_NORMALS.get(tuple(np.round(spatial_ref.orientation, 9).tolist()))
+        if canonical is not None:
+            roll, pitch, yaw = canonical
+            return {'roll': roll, 'pitch': pitch, 'yaw': yaw, 'has_orientation': True}
+
+    rotation_matrix = spatial_ref.rotation_matrix()
     angles = _rotation_matrix_to_euler_angles(rotation_matrix)
 
     return {
@@ -98,10 +115,59 @@ def get_orientation_angles(
     }
 
 
+def get_orientation_angles_batch(
+    parts: Sequence[Part],
+    reference: str = "center",
+    registry: Optional[PartRegistry] = None
+) -> Dict[str, NDArray]:
+    """
+    Extract orientation angles for the same reference on many parts.
+
+    All references are resolved through one SpatialResolver and the Euler
+    conversion runs once over the stacked rotation matrices.
+
+    Args:
+        parts: Parts to analyze
+        reference: Reference point on each part (default: "center")
+        registry: Optional PartRegistry; if None, a temporary one is created.
+
+    Returns:
+        Dict with 'roll', 'pitch', 'yaw' as (N,) arrays in degrees and
+        'has_orientation' as an (N,) bool array. Entries without
+        orientation are zero, as in get_orientation_angles().
+
+    Raises:
+        OrientationError: If a part is invalid or reference resolution fails
+    """
+    for part in parts:
+        _check_part(part)
+
+    n = len(parts)
+    rotations = np.tile(np.eye(3), (n, 1, 1))
+    has_orientation = np.zeros(n, dtype=bool)
+    part_refs = [
+        (part, reference, (("part", part, "reference", reference),)) for part in parts
+    ]
+    for k, spatial_ref in enumerate(_iter_refs(part_refs, registry, _resolve_part_ref)):
+        if spatial_ref.orientation is not None:
+            rotations[k] = spatial_ref.rotation_matrix()
+            has_orientation[k] = True
+
+    angles = np.degrees(_rotation_matrix_to_euler_angles(rotations))
+    angles[~has_orientation] = 0.0
+    return {
+        'roll': angles[:, 0],
+        'pitch': angles[:, 1],
+        'yaw': angles[:, 2],
+        'has_orientation': has_orientation,
+    }
+
+
 def get_normal_vector(
     part: Part,
     face_ref: str,
-    registry: Optional[PartRegistry] = None
+    registry: Optional[PartRegistry] = None,
+    copy: bool = False
 ) -> NDArray[np.float64]:
     """
     Get the outward-pointing normal vector from a face reference on a part.
@@ -110,21 +176,20 @@ def get_normal_vector(
         part: Part to analyze
         face_ref: Face reference (e.g., "face_top", "face_bottom")
         registry: Optional PartRegistry; if None, a temporary one is created.
+        copy: Return a writable copy instead of a read-only view (default: False)
 
     Returns:
-        Normalized normal vector as [x, y, z] numpy array
+        Normalized normal vector as [x, y, z] numpy array. Unless ``copy`` is
+        set this is a read-only view of the resolved (possibly memoized)
+        reference; pass ``copy=True`` to modify it in place.
 
     Raises:
         OrientationError: If reference is invalid or has no orientation
     """
-    if not isinstance(part, Part):
-        raise OrientationError(f"part must be a Part instance, got {type(part)}")
+    _check_part(part)
 
-    resolver = _make_resolver(registry, part)
-    spatial_ref = _resolve_part_ref(
-        resolver, part.name, face_ref,
-        f"part='{part.name}', face_ref='{face_ref}'"
-    )
+    context = (("part", part, "face_ref", face_ref),)
+    spatial_ref, = _iter_refs([(part, face_ref, context)], registry, _resolve_part_ref)
 
     if spatial_ref.orientation is None:
         raise OrientationError(
@@ -132,7 +197,47 @@ def get_normal_vector(
             f"Use a face reference (e.g., 'face_top') instead of point reference."
         )
 
-    return spatial_ref.orientation.copy()
+    if copy:
+        return spatial_ref.orientation.copy()
+    normal = spatial_ref.orientation.view()
+    normal.flags.writeable = False
+    return normal
+
+
+def get_normal_vectors(
+    part: Part,
+    face_refs: Sequence[str],
+    registry: Optional[PartRegistry] = None
+) -> NDArray[np.float64]:
+    """
+    Get the outward-pointing normals of several face references on a part.
+
+    All references are resolved through one resolver and stacked into a
+    single array, e.g. to check all six faces of a box at once.
+
+    Args:
+        part: Part to analyze
+        face_refs: Face references (e.g., ["face_top", "face_bottom"])
+        registry: Optional PartRegistry; if None, a temporary one is created.
+
+    Returns:
+        (N, 3) array with one normalized normal per face reference
+
+    Raises:
+        OrientationError: If a reference is invalid or has no orientation
+    """
+    _check_part(part)
+
+    part_refs = [(part, ref, (("part", part, "face_ref", ref),)) for ref in face_refs]
+    normals = np.empty((len(part_refs), 3), dtype=np.float64)
+    for k, spatial_ref in enumerate(_iter_refs(part_refs, registry, _resolve_part_ref)):
+        if spatial_ref.orientation is None:
+            raise OrientationError(
+                f"Reference '{face_refs[k]}' has no orientation/normal vector.\n"
+                f"Use a face reference (e.g., 'face_top') instead of point reference."
+            )
+        normals[k] = spatial_ref.orientation
+    return normals
 
 
 def parts_aligned(
@@ -165,53 +270,169 @@ def parts_aligned(
     Raises:
         OrientationError: If parts are invalid or axis is unrecognized
     """
-    if not isinstance(part1, Part):
-        raise OrientationError(f"part1 must be a Part instance, got {type(part1)}")
-    if not isinstance(part2, Part):
-        raise OrientationError(f"part2 must be a Part instance, got {type(part2)}")
-    if axis not in _PERP_AXES:
-        raise OrientationError(f"axis must be 'x', 'y', or 'z', got '{axis}'")
-
-    resolver = _make_resolver(registry, part1, part2)
-    spatial_ref1 = _resolve_part_ref(
-        resolver, part1.name, ref1,
-        f"part1='{part1.name}', ref1='{ref1}'\npart2='{part2.name}', ref2='{ref2}'"
-    )
-    spatial_ref2 = _resolve_part_ref(
-        resolver, part2.name, ref2,
-        f"part1='{part1.name}', ref1='{ref1}'\npart2='{part2.name}', ref2='{ref2}'"
+    _check_part(part1, 'part1')
+    _check_part(part2, 'part2')
+    i, j = _perp_axes(axis)
+
+    context = (("part1", part1, "ref1", ref1), ("part2", part2, "ref2", ref2))
+    spatial_ref1, spatial_ref2 = _iter_refs(
+        [(part1, ref1, context), (part2, ref2, context)], registry, _resolve_part_ref
     )
 
     pos1, pos2 = spatial_ref1.position, spatial_ref2.position
-    i, j = _PERP_AXES[axis]
-    diff = np.array([pos1[i] - pos2[i], pos1[j] - pos2[j]])
+    # Two scalar differences don't need an array and a ufunc norm.
+    return math.hypot(float(pos1[i] - pos2[i]), float(pos1[j] - pos2[j])) <= tolerance
 
-    return float(np.linalg.norm(diff)) <= tolerance
+
+def parts_aligned_many(
+    part_pairs: Sequence[Tuple[Part, Part, str, str]],
+    axis: Literal['x', 'y', 'z'] = 'z',
+    tolerance: float = 0.01,
+    registry: Optional[PartRegistry] = None
+) -> NDArray[np.bool_]:
+    """
+    Check alignment for many (part1, part2, ref1, ref2) pairs at once.
+
+    Same test as parts_aligned(), but all references are resolved in one
+    pass into an (N, 2, 3) position buffer and the in-plane distances are
+    computed in a single vectorized expression.
+
+    Args:
+        part_pairs: Sequence of (part1, part2, ref1, ref2) tuples
+        axis: Axis to check alignment perpendicular to ('x', 'y', or 'z')
+        tolerance: Maximum Euclidean distance in alignment plane (default: 0.01)
+        registry: Optional PartRegistry; if None, a temporary one is created.
+
+    Returns:
+        (N,) bool array, True where the pair is aligned within tolerance
+
+    Raises:
+        OrientationError: If parts are invalid or axis is unrecognized
+    """
+    for part1, part2, _, _ in part_pairs:
+        _check_part(part1, 'part1')
+        _check_part(part2, 'part2')
+    i, j = _perp_axes(axis)
+
+    part_refs = []
+    for part1, part2, ref1, ref2 in part_pairs:
+        context = (("part1", part1, "ref1", ref1), ("part2", part2, "ref2", ref2))
+        part_refs.append((part1, ref1, context))
+        part_refs.append((part2, ref2, context))
+
+    positions = np.empty((len(part_refs), 3), dtype=np.float64)
+    for k, spatial_ref in enumerate(_iter_refs(part_refs, registry, _resolve_part_ref)):
+        positions[k] = spatial_ref.position
+
+    # Compare squared in-plane distances against tolerance**2 (keeping the
+    # sign, so a negative tolerance still matches nothing) -- no sqrt.
+    in_plane = positions[0::2, (i, j)] - positions[1::2, (i, j)]
+    return np.einsum('ij,ij->i', in_plane, in_plane) <= tolerance * abs(tolerance)
+
+
+def alignment_matrix(
+    parts: Sequence[Part],
+    axis: Literal['x', 'y', 'z'] = 'z',
+    ref: str = "center",
+    tolerance: float = 0.01,
+    registry: Optional[PartRegistry] = None
+) -> NDArray[np.bool_]:
+    """
+    Check alignment between every pair of parts along an axis.
+
+    Each part's reference is resolved once into an (N, 3) position array
+    and all pairwise in-plane distances are computed by broadcasting, e.g.
+    to find which parts of an assembly are coaxial.
+
+    Args:
+        parts: Parts to compare
+        axis: Axis to check alignment perpendicular to ('x', 'y', or 'z')
+        ref: Reference point on each part (default: "center")
+        tolerance: Maximum Euclidean distance in alignment plane (default: 0.01)
+        registry: Optional PartRegistry; if None, a temporary one is created.
+
+    Returns:
+        Symmetric (N, N) bool array; entry [a, b] is True when parts a and b
+        are aligned within tolerance (the diagonal is always True)
+
+    Raises:
+        OrientationError: If parts are invalid or axis is unrecognized
+    """
+    for part in parts:
+        _check_part(part)
+    i, j = _perp_axes(axis)
+
+    part_refs = [(part, ref, (("part", part, "ref", ref),)) for part in parts]
+    in_plane = np.empty((len(part_refs), 2), dtype=np.float64)
+    for k, spatial_ref in enumerate(_iter_refs(part_refs, registry, _resolve_part_ref)):
+        position = spatial_ref.position
+        in_plane[k] = position[i], position[j]
+
+    diff = in_plane[:, None, :] - in_plane[None, :, :]
+    return np.einsum('abk,abk->ab', diff, diff) <= tolerance * abs(tolerance)
 
 
 # Internal helper functions
 
-def _rotation_matrix_to_euler_angles(R: NDArray[np.float64]) -> Tuple[float, float, float]:
+def _rotation_matrix_to_euler_angles(
+    R: NDArray[np.float64]
+) -> Union[Tuple[float, float, float], NDArray[np.float64]]:
     """
-    Convert a 3x3 rotation matrix to Euler angles (ZYX convention).
+    Convert rotation matrices to Euler angles (ZYX convention).
 
     Args:
-        R: 3x3 rotation matrix
+        R: 3x3 rotation matrix, or a (..., 3, 3) stack of them
 
     Returns:
-        Tuple of (roll, pitch, yaw) in radians
-    """
-    sy = np.sqrt(R[0, 0]**2 + R[1, 0]**2)
-    singular = sy < 1e-6  # Gimbal lock threshold
-
-    if not singular:
-        roll = np.arctan2(R[2, 1], R[2, 2])
-        pitch = np.arctan2(-R[2, 0], sy)
-        yaw = np.arctan2(R[1, 0], R[0, 0])
-    else:
-        # Gimbal lock case (pitch ≈ ±90°)
-        roll = np.arctan2(-R[1, 2], R[1, 1])
-        pitch = np.arctan2(-R[2, 0], sy)
-        yaw = 0.0
-
-    return (roll, pitch, yaw)
+        Tuple of (roll, pitch, yaw) in radians for a single matrix, or a
+        (..., 3) array of [roll, pitch, yaw] rows for a stack
+    """
+    if R.ndim == 2:
+        # One tolist() and math-module calls on plain floats: per-element
+        # NumPy scalar indexing and ufunc dispatch dominate a single matrix.
+        (r00, _, _), (r10, r11, r12), (r20, r21, r22) = R.tolist()
+        sy = math.hypot(r00, r10)
+        singular = sy < 1e-6  # Gimbal lock threshold
+
+        if not singular:
+            roll = math.atan2(r21, r22)
+            pitch = math.atan2(-r20, sy)
+            yaw = math.atan2(r10, r00)
+        else:
+            # Gimbal lock case (pitch ≈ ±90°)
+            roll = math.atan2(-r12, r11)
+            pitch = math.atan2(-r20, sy)
+            yaw = 0.0
+
+        return (roll, pitch, yaw)
+
+    # Stacked matrices: evaluate both branches elementwise and pick per matrix.
+    sy = np.hypot(R[..., 0, 0], R[..., 1, 0])
+    singular = sy < 1e-6
+    angles = np.empty(R.shape[:-2] + (3,), dtype=np.float64)
+    angles[..., 0] = np.where(
+        singular,
+        np.arctan2(-R[..., 1, 2], R[..., 1, 1]),
+        np.arctan2(R[..., 2, 1], R[..., 2, 2]),
+    )
+    angles[..., 1] = np.arctan2(-R[..., 2, 0], sy)
+    angles[..., 2] = np.where(singular, 0.0, np.arctan2(R[..., 1, 0], R[..., 0, 0]))
+    return angles
+
+
+def _canonical_normal_angles() -> Dict[Tuple[float, float, float], Tuple[float, float, float]]:
+    """(roll, pitch, yaw) degrees for the frame of each ±X/±Y/±Z unit normal.
+
+    Computed through the same Frame.from_normal + Euler path that
+    get_orientation_angles() uses, so the fast path returns identical values.
+    """
+    table = {}
+    for normal in np.vstack([np.eye(3), -np.eye(3)]):
+        rotation = Frame.from_normal(np.zeros(3), normal).to_rotation_matrix()
+        angles = _rotation_matrix_to_euler_angles(rotation)
+        table[tuple(normal.tolist())] = tuple(float(np.degrees(a)) for a in angles)
+    return table
+
+
+# Unit normal (rounded to 9 decimals) -> (roll, pitch, yaw) in degrees.
+_CANONICAL_NORMALS = _canonical_normal_angles()
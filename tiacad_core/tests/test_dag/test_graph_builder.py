@@ -5,31 +5,73 @@ Author: TIA
 Version: 3.2.0
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from tiacad_core.dag.graph_builder import GraphBuilder, GraphBuilderError
+from tiacad_core.dag.graph_builder import GraphBuilder, GraphBuilderError, _deps_from_expr
 from tiacad_core.dag.model_graph import NodeType
 
 
-class TestGraphBuilder:
-    """Tests for GraphBuilder class"""
+@pytest.fixture(scope="module")
+def shared_builder():
+    """One GraphBuilder reused by every test in this module"""
+    return GraphBuilder()
 
-    def test_empty_yaml(self):
-        """Test building graph from minimal YAML"""
-        builder = GraphBuilder()
 
-        yaml_data = {
-            'parameters': {},
-            'parts': {},
-            'operations': {}
+@pytest.fixture
+def builder(shared_builder):
+    """The shared GraphBuilder, reset so each test starts from an empty graph"""
+    shared_builder.reset()
+    return shared_builder
+
+
+# Common YAML shapes, built once per module. build_graph() only reads its
+# input, so tests share these dicts rather than rebuilding them.
+@pytest.fixture(scope="module")
+def empty_yaml():
+    """YAML with empty parameters/parts/operations sections"""
+    return {
+        'parameters': {},
+        'parts': {},
+        'operations': {}
+    }
+
+
+@pytest.fixture(scope="module")
+def box_yaml():
+    """A single box part named 'base'"""
+    return {
+        'parts': {
+            'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def box_with_fillet_yaml(box_yaml):
+    """box_yaml plus a fillet operation on 'base'"""
+    return {
+        **box_yaml,
+        'operations': {
+            'filleted': {
+                'type': 'fillet',
+                'input': 'base',
+                'radius': 5
+            }
         }
+    }
 
-        graph = builder.build_graph(yaml_data)
+
+class TestGraphBuilder:
+    """Tests for GraphBuilder class"""
+
+    def test_empty_yaml(self, builder, empty_yaml):
+        """Test building graph from minimal YAML"""
+        graph = builder.build_graph(empty_yaml)
         assert len(graph) == 0
 
-    def test_parameter_nodes(self):
+    def test_parameter_nodes(self, builder):
         """Test adding parameter nodes"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'width': 100,
@@ -44,10 +86,8 @@ class TestGraphBuilder:
         assert "parameter:height" in graph
         assert graph.nodes["parameter:width"].spec == {'value': 100}
 
-    def test_parameter_dependencies(self):
+    def test_parameter_dependencies(self, builder):
         """Test extracting parameter -> parameter dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'width': 100,
@@ -61,10 +101,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("parameter:area")
         assert "parameter:width" in deps
 
-    def test_nested_parameter_dependencies(self):
+    def test_nested_parameter_dependencies(self, builder):
         """Test extracting dependencies from complex expressions"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'width': 100,
@@ -79,25 +117,15 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("parameter:volume")
         assert deps == {"parameter:width", "parameter:height", "parameter:depth"}
 
-    def test_part_nodes(self):
+    def test_part_nodes(self, builder, box_yaml):
         """Test adding part nodes"""
-        builder = GraphBuilder()
-
-        yaml_data = {
-            'parts': {
-                'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
-            }
-        }
-
-        graph = builder.build_graph(yaml_data)
+        graph = builder.build_graph(box_yaml)
 
         assert "part:base" in graph
         assert graph.nodes["part:base"].node_type == NodeType.PART
 
-    def test_part_parameter_dependencies(self):
+    def test_part_parameter_dependencies(self, builder):
         """Test extracting part -> parameter dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'box_width': 100
@@ -118,55 +146,23 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("part:base")
         assert "parameter:box_width" in deps
 
-    def test_operation_nodes(self):
+    def test_operation_nodes(self, builder, box_with_fillet_yaml):
         """Test adding operation nodes"""
-        builder = GraphBuilder()
-
-        yaml_data = {
-            'parts': {
-                'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
-            },
-            'operations': {
-                'filleted': {
-                    'type': 'fillet',
-                    'input': 'base',
-                    'radius': 5
-                }
-            }
-        }
-
-        graph = builder.build_graph(yaml_data)
+        graph = builder.build_graph(box_with_fillet_yaml)
 
         assert "operation:filleted" in graph
         assert graph.nodes["operation:filleted"].node_type == NodeType.OPERATION
 
-    def test_operation_part_dependencies(self):
+    def test_operation_part_dependencies(self, builder, box_with_fillet_yaml):
         """Test extracting operation -> part dependencies"""
-        builder = GraphBuilder()
-
-        yaml_data = {
-            'parts': {
-                'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
-            },
-            'operations': {
-                'filleted': {
-                    'type': 'fillet',
-                    'input': 'base',
-                    'radius': 5
-                }
-            }
-        }
-
-        graph = builder.build_graph(yaml_data)
+        graph = builder.build_graph(box_with_fillet_yaml)
 
         # operation:filleted depends on part:base
         deps = graph.get_dependencies("operation:filleted")
         assert "part:base" in deps
 
-    def test_operation_parameter_dependencies(self):
+    def test_operation_parameter_dependencies(self, builder):
         """Test extracting operation -> parameter dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'fillet_radius': 5
@@ -189,10 +185,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("operation:filleted")
         assert "parameter:fillet_radius" in deps
 
-    def test_boolean_operation_dependencies(self):
+    def test_boolean_operation_dependencies(self, builder):
         """Test extracting boolean operation dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30},
@@ -214,10 +208,8 @@ class TestGraphBuilder:
         assert "part:base" in deps
         assert "part:hole" in deps
 
-    def test_union_operation_dependencies(self):
+    def test_union_operation_dependencies(self, builder):
         """Test union operation with multiple parts"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'part1': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30},
@@ -240,10 +232,8 @@ class TestGraphBuilder:
         assert "part:part2" in deps
         assert "part:part3" in deps
 
-    def test_pattern_operation_marked(self):
+    def test_pattern_operation_marked(self, builder):
         """Test that pattern operations are marked as patterns"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
@@ -263,10 +253,8 @@ class TestGraphBuilder:
         node = graph.nodes["operation:repeated"]
         assert node.is_pattern
 
-    def test_circular_parameter_error(self):
+    def test_circular_parameter_error(self, builder):
         """Test that circular parameter dependencies raise error"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'a': '${b}',
@@ -277,10 +265,8 @@ class TestGraphBuilder:
         with pytest.raises(GraphBuilderError, match="Circular dependency"):
             builder.build_graph(yaml_data)
 
-    def test_circular_operation_error(self):
+    def test_circular_operation_error(self, builder):
         """Test detecting cycles in operations"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
@@ -302,10 +288,8 @@ class TestGraphBuilder:
         with pytest.raises(GraphBuilderError, match="Circular dependency"):
             builder.build_graph(yaml_data)
 
-    def test_reference_nodes(self):
+    def test_reference_nodes(self, builder):
         """Test adding reference nodes"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
@@ -324,10 +308,8 @@ class TestGraphBuilder:
         assert "reference:top_face" in graph
         assert graph.nodes["reference:top_face"].node_type == NodeType.REFERENCE
 
-    def test_reference_part_dependencies(self):
+    def test_reference_part_dependencies(self, builder):
         """Test extracting reference -> part dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 100, 'height': 50, 'depth': 30}
@@ -345,10 +327,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("reference:top_face")
         assert "part:base" in deps
 
-    def test_constraint_nodes(self):
+    def test_constraint_nodes(self, builder):
         """Test adding constraint nodes (TCAD-CON-5)"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 10, 'height': 10, 'depth': 10},
@@ -364,11 +344,9 @@ class TestGraphBuilder:
         assert "constraint:0" in graph
         assert graph.nodes["constraint:0"].node_type == NodeType.CONSTRAINT
 
-    def test_constraint_part_dependencies(self):
+    def test_constraint_part_dependencies(self, builder):
         """A constraint depends on both the reference and moving part it mates
         (TCAD-CON-5) — either side changing must dirty the constraint."""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 10, 'height': 10, 'depth': 10},
@@ -385,11 +363,9 @@ class TestGraphBuilder:
         assert "part:base" in deps
         assert "part:top" in deps
 
-    def test_constraint_inline_face_ref_dependency(self):
+    def test_constraint_inline_face_ref_dependency(self, builder):
         """Inline {type: face, part, selector} refs (not just 'part.face_name'
         strings) must also produce a dependency edge."""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'base': {'type': 'box', 'width': 10, 'height': 10, 'depth': 10},
@@ -412,11 +388,9 @@ class TestGraphBuilder:
         assert "part:base" in deps
         assert "part:top" in deps
 
-    def test_constraint_operation_result_dependency(self):
+    def test_constraint_operation_result_dependency(self, builder):
         """A constraint mating an operation's result (not a raw part) must
         depend on the operation node, not a nonexistent part node."""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parts': {
                 'a': {'type': 'box', 'width': 10, 'height': 10, 'depth': 10},
@@ -437,10 +411,8 @@ class TestGraphBuilder:
         assert "operation:merged" in deps
         assert "part:top" in deps
 
-    def test_sketch_nodes(self):
+    def test_sketch_nodes(self, builder):
         """Test adding sketch nodes"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'sketches': {
                 'profile': {
@@ -456,10 +428,8 @@ class TestGraphBuilder:
         assert "sketch:profile" in graph
         assert graph.nodes["sketch:profile"].node_type == NodeType.SKETCH
 
-    def test_sketch_parameter_dependencies(self):
+    def test_sketch_parameter_dependencies(self, builder):
         """Test extracting sketch -> parameter dependencies"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'sketch_width': 100
@@ -478,10 +448,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("sketch:profile")
         assert "parameter:sketch_width" in deps
 
-    def test_part_sketch_dependencies(self):
+    def test_part_sketch_dependencies(self, builder):
         """Test part referencing sketch"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'sketches': {
                 'profile': {
@@ -504,10 +472,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("part:extruded")
         assert "sketch:profile" in deps
 
-    def test_operation_sketch_dependencies(self):
+    def test_operation_sketch_dependencies(self, builder):
         """Test operation referencing sketch (extrude/revolve/sweep via 'sketch:' field)"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'sketches': {
                 'bottle_profile': {
@@ -530,10 +496,8 @@ class TestGraphBuilder:
         deps = graph.get_dependencies("operation:bottle")
         assert "sketch:bottle_profile" in deps
 
-    def test_operation_sketch_missing_sketch_no_error(self):
+    def test_operation_sketch_missing_sketch_no_error(self, builder):
         """Test operation with sketch: field referencing non-existent sketch is silently skipped"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'operations': {
                 'sweep_op': {
@@ -548,10 +512,8 @@ class TestGraphBuilder:
         graph = builder.build_graph(yaml_data)
         assert "operation:sweep_op" in graph
 
-    def test_operation_sketch_parameter_chain(self):
+    def test_operation_sketch_parameter_chain(self, builder):
         """Test full chain: parameter → sketch → operation"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'profile_width': 50
@@ -585,10 +547,8 @@ class TestGraphBuilder:
         assert "sketch:profile" in transitive
         assert "operation:extruded_body" in transitive
 
-    def test_complex_dependencies(self):
+    def test_complex_dependencies(self, builder):
         """Test complete dependency chain"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'base_size': 100,
@@ -628,10 +588,8 @@ class TestGraphBuilder:
         assert "parameter:base_size" in op_deps
         assert "parameter:hole_radius" in op_deps
 
-    def test_topological_order_complete(self):
+    def test_topological_order_complete(self, builder):
         """Test that complete YAML produces valid topological order"""
-        builder = GraphBuilder()
-
         yaml_data = {
             'parameters': {
                 'width': 100,
@@ -668,3 +626,84 @@ class TestGraphBuilder:
         assert width_idx < area_idx  # width before area
         assert width_idx < base_idx  # width before base
         assert base_idx < final_idx  # base before final
+
+    def test_reset_between_builds(self, builder):
+        """Test that reset() starts a fresh graph without touching the old one"""
+        first = builder.build_graph({'parameters': {'width': 100}})
+
+        builder.reset()
+        second = builder.build_graph({'parameters': {'height': 50}})
+
+        assert second is not first
+        assert "parameter:width" in first
+        assert "parameter:width" not in second
+        assert builder.parameter_names == {'height'}
+
+    @pytest.mark.serial
+    def test_repeated_expressions_are_memoized(self, builder):
+        """Test that identical expression strings are scanned only once"""
+        _deps_from_expr.cache_clear()
+
+        yaml_data = {
+            'parameters': {'size': 10},
+            'parts': {
+                f'box{i}': {'type': 'box', 'width': '${size}', 'height': '${size}'}
+                for i in range(3)
+            }
+        }
+
+        graph = builder.build_graph(yaml_data)
+
+        assert _deps_from_expr.cache_info().hits > 0
+        for i in range(3):
+            assert graph.get_dependencies(f"part:box{i}") == {"parameter:size"}
+
+    @pytest.mark.serial
+    def test_plain_values_skip_expression_scan(self, builder):
+        """Test that numbers and placeholder-free strings are never scanned"""
+        _deps_from_expr.cache_clear()
+
+        refs = builder._find_parameter_refs(
+            {'type': 'box', 'width': 100, 'height': 2.5, 'tags': ['a', True, None]}
+        )
+
+        assert refs == set()
+        info = _deps_from_expr.cache_info()
+        assert info.hits == 0 and info.misses == 0
+
+    def test_shared_yaml_not_mutated(self, builder, box_with_fillet_yaml):
+        """Test that build_graph leaves the shared fixture dicts untouched"""
+        before = repr(box_with_fillet_yaml)
+
+        builder.build_graph(box_with_fillet_yaml)
+
+        assert repr(box_with_fillet_yaml) == before
+
+    def test_concurrent_builds_match_serial(self, builder):
+        """Test that per-thread builders produce identical graphs concurrently"""
+        yaml_data = {
+            'parameters': {'size': 10, 'double': '${size * 2}'},
+            'parts': {
+                f'box{i}': {'type': 'box', 'width': '${size}', 'height': '${double}'}
+                for i in range(20)
+            },
+            'operations': {
+                'combined': {
+                    'type': 'union',
+                    'base': 'box0',
+                    'union': [f'box{i}' for i in range(1, 20)]
+                }
+            }
+        }
+
+        def edges(graph):
+            return set(graph.graph.edges)
+
+        expected = edges(builder.build_graph(yaml_data))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda _: edges(GraphBuilder().build_graph(yaml_data)), range(32)
+            ))
+
+        assert all(result == expected for result in results)
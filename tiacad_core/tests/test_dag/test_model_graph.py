@@ -5,6 +5,7 @@ Author: TIA
 Version: 3.2.0
 """
 
+import networkx as nx
 import pytest
 from tiacad_core.dag.model_graph import ModelGraph, GraphNode, NodeType
 
@@ -57,6 +58,14 @@ class TestGraphNode:
                 spec={}
             )
 
+    def test_node_is_slotted(self):
+        """Test that nodes carry no per-instance __dict__"""
+        node = GraphNode("part:base", NodeType.PART, "base", {})
+
+        assert not hasattr(node, '__dict__')
+        with pytest.raises(AttributeError):
+            node.unknown_field = 1
+
 
 class TestModelGraph:
     """Tests for ModelGraph class"""
@@ -127,6 +136,42 @@ class TestModelGraph:
         with pytest.raises(ValueError, match="not found"):
             graph.add_dependency("parameter:width", "parameter:nonexistent")
 
+    def test_bulk_load(self):
+        """Test adding nodes and dependencies in one call"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:width", NodeType.PARAMETER, "width", {}))
+
+        graph.bulk_load(
+            [
+                GraphNode("part:base", NodeType.PART, "base", {}),
+                GraphNode("operation:final", NodeType.OPERATION, "final", {}, is_valid=False),
+            ],
+            [("part:base", "parameter:width"), ("operation:final", "part:base")],
+        )
+
+        assert len(graph) == 3
+        assert graph.get_dependencies("operation:final") == {"part:base"}
+        assert graph.topological_sort() == ["parameter:width", "part:base", "operation:final"]
+        assert graph.get_invalid_nodes() == {"operation:final"}
+        assert graph.valid_nodes == {"parameter:width", "part:base"}
+        assert graph.get_node_count_by_type()[NodeType.PART] == 1
+
+    def test_bulk_load_is_all_or_nothing(self):
+        """Test that a failed bulk_load leaves the graph unchanged"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:width", NodeType.PARAMETER, "width", {}))
+
+        with pytest.raises(ValueError, match="not found"):
+            graph.bulk_load(
+                [GraphNode("part:base", NodeType.PART, "base", {})],
+                [("part:base", "parameter:missing")],
+            )
+        with pytest.raises(ValueError, match="already exists"):
+            graph.bulk_load([GraphNode("parameter:width", NodeType.PARAMETER, "width", {})])
+
+        assert len(graph) == 1
+        assert "part:base" not in graph.graph
+
     def test_detect_cycles_none(self):
         """Test cycle detection on valid DAG"""
         graph = ModelGraph()
@@ -157,6 +202,46 @@ class TestModelGraph:
         assert len(cycles) > 0
         assert len(cycles[0]) == 2  # Cycle involves 2 nodes
 
+    def test_detect_cycles_returns_witness(self):
+        """Test that the reported cycle follows real edges back to its start"""
+        graph = ModelGraph()
+
+        # Long chain p0 -> ... -> p49 closed into a ring by p0 depending on p49
+        for i in range(50):
+            graph.add_node(GraphNode(f"parameter:p{i}", NodeType.PARAMETER, f"p{i}", {}))
+        for i in range(1, 50):
+            graph.add_dependency(f"parameter:p{i}", f"parameter:p{i - 1}")
+        graph.add_dependency("parameter:p0", "parameter:p49")
+
+        cycles = graph.detect_cycles()
+
+        assert len(cycles) == 1
+        cycle = cycles[0]
+        assert len(cycle) == 50
+        for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+            assert graph.graph.has_edge(u, v)
+
+    def test_detect_cycles_self_loop(self):
+        """Test that a node depending on itself is reported"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:p1", NodeType.PARAMETER, "p1", {}))
+        graph.add_dependency("parameter:p1", "parameter:p1")
+
+        assert graph.detect_cycles() == [["parameter:p1"]]
+
+    def test_detect_cycles_after_new_edge(self):
+        """Test that a cycle closed after an acyclic check is still found"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:p1", NodeType.PARAMETER, "p1", {}))
+        graph.add_node(GraphNode("parameter:p2", NodeType.PARAMETER, "p2", {}))
+        graph.add_dependency("parameter:p2", "parameter:p1")
+
+        assert graph.detect_cycles() == []
+        graph.topological_sort()
+
+        graph.add_dependency("parameter:p1", "parameter:p2")
+        assert len(graph.detect_cycles()) == 1
+
     def test_topological_sort(self):
         """Test topological sorting"""
         graph = ModelGraph()
@@ -242,6 +327,31 @@ class TestModelGraph:
         trans_dependents = graph.get_transitive_dependents("parameter:p1")
         assert trans_dependents == {"parameter:p2", "parameter:p3", "part:base"}
 
+    def test_transitive_dependents_many(self):
+        """Test the union of dependents of several nodes in one traversal"""
+        graph = ModelGraph()
+
+        # Two roots feeding a shared chain: a -> c, b -> c, c -> part
+        graph.add_node(GraphNode("parameter:a", NodeType.PARAMETER, "a", {}))
+        graph.add_node(GraphNode("parameter:b", NodeType.PARAMETER, "b", {}))
+        graph.add_node(GraphNode("parameter:c", NodeType.PARAMETER, "c", {}))
+        graph.add_node(GraphNode("part:base", NodeType.PART, "base", {}))
+
+        graph.add_dependency("parameter:c", "parameter:a")
+        graph.add_dependency("parameter:c", "parameter:b")
+        graph.add_dependency("part:base", "parameter:c")
+
+        dependents = graph.get_transitive_dependents_many(
+            ["parameter:a", "parameter:b", "parameter:missing"]
+        )
+        assert dependents == {"parameter:c", "part:base"}
+
+        # A start that is downstream of another start is included
+        dependents = graph.get_transitive_dependents_many(["parameter:a", "parameter:c"])
+        assert dependents == {"parameter:c", "part:base"}
+
+        assert graph.get_transitive_dependents_many([]) == set()
+
     def test_mark_invalid(self):
         """Test marking nodes invalid"""
         graph = ModelGraph()
@@ -284,6 +394,16 @@ class TestModelGraph:
         invalid = graph.get_invalid_nodes()
         assert invalid == {"parameter:p2", "part:base"}
 
+        # mark_valid/mark_invalid keep the valid and invalid sets in sync
+        graph.mark_valid("parameter:p2")
+        graph.mark_invalid("parameter:p1")
+        assert graph.get_invalid_nodes() == {"parameter:p1", "part:base"}
+        assert graph.valid_nodes == {"parameter:p2"}
+
+        # The returned set is a copy
+        invalid.clear()
+        assert graph.get_invalid_nodes() == {"parameter:p1", "part:base"}
+
     def test_get_node_count_by_type(self):
         """Test counting nodes by type"""
         graph = ModelGraph()
@@ -301,6 +421,35 @@ class TestModelGraph:
         assert counts[NodeType.REFERENCE] == 0
         assert counts[NodeType.SKETCH] == 0
 
+        # A rejected duplicate isn't counted, and the result is a copy
+        with pytest.raises(ValueError):
+            graph.add_node(GraphNode("part:base", NodeType.PART, "base", {}))
+        counts[NodeType.PART] = 99
+        assert graph.get_node_count_by_type()[NodeType.PART] == 1
+
+    def test_get_roots_and_leaves(self):
+        """Test that roots/leaves track added nodes and edges"""
+        graph = ModelGraph()
+
+        graph.add_node(GraphNode("parameter:p1", NodeType.PARAMETER, "p1", {}))
+        graph.add_node(GraphNode("parameter:p2", NodeType.PARAMETER, "p2", {}))
+        graph.add_node(GraphNode("part:base", NodeType.PART, "base", {}))
+
+        # A node without edges is both a root and a leaf
+        assert graph.get_roots() == {"parameter:p1", "parameter:p2", "part:base"}
+        assert graph.get_leaves() == {"parameter:p1", "parameter:p2", "part:base"}
+
+        graph.add_dependency("part:base", "parameter:p1")
+        assert graph.get_roots() == {"parameter:p1", "parameter:p2"}
+        assert graph.get_leaves() == {"parameter:p2", "part:base"}
+
+        graph.bulk_load(
+            [GraphNode("operation:final", NodeType.OPERATION, "final", {})],
+            [("operation:final", "part:base")],
+        )
+        assert graph.get_roots() == {"parameter:p1", "parameter:p2"}
+        assert graph.get_leaves() == {"parameter:p2", "operation:final"}
+
     def test_get_max_depth(self):
         """Test calculating maximum dependency depth"""
         graph = ModelGraph()
@@ -318,6 +467,41 @@ class TestModelGraph:
         depth = graph.get_max_depth()
         assert depth == 3
 
+    def test_order_and_depth_track_mutations(self):
+        """Test that cached topological order/depth are refreshed on edits"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:p1", NodeType.PARAMETER, "p1", {}))
+        graph.add_node(GraphNode("part:base", NodeType.PART, "base", {}))
+
+        order = graph.topological_sort()
+        assert graph.get_max_depth() == 0
+
+        # Mutating the returned list must not corrupt the cache
+        order.reverse()
+        assert graph.topological_sort() == ["parameter:p1", "part:base"]
+
+        graph.add_node(GraphNode("operation:final", NodeType.OPERATION, "final", {}))
+        graph.add_dependency("operation:final", "part:base")
+        graph.add_dependency("part:base", "parameter:p1")
+
+        assert graph.topological_sort() == ["parameter:p1", "part:base", "operation:final"]
+        assert graph.topological_sort({"operation:final", "parameter:p1"}) == [
+            "parameter:p1", "operation:final"
+        ]
+        assert graph.get_max_depth() == 2
+
+    def test_topological_sort_cycle_raises(self):
+        """Test that sorting a cyclic graph raises"""
+        graph = ModelGraph()
+        graph.add_node(GraphNode("parameter:p1", NodeType.PARAMETER, "p1", {}))
+        graph.add_node(GraphNode("parameter:p2", NodeType.PARAMETER, "p2", {}))
+        graph.add_dependency("parameter:p2", "parameter:p1")
+        graph.add_dependency("parameter:p1", "parameter:p2")
+
+        with pytest.raises(nx.NetworkXUnfeasible):
+            graph.topological_sort()
+        assert graph.get_max_depth() == 0
+
     def test_repr(self):
         """Test string representation"""
         graph = ModelGraph()
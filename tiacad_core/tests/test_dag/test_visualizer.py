@@ -5,8 +5,6 @@ Author: TIA
 Version: 3.2.0
 """
 
-import tempfile
-from pathlib import Path
 from io import StringIO
 
 from tiacad_core.dag.model_graph import ModelGraph, GraphNode, NodeType
@@ -16,7 +14,7 @@ from tiacad_core.dag.visualizer import GraphVisualizer
 class TestGraphVisualizer:
     """Tests for GraphVisualizer class"""
 
-    def test_dot_export_simple(self):
+    def test_dot_export_simple(self, tmp_path):
         """Test exporting simple graph to DOT format"""
         graph = ModelGraph()
 
@@ -25,27 +23,21 @@ class TestGraphVisualizer:
         graph.add_dependency("part:base", "parameter:width")
 
         # Export to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            dot_path = f.name
+        dot_path = tmp_path / "graph.dot"
 
-        try:
-            GraphVisualizer.to_dot(graph, dot_path)
+        GraphVisualizer.to_dot(graph, str(dot_path))
 
-            # Read and verify content
-            with open(dot_path, 'r') as f:
-                content = f.read()
+        # Read and verify content
+        content = dot_path.read_text()
 
-            assert 'digraph TiaCADDependencies' in content
-            assert 'parameter:width' in content
-            assert 'part:base' in content
-            assert '->' in content  # Has edges
-            assert 'lightblue' in content  # Parameter color
-            assert 'lightgreen' in content  # Part color
+        assert 'digraph TiaCADDependencies' in content
+        assert 'parameter:width' in content
+        assert 'part:base' in content
+        assert '->' in content  # Has edges
+        assert 'lightblue' in content  # Parameter color
+        assert 'lightgreen' in content  # Part color
 
-        finally:
-            Path(dot_path).unlink(missing_ok=True)
-
-    def test_dot_export_with_filter(self):
+    def test_dot_export_with_filter(self, tmp_path):
         """Test filtering node types in DOT export"""
         graph = ModelGraph()
 
@@ -55,28 +47,22 @@ class TestGraphVisualizer:
         graph.add_dependency("part:base", "parameter:width")
         graph.add_dependency("operation:final", "part:base")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            dot_path = f.name
-
-        try:
-            # Export only parameters and parts (no operations)
-            GraphVisualizer.to_dot(
-                graph,
-                dot_path,
-                filter_types={NodeType.PARAMETER, NodeType.PART}
-            )
+        dot_path = tmp_path / "graph.dot"
 
-            with open(dot_path, 'r') as f:
-                content = f.read()
+        # Export only parameters and parts (no operations)
+        GraphVisualizer.to_dot(
+            graph,
+            str(dot_path),
+            filter_types={NodeType.PARAMETER, NodeType.PART}
+        )
 
-            assert 'parameter:width' in content
-            assert 'part:base' in content
-            assert 'operation:final' not in content
+        content = dot_path.read_text()
 
-        finally:
-            Path(dot_path).unlink(missing_ok=True)
+        assert 'parameter:width' in content
+        assert 'part:base' in content
+        assert 'operation:final' not in content
 
-    def test_dot_export_with_invalid_highlight(self):
+    def test_dot_export_with_invalid_highlight(self, tmp_path):
         """Test highlighting invalid nodes in DOT export"""
         graph = ModelGraph()
 
@@ -84,22 +70,16 @@ class TestGraphVisualizer:
         graph.add_node(GraphNode("parameter:width", NodeType.PARAMETER, "width", {}, is_valid=True))
         graph.add_node(GraphNode("part:base", NodeType.PART, "base", {}, is_valid=False))
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            dot_path = f.name
+        dot_path = tmp_path / "graph.dot"
 
-        try:
-            GraphVisualizer.to_dot(graph, dot_path, highlight_invalid=True)
+        GraphVisualizer.to_dot(graph, str(dot_path), highlight_invalid=True)
 
-            with open(dot_path, 'r') as f:
-                content = f.read()
+        content = dot_path.read_text()
 
-            # Invalid node should be highlighted in red
-            assert 'lightcoral' in content
+        # Invalid node should be highlighted in red
+        assert 'lightcoral' in content
 
-        finally:
-            Path(dot_path).unlink(missing_ok=True)
-
-    def test_dot_export_pattern_indicator(self):
+    def test_dot_export_pattern_indicator(self, tmp_path):
         """Test that pattern operations show [pattern] label"""
         graph = ModelGraph()
 
@@ -111,20 +91,14 @@ class TestGraphVisualizer:
             is_pattern=True
         ))
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            dot_path = f.name
-
-        try:
-            GraphVisualizer.to_dot(graph, dot_path)
+        dot_path = tmp_path / "graph.dot"
 
-            with open(dot_path, 'r') as f:
-                content = f.read()
+        GraphVisualizer.to_dot(graph, str(dot_path))
 
-            # Should show pattern indicator in label
-            assert '[pattern]' in content or 'pattern' in content.lower()
+        content = dot_path.read_text()
 
-        finally:
-            Path(dot_path).unlink(missing_ok=True)
+        # Should show pattern indicator in label
+        assert '[pattern]' in content or 'pattern' in content.lower()
 
     def test_show_stats(self):
         """Test displaying graph statistics"""
@@ -249,7 +223,7 @@ class TestGraphVisualizer:
         assert 'Nodes: 0' in stats_text
         assert 'Edges: 0' in stats_text
 
-    def test_multiple_node_types_colors(self):
+    def test_multiple_node_types_colors(self, tmp_path):
         """Test that all node types get proper colors in DOT"""
         graph = ModelGraph()
 
@@ -259,21 +233,19 @@ class TestGraphVisualizer:
         graph.add_node(GraphNode("operation:op", NodeType.OPERATION, "op", {}))
         graph.add_node(GraphNode("reference:ref", NodeType.REFERENCE, "ref", {}))
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            dot_path = f.name
+        dot_path = tmp_path / "graph.dot"
 
-        try:
-            GraphVisualizer.to_dot(graph, dot_path)
+        GraphVisualizer.to_dot(graph, str(dot_path))
 
-            with open(dot_path, 'r') as f:
-                content = f.read()
+        content = dot_path.read_text()
 
-            # Check that each color appears
-            assert 'lightblue' in content  # parameter
-            assert 'lightgreen' in content  # part
-            assert 'lightyellow' in content  # operation
-            assert 'lightpink' in content  # reference
-            assert 'lavender' in content  # sketch
+        # Check that each color appears
+        assert 'lightblue' in content  # parameter
+        assert 'lightgreen' in content  # part
+        assert 'lightyellow' in content  # operation
+        assert 'lightpink' in content  # reference
+        assert 'lavender' in content  # sketch
 
-        finally:
-            Path(dot_path).unlink(missing_ok=True)
+    def test_every_node_type_has_color(self):
+        """Test that the DOT color table covers every node type"""
+        assert set(GraphVisualizer.NODE_COLORS) == set(NodeType)
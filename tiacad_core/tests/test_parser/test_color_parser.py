@@ -6,6 +6,12 @@ import pytest
 from tiacad_core.parser.color_parser import ColorParser, Color, ColorParseError
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Palette-less ColorParser shared by the module (parsing doesn't mutate it)"""
+    return ColorParser()
+
+
 class TestColorBasics:
     """Test Color class"""
 
@@ -29,6 +35,34 @@ class TestColorBasics:
         assert c.g == 0.0
         assert c.b == 0.5
 
+        c = Color(0, 1, 0.5, 2)
+        assert c.to_rgba() == (0.0, 1.0, 0.5, 1.0)
+
+    def test_color_is_slotted(self):
+        """Colors carry no per-instance __dict__"""
+        c = Color(1.0, 0.0, 0.0)
+        assert not hasattr(c, '__dict__')
+        with pytest.raises(AttributeError):
+            c.name = "red"
+
+    def test_color_is_immutable(self, parser):
+        """Shared parse results can't be modified through one caller"""
+        red = parser.parse("red")
+        with pytest.raises(AttributeError, match="immutable"):
+            red.a = 0.5
+        with pytest.raises(AttributeError, match="immutable"):
+            del red.r
+        assert parser.parse("red").a == 1.0
+
+    def test_color_copy_and_pickle(self):
+        """Immutable colors still copy and pickle"""
+        import copy
+        import pickle
+
+        c = Color(0.1, 0.2, 0.3, 0.4)
+        assert copy.copy(c).to_rgba() == c.to_rgba()
+        assert pickle.loads(pickle.dumps(c)).to_rgba() == c.to_rgba()
+
     def test_to_rgb(self):
         """Convert to RGB tuple"""
         c = Color(0.5, 0.6, 0.7, 0.8)
@@ -47,6 +81,15 @@ class TestColorBasics:
         c = Color(0.0, 0.0, 1.0)
         assert c.to_hex() == "#0000FF"
 
+        # Channels round to the nearest step
+        assert Color(0.5, 0.5, 0.5).to_hex() == "#808080"
+
+    def test_hex_round_trip(self, parser):
+        """Every 8-bit channel value survives parse -> to_hex"""
+        for value in range(256):
+            hex_str = f"#{value:02X}{255 - value:02X}{value // 2:02X}"
+            assert parser.parse(hex_str).to_hex() == hex_str
+
     def test_color_equality(self):
         """Test color equality"""
         c1 = Color(1.0, 0.0, 0.0)
@@ -59,10 +102,8 @@ class TestColorBasics:
 class TestNamedColors:
     """Test parsing named colors"""
 
-    def test_basic_colors(self):
+    def test_basic_colors(self, parser):
         """Parse basic color names"""
-        parser = ColorParser()
-
         # Test basic colors
         red = parser.parse("red")
         assert red.r == 1.0
@@ -76,18 +117,15 @@ class TestNamedColors:
         white = parser.parse("white")
         assert white == Color(1.0, 1.0, 1.0)
 
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, parser):
         """Color names should be case-insensitive"""
-        parser = ColorParser()
         red1 = parser.parse("red")
         red2 = parser.parse("RED")
         red3 = parser.parse("Red")
         assert red1 == red2 == red3
 
-    def test_material_colors(self):
+    def test_material_colors(self, parser):
         """Parse material library colors"""
-        parser = ColorParser()
-
         # Aluminum should be in material library
         aluminum = parser.parse("aluminum")
         assert aluminum is not None
@@ -96,10 +134,8 @@ class TestNamedColors:
         assert 0.7 < aluminum.g < 0.8
         assert 0.7 < aluminum.b < 0.8
 
-    def test_unknown_color(self):
+    def test_unknown_color(self, parser):
         """Unknown color names should raise error with suggestions"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError) as exc:
             parser.parse("unknown-color-xyz")
 
@@ -151,14 +187,47 @@ class TestPalette:
         derived = parser.parse('derived')
         assert base == derived
 
+    def test_palette_edit_after_clear_cache(self):
+        """String results are cached until clear_cache() is called"""
+        palette = {'accent': 'red'}
+        parser = ColorParser(palette=palette)
+
+        first = parser.parse('accent')
+        assert parser.parse('accent') is first
+
+        palette['accent'] = 'blue'
+        parser.clear_cache()
+        assert parser.parse('accent') == parser.parse('blue')
+
+        # Caches are per parser, so another palette isn't affected
+        assert ColorParser(palette={'accent': 'lime'}).parse('accent') == Color(0.0, 1.0, 0.0)
+
+    def test_string_cache_is_bounded_and_acyclic(self):
+        """The string cache is capped and freed with its parser, no GC needed"""
+        import gc
+        import weakref
+        from tiacad_core.parser.color_parser import _STRING_CACHE_SIZE
+
+        parser = ColorParser()
+        for value in range(_STRING_CACHE_SIZE + 10):
+            parser.parse(f"#{value:06X}")
+        assert len(parser._string_cache) == _STRING_CACHE_SIZE
+        assert "#000000" not in parser._string_cache
+
+        ref = weakref.ref(parser)
+        gc.disable()
+        try:
+            del parser
+            assert ref() is None
+        finally:
+            gc.enable()
+
 
 class TestHexColors:
     """Test hex color parsing"""
 
-    def test_hex_6_digit(self):
+    def test_hex_6_digit(self, parser):
         """Parse #RRGGBB format"""
-        parser = ColorParser()
-
         red = parser.parse("#FF0000")
         assert red == Color(1.0, 0.0, 0.0)
 
@@ -170,20 +239,16 @@ class TestHexColors:
         assert 0.35 < custom.g < 0.45
         assert 0.75 < custom.b < 0.85
 
-    def test_hex_3_digit(self):
+    def test_hex_3_digit(self, parser):
         """Parse #RGB format (shorthand)"""
-        parser = ColorParser()
-
         red = parser.parse("#F00")
         assert red == Color(1.0, 0.0, 0.0)
 
         white = parser.parse("#FFF")
         assert white == Color(1.0, 1.0, 1.0)
 
-    def test_hex_8_digit_alpha(self):
+    def test_hex_8_digit_alpha(self, parser):
         """Parse #RRGGBBAA format with alpha"""
-        parser = ColorParser()
-
         # Red, 50% transparent
         color = parser.parse("#FF000080")
         assert color.r == 1.0
@@ -191,19 +256,15 @@ class TestHexColors:
         assert color.b == 0.0
         assert 0.48 < color.a < 0.52  # ~0.5
 
-    def test_hex_case_insensitive(self):
+    def test_hex_case_insensitive(self, parser):
         """Hex should accept both upper and lower case"""
-        parser = ColorParser()
-
         c1 = parser.parse("#ff0000")
         c2 = parser.parse("#FF0000")
         c3 = parser.parse("#Ff0000")
         assert c1 == c2 == c3
 
-    def test_hex_invalid(self):
+    def test_hex_invalid(self, parser):
         """Invalid hex should raise error"""
-        parser = ColorParser()
-
         # Invalid length
         with pytest.raises(ColorParseError):
             parser.parse("#FF")
@@ -212,6 +273,12 @@ class TestHexColors:
         with pytest.raises(ColorParseError):
             parser.parse("#GGGGGG")
 
+        # Embedded whitespace isn't hex either
+        with pytest.raises(ColorParseError, match="Must contain only"):
+            parser.parse("#FF 00 00")
+        with pytest.raises(ColorParseError):
+            parser.parse_many(["#FF 00 00"])
+
         # Missing #
         with pytest.raises(ColorParseError):
             parser.parse("FF0000")
@@ -220,37 +287,29 @@ class TestHexColors:
 class TestRGBArrays:
     """Test RGB/RGBA array parsing"""
 
-    def test_rgb_array(self):
+    def test_rgb_array(self, parser):
         """Parse [r, g, b] array (0-1 range)"""
-        parser = ColorParser()
-
         red = parser.parse([1.0, 0.0, 0.0])
         assert red == Color(1.0, 0.0, 0.0)
 
         custom = parser.parse([0.5, 0.6, 0.7])
         assert custom == Color(0.5, 0.6, 0.7)
 
-    def test_rgba_array(self):
+    def test_rgba_array(self, parser):
         """Parse [r, g, b, a] array"""
-        parser = ColorParser()
-
         color = parser.parse([1.0, 0.0, 0.0, 0.5])
         assert color.r == 1.0
         assert color.a == 0.5
 
-    def test_rgb_array_invalid_length(self):
+    def test_rgb_array_invalid_length(self, parser):
         """Array must have 3 or 4 elements"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError) as exc:
             parser.parse([1.0, 0.0])
 
         assert "length" in str(exc.value).lower()
 
-    def test_rgb_array_out_of_range(self):
+    def test_rgb_array_out_of_range(self, parser):
         """Values must be in 0-1 range"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError):
             parser.parse([1.5, 0.0, 0.0])
 
@@ -261,35 +320,27 @@ class TestRGBArrays:
 class TestRGBObjects:
     """Test RGB object parsing {r, g, b}"""
 
-    def test_rgb_object(self):
+    def test_rgb_object(self, parser):
         """Parse {r: 255, g: 0, b: 0} (0-255 range)"""
-        parser = ColorParser()
-
         red = parser.parse({'r': 255, 'g': 0, 'b': 0})
         assert red == Color(1.0, 0.0, 0.0)
 
         custom = parser.parse({'r': 128, 'g': 128, 'b': 128})
         assert 0.48 < custom.r < 0.52  # ~0.5
 
-    def test_rgba_object(self):
+    def test_rgba_object(self, parser):
         """Parse with alpha"""
-        parser = ColorParser()
-
         color = parser.parse({'r': 255, 'g': 0, 'b': 0, 'a': 128})
         assert color.r == 1.0
         assert 0.48 < color.a < 0.52  # ~0.5
 
-    def test_rgb_object_default_alpha(self):
+    def test_rgb_object_default_alpha(self, parser):
         """Alpha defaults to 255 (opaque) if not specified"""
-        parser = ColorParser()
-
         color = parser.parse({'r': 255, 'g': 0, 'b': 0})
         assert color.a == 1.0
 
-    def test_rgb_object_out_of_range(self):
+    def test_rgb_object_out_of_range(self, parser):
         """Values must be 0-255"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError):
             parser.parse({'r': 256, 'g': 0, 'b': 0})
 
@@ -300,44 +351,43 @@ class TestRGBObjects:
 class TestHSLColors:
     """Test HSL color parsing"""
 
-    def test_hsl_red(self):
+    def test_hsl_red(self, parser):
         """Parse red in HSL"""
-        parser = ColorParser()
-
         red = parser.parse({'h': 0, 's': 100, 'l': 50})
         assert red.r > 0.99
         assert red.g < 0.01
         assert red.b < 0.01
 
-    def test_hsl_blue(self):
+    def test_hsl_blue(self, parser):
         """Parse blue in HSL"""
-        parser = ColorParser()
-
         blue = parser.parse({'h': 240, 's': 100, 'l': 50})
         assert blue.r < 0.01
         assert blue.g < 0.01
         assert blue.b > 0.99
 
-    def test_hsl_gray(self):
+    def test_hsl_gray(self, parser):
         """Parse gray (no saturation)"""
-        parser = ColorParser()
-
         gray = parser.parse({'h': 0, 's': 0, 'l': 50})
         # Should be equal RGB values (gray)
         assert abs(gray.r - gray.g) < 0.01
         assert abs(gray.g - gray.b) < 0.01
 
-    def test_hsl_with_alpha(self):
+    def test_hsl_with_alpha(self, parser):
         """Parse HSL with alpha"""
-        parser = ColorParser()
-
         color = parser.parse({'h': 0, 's': 100, 'l': 50, 'a': 0.5})
         assert color.a == 0.5
 
-    def test_hsl_out_of_range(self):
-        """HSL values must be in valid ranges"""
-        parser = ColorParser()
+    def test_hsl_repeated_values(self, parser):
+        """Repeated HSL values share a result; nearby values don't collide"""
+        first = parser.parse({'h': 200, 's': 60, 'l': 40})
+        assert parser.parse({'h': 200, 's': 60, 'l': 40}) is first
+
+        # Fractional inputs are used as-is, not rounded (l=50 gives g == 0)
+        assert parser.parse({'h': 0, 's': 100, 'l': 50}).g == 0.0
+        assert parser.parse({'h': 0, 's': 100, 'l': 50.4}).g > 0.0
 
+    def test_hsl_out_of_range(self, parser):
+        """HSL values must be in valid ranges"""
         # Hue out of range (0-360)
         with pytest.raises(ColorParseError):
             parser.parse({'h': 361, 's': 100, 'l': 50})
@@ -354,36 +404,45 @@ class TestHSLColors:
 class TestErrorHandling:
     """Test error handling and messages"""
 
-    def test_none_value(self):
+    def test_none_value(self, parser):
         """None should raise error"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError):
             parser.parse(None)
 
-    def test_invalid_type(self):
+    def test_invalid_type(self, parser):
         """Invalid types should raise error"""
-        parser = ColorParser()
-
         with pytest.raises(ColorParseError):
             parser.parse(123)
 
         with pytest.raises(ColorParseError):
             parser.parse(True)
 
-    def test_invalid_object_keys(self):
-        """Object without r,g,b or h,s,l keys should error"""
-        parser = ColorParser()
+        with pytest.raises(ColorParseError):
+            parser.parse((1.0, 0.0, 0.0))
+
+    def test_subclassed_values(self, parser):
+        """Subclasses of str/list/dict parse like their base types"""
+        from collections import OrderedDict
+
+        class ColorList(list):
+            pass
+
+        assert parser.parse(OrderedDict(r=255, g=0, b=0)) == Color(1.0, 0.0, 0.0)
+        assert parser.parse(ColorList([0.0, 0.0, 1.0])) == Color(0.0, 0.0, 1.0)
 
+    def test_invalid_object_keys(self, parser):
+        """Object without r,g,b or h,s,l keys should error"""
         with pytest.raises(ColorParseError) as exc:
             parser.parse({'x': 0, 'y': 0, 'z': 0})
 
         assert 'r,g,b' in str(exc.value) or 'h,s,l' in str(exc.value)
 
-    def test_error_includes_suggestions(self):
-        """Errors should include helpful suggestions"""
-        parser = ColorParser()
+        # Incomplete HSL objects are reported the same way
+        with pytest.raises(ColorParseError):
+            parser.parse({'h': 0, 's': 100})
 
+    def test_error_includes_suggestions(self, parser):
+        """Errors should include helpful suggestions"""
         with pytest.raises(ColorParseError) as exc:
             parser.parse("redd")  # Typo
 
@@ -437,10 +496,8 @@ class TestRealWorldExamples:
             assert color is not None
             assert isinstance(color, Color)
 
-    def test_transparent_colors(self):
+    def test_transparent_colors(self, parser):
         """Test transparency in various formats"""
-        parser = ColorParser()
-
         # Hex with alpha
         c1 = parser.parse("#FF000080")
         assert c1.a < 0.6
@@ -456,3 +513,27 @@ class TestRealWorldExamples:
         # HSL with alpha
         c4 = parser.parse({'h': 0, 's': 100, 'l': 50, 'a': 0.3})
         assert c4.a == 0.3
+
+    def test_parse_many(self):
+        """Batch parsing matches parse() row by row"""
+        parser = ColorParser(palette={'accent': '#0066CC'})
+        values = [
+            '#FF0000', 'accent', '#0066CC80', '#F00', [0.5, 0.6, 0.7],
+            {'r': 128, 'g': 128, 'b': 128}, {'h': 120, 's': 100, 'l': 50},
+            ' #00ff00 ', {'h': 0, 's': 0, 'l': 30}, {'h': 300, 's': 40, 'l': 80, 'a': 0.5},
+            {'h': 359.5, 's': 12.5, 'l': 49.9}, {'h': 200, 's': 100, 'l': 10},
+        ]
+
+        rgba = parser.parse_many(values)
+
+        assert rgba.shape == (len(values), 4)
+        for row, value in zip(rgba, values):
+            assert tuple(row) == pytest.approx(parser.parse(value).to_rgba())
+
+    def test_parse_many_invalid(self, parser):
+        """Batch parsing raises like parse() does"""
+        assert parser.parse_many([]).shape == (0, 4)
+        with pytest.raises(ColorParseError):
+            parser.parse_many(['#FF0000', '#GG0000'])
+        with pytest.raises(ColorParseError):
+            parser.parse_many([{'h': 0, 's': 100, 'l': 50}, {'h': 400, 's': 100, 'l': 50}])
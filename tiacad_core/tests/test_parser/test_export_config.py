@@ -6,17 +6,19 @@ fixing the issue where finishing operations broke exports due to
 relying on dict ordering instead of explicit user intent.
 """
 
-import tempfile
 import os
-from tiacad_core.parser.tiacad_parser import TiaCADParser
 
+import pytest
 
-class TestExportConfigParsing:
-    """Test export configuration parsing"""
+from tiacad_core.parser.tiacad_parser import TiaCADParser
 
-    def test_export_default_part_parsing(self):
-        """Test that export: default_part: is parsed correctly"""
-        yaml_content = """
+
+# Documents shared by several tests, parsed once per module. Exporting only
+# reads a document, so the tests below can reuse them as-is.
+@pytest.fixture(scope="module")
+def chamfered_doc():
+    """base -> modified (transform) -> finished (chamfer), exporting 'modified'"""
+    return TiaCADParser.parse_string("""
 parts:
   base:
     primitive: box
@@ -30,10 +32,50 @@ operations:
     input: base
     transforms:
       - translate: [0, 0, 5]
+  finished:
+    type: finishing
+    finish: chamfer
+    input: modified
+    length: 1
+    edges: all
 export:
-  default_part: modified
-"""
-        doc = TiaCADParser.parse_string(yaml_content)
+  default_part: modified  # Export before finishing
+""")
+
+
+@pytest.fixture(scope="module")
+def priority_doc():
+    """first -> second -> third (transforms), exporting 'second'"""
+    return TiaCADParser.parse_string("""
+parts:
+  first:
+    primitive: box
+    parameters:
+      width: 5
+      height: 5
+      depth: 5
+operations:
+  second:
+    type: transform
+    input: first
+    transforms:
+      - translate: [10, 0, 0]
+  third:
+    type: transform
+    input: second
+    transforms:
+      - translate: [10, 0, 0]
+export:
+  default_part: second  # Not the last operation
+""")
+
+
+class TestExportConfigParsing:
+    """Test export configuration parsing"""
+
+    def test_export_default_part_parsing(self, chamfered_doc):
+        """Test that export: default_part: is parsed correctly"""
+        doc = chamfered_doc
 
         # Verify export config was parsed
         assert doc.export_config is not None
@@ -83,7 +125,7 @@ export:
 class TestExportWithFinishingOperations:
     """Test that export config enables finishing operations"""
 
-    def test_export_with_finishing_operation(self):
+    def test_export_with_finishing_operation(self, tmp_path):
         """Test export with finishing operation (chamfer) — result is a new named part."""
         yaml_content = """
 parts:
@@ -114,18 +156,13 @@ export:
         assert 'finished' in doc.parts.list_parts()
         assert 'positioned' in doc.parts.list_parts()
 
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            doc.export_stl(temp_path)
-            assert os.path.exists(temp_path)
-            assert os.path.getsize(temp_path) > 0
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        doc.export_stl(temp_path)
+        assert os.path.exists(temp_path)
+        assert os.path.getsize(temp_path) > 0
 
-    def test_export_finishing_creates_named_part(self):
+    def test_export_finishing_creates_named_part(self, tmp_path):
         """Test that finishing operations create a new named part (not in-place mutation)."""
         yaml_content = """
 parts:
@@ -153,61 +190,29 @@ export:
         # The original input part is still in the registry unchanged
         assert 'base' in doc.parts.list_parts()
 
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            doc.export_stl(temp_path)
-            assert os.path.exists(temp_path)
-            assert os.path.getsize(temp_path) > 0
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        doc.export_stl(temp_path)
+        assert os.path.exists(temp_path)
+        assert os.path.getsize(temp_path) > 0
 
 
 class TestExportPriorityLogic:
     """Test export part selection priority logic"""
 
-    def test_priority_1_export_config(self):
+    def test_priority_1_export_config(self, priority_doc, tmp_path):
         """Test that export config has highest priority"""
-        yaml_content = """
-parts:
-  first:
-    primitive: box
-    parameters:
-      width: 5
-      height: 5
-      depth: 5
-operations:
-  second:
-    type: transform
-    input: first
-    transforms:
-      - translate: [10, 0, 0]
-  third:
-    type: transform
-    input: second
-    transforms:
-      - translate: [10, 0, 0]
-export:
-  default_part: second  # Not the last operation
-"""
-        doc = TiaCADParser.parse_string(yaml_content)
+        doc = priority_doc
 
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            # Should export 'second', not 'third' (last operation)
-            doc.export_stl(temp_path)
-            # We can't directly verify which part was exported without
-            # inspecting geometry, but we can verify it didn't crash
-            assert os.path.exists(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Should export 'second', not 'third' (last operation)
+        doc.export_stl(temp_path)
+        # We can't directly verify which part was exported without
+        # inspecting geometry, but we can verify it didn't crash
+        assert os.path.exists(temp_path)
 
-    def test_priority_2_last_operation_fallback(self):
+    def test_priority_2_last_operation_fallback(self, tmp_path):
         """Test that last operation is used when no export config"""
         yaml_content = """
 parts:
@@ -232,17 +237,12 @@ operations:
         doc = TiaCADParser.parse_string(yaml_content)
 
         # No export config, should fall back to last operation
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            doc.export_stl(temp_path)
-            assert os.path.exists(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        doc.export_stl(temp_path)
+        assert os.path.exists(temp_path)
 
-    def test_priority_3_first_part_fallback(self):
+    def test_priority_3_first_part_fallback(self, tmp_path):
         """Test that first part is used when no operations or export config"""
         yaml_content = """
 parts:
@@ -256,87 +256,32 @@ parts:
         doc = TiaCADParser.parse_string(yaml_content)
 
         # No operations, no export config - should export first (only) part
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            doc.export_stl(temp_path)
-            assert os.path.exists(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        doc.export_stl(temp_path)
+        assert os.path.exists(temp_path)
 
-    def test_cli_override_has_ultimate_priority(self):
+    def test_cli_override_has_ultimate_priority(self, priority_doc, tmp_path):
         """Test that explicit CLI part name overrides export config"""
-        yaml_content = """
-parts:
-  first:
-    primitive: box
-    parameters:
-      width: 5
-      height: 5
-      depth: 5
-operations:
-  second:
-    type: transform
-    input: first
-    transforms:
-      - translate: [10, 0, 0]
-export:
-  default_part: second
-"""
-        doc = TiaCADParser.parse_string(yaml_content)
+        doc = priority_doc
 
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "part.stl")
 
-        try:
-            # Explicitly request 'first', should override export config
-            doc.export_stl(temp_path, part_name='first')
-            assert os.path.exists(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Explicitly request 'first', should override export config
+        doc.export_stl(temp_path, part_name='first')
+        assert os.path.exists(temp_path)
 
 
 class TestExportConfigSTEPFormat:
     """Test that export config applies to STEP format too"""
 
-    def test_step_respects_export_config(self):
+    def test_step_respects_export_config(self, chamfered_doc, tmp_path):
         """Test that STEP export also respects export config"""
-        yaml_content = """
-parts:
-  base:
-    primitive: box
-    parameters:
-      width: 10
-      height: 10
-      depth: 10
-operations:
-  modified:
-    type: transform
-    input: base
-    transforms:
-      - translate: [0, 0, 5]
-  finished:
-    type: finishing
-    finish: chamfer
-    input: modified
-    length: 1
-    edges: all
-export:
-  default_part: modified  # Export before finishing
-"""
-        doc = TiaCADParser.parse_string(yaml_content)
+        doc = chamfered_doc
+
+        temp_path = str(tmp_path / "part.step")
 
-        with tempfile.NamedTemporaryFile(suffix='.step', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Should export 'modified' for STEP too
-            doc.export_step(temp_path)
-            assert os.path.exists(temp_path)
-            assert os.path.getsize(temp_path) > 0
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Should export 'modified' for STEP too
+        doc.export_step(temp_path)
+        assert os.path.exists(temp_path)
+        assert os.path.getsize(temp_path) > 0
@@ -20,9 +20,13 @@ def part_registry():
     return PartRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parameter_resolver():
-    """Fixture providing a parameter resolver with test parameters"""
+    """Fixture providing a parameter resolver with test parameters.
+
+    Shared across the module: the parameters never change, so its resolved
+    cache stays valid between tests.
+    """
     params = {
         'fillet_radius': 2.0,
         'chamfer_length': 1.5,
@@ -33,36 +37,46 @@ def parameter_resolver():
 
 @pytest.fixture
 def finishing_builder(part_registry, parameter_resolver):
-    """Fixture providing a FinishingBuilder instance"""
+    """Fixture providing a FinishingBuilder bound to this test's registry"""
     return FinishingBuilder(part_registry, parameter_resolver)
 
 
+@pytest.fixture(scope="module")
+def _box_geometry():
+    """Box solid built once per module; finishing ops never modify their input"""
+    return cq.Workplane("XY").box(10, 10, 10)
+
+
+@pytest.fixture(scope="module")
+def _cylinder_geometry():
+    """Cylinder solid built once per module"""
+    return cq.Workplane("XY").cylinder(10, 5)
+
+
 @pytest.fixture
-def sample_box(part_registry):
+def sample_box(part_registry, _box_geometry):
     """Fixture providing a sample box part"""
-    geometry = cq.Workplane("XY").box(10, 10, 10)
-    part = Part(name="test_box", geometry=geometry, metadata={})
+    part = Part(name="test_box", geometry=_box_geometry, metadata={})
     part_registry.add(part)
     return part
 
 
 @pytest.fixture
-def sample_cylinder(part_registry):
+def sample_cylinder(part_registry, _cylinder_geometry):
     """Fixture providing a sample cylinder part"""
-    geometry = cq.Workplane("XY").cylinder(10, 5)
-    part = Part(name="test_cylinder", geometry=geometry, metadata={})
+    part = Part(name="test_cylinder", geometry=_cylinder_geometry, metadata={})
     part_registry.add(part)
     return part
 
 
-@pytest.fixture
-def thin_walled_tube(part_registry):
+@pytest.fixture(scope="module")
+def _thin_walled_tube_geometry():
     """A tube with only a 1mm-wide top rim wall: outer edge (r=10) and inner
     bore edge (r=9) sit on the exact same top face, 1mm apart. Mirrors a
     turned/revolved part whose bore entrance sits close under an outer lip
     (found while spiking a duck-call-insert-style model: a fillet radius
     that's fine for one edge alone silently collides with its neighbor)."""
-    geometry = (
+    return (
         cq.Workplane("XY")
         .circle(10)
         .extrude(5)
@@ -70,7 +84,12 @@ def thin_walled_tube(part_registry):
         .workplane()
         .hole(18)  # bore diameter 18 -> radius 9, 1mm wall from the r=10 OD
     )
-    part = Part(name="test_tube", geometry=geometry, metadata={})
+
+
+@pytest.fixture
+def thin_walled_tube(part_registry, _thin_walled_tube_geometry):
+    """Fixture providing the thin-walled tube as a part"""
+    part = Part(name="test_tube", geometry=_thin_walled_tube_geometry, metadata={})
     part_registry.add(part)
     return part
 
@@ -116,114 +135,49 @@ def test_fillet_with_parameter_expression(finishing_builder, sample_box):
     assert part.metadata['finishing_ops'][0]['radius'] == 2.0
 
 
-def test_fillet_direction_selector_z(finishing_builder, sample_box):
-    """Test fillet with direction selector (Z axis)"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 0.5,
-        'edges': {'direction': 'Z'}
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert 'finishing_ops' in part.metadata
-
-
-def test_fillet_direction_selector_x(finishing_builder, sample_box):
-    """Test fillet with direction selector (X axis)"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 0.5,
-        'edges': {'direction': 'X'}
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert part.metadata['finishing_ops'][0]['edges']['direction'] == 'X'
-
-
-def test_fillet_direction_selector_vector(finishing_builder, sample_box):
-    """Test fillet with direction selector using vector"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 0.5,
-        'edges': {'direction': [0, 0, 1]}
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert 'finishing_ops' in part.metadata
-
-
-def test_fillet_parallel_to_z(finishing_builder, sample_box):
-    """Test fillet with parallel_to selector"""
+@pytest.mark.parametrize("edges,key,value", [
+    ({'direction': 'Z'}, 'direction', 'Z'),
+    ({'direction': 'X'}, 'direction', 'X'),
+    ({'direction': [0, 0, 1]}, 'direction', [0, 0, 1]),
+    ({'parallel_to': 'Z'}, 'parallel_to', 'Z'),
+    ({'perpendicular_to': 'Z'}, 'perpendicular_to', 'Z'),
+    ({'selector': '>Z'}, 'selector', '>Z'),
+])
+def test_fillet_edge_selectors(finishing_builder, sample_box, edges, key, value):
+    """Test fillet with direction, parallel_to, perpendicular_to and string selectors"""
     spec = {
         'finish': 'fillet',
         'input': 'test_box',
         'radius': 0.5,
-        'edges': {'parallel_to': 'Z'}
+        'edges': edges
     }
 
     finishing_builder.execute_finishing_operation('fillet_op', spec)
 
     part = finishing_builder.registry.get('fillet_op')
-    assert part.metadata['finishing_ops'][0]['edges']['parallel_to'] == 'Z'
+    assert part.metadata['finishing_ops'][0]['edges'][key] == value
 
 
-def test_fillet_perpendicular_to_z(finishing_builder, sample_box):
-    """Test fillet with perpendicular_to selector"""
+@pytest.mark.parametrize("finish,size_key", [('fillet', 'radius'), ('chamfer', 'length')])
+def test_finish_creates_new_named_part(finishing_builder, sample_box, finish, size_key):
+    """Test that fillet/chamfer create a new named part (do not modify input in-place)"""
     spec = {
-        'finish': 'fillet',
+        'finish': finish,
         'input': 'test_box',
-        'radius': 0.5,
-        'edges': {'perpendicular_to': 'Z'}
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert part.metadata['finishing_ops'][0]['edges']['perpendicular_to'] == 'Z'
-
-
-def test_fillet_string_selector(finishing_builder, sample_box):
-    """Test fillet with direct string selector"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 0.5,
-        'edges': {'selector': '>Z'}
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert part.metadata['finishing_ops'][0]['edges']['selector'] == '>Z'
-
-
-def test_fillet_creates_new_named_part(finishing_builder, sample_box):
-    """Test that fillet creates a new named part (does not modify input in-place)"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 1.0,
+        size_key: 1.0,
         'edges': 'all'
     }
 
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
+    finishing_builder.execute_finishing_operation(f'{finish}_op', spec)
 
     # Result is a new part with the operation name
-    result = finishing_builder.registry.get('fillet_op')
-    assert result is not None
+    result = finishing_builder.registry.get(f'{finish}_op')
+    assert result is not sample_box
     assert 'finishing_ops' in result.metadata
 
     # Original input part is unchanged
     original = finishing_builder.registry.get('test_box')
+    assert original is sample_box
     assert 'finishing_ops' not in original.metadata
 
 
@@ -252,63 +206,27 @@ def test_fillet_multiple_operations_same_part(finishing_builder, sample_box):
     assert part2.metadata['finishing_ops'][0]['radius'] == 0.3
 
 
-def test_fillet_missing_input_error(finishing_builder, sample_box):
-    """Test error when input field is missing"""
-    spec = {
-        'finish': 'fillet',
-        'radius': 1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
+@pytest.mark.parametrize("spec,match", [
+    ({'finish': 'fillet', 'radius': 1.0, 'edges': 'all'}, "missing 'input' field"),
+    ({'finish': 'fillet', 'input': 'test_box', 'edges': 'all'}, "missing 'radius' field"),
+    ({'finish': 'fillet', 'input': 'nonexistent_part', 'radius': 1.0, 'edges': 'all'}, "not found"),
+    ({'finish': 'fillet', 'input': 'test_box', 'radius': 1.0, 'edges': {'unknown_selector': 'Z'}},
+     "Invalid edge selector"),
+    ({'finish': 'fillet', 'input': 'test_box', 'radius': -1.0, 'edges': 'all'}, "must be positive"),
+    ({'finish': 'fillet', 'input': 'test_box', 'radius': 1.0, 'edges': {'direction': 'INVALID'}},
+     "Invalid axis"),
+    # Not a unit vector
+    ({'finish': 'fillet', 'input': 'test_box', 'radius': 1.0, 'edges': {'direction': [1, 1, 1]}},
+     "Unsupported axis vector"),
+], ids=[
+    'missing_input', 'missing_radius', 'nonexistent_part', 'invalid_edge_selector',
+    'negative_radius', 'invalid_axis_string', 'invalid_axis_vector',
+])
+def test_fillet_errors(finishing_builder, sample_box, spec, match):
+    """Test fillet spec validation errors"""
+    with pytest.raises(FinishingBuilderError, match=match):
         finishing_builder.execute_finishing_operation('fillet_op', spec)
 
-    assert "missing 'input' field" in str(exc_info.value)
-
-
-def test_fillet_missing_radius_error(finishing_builder, sample_box):
-    """Test error when radius field is missing"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "missing 'radius' field" in str(exc_info.value)
-
-
-def test_fillet_nonexistent_part_error(finishing_builder):
-    """Test error when input part doesn't exist"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'nonexistent_part',
-        'radius': 1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "not found" in str(exc_info.value)
-
-
-def test_fillet_invalid_edge_selector_error(finishing_builder, sample_box):
-    """Test error when edge selector is invalid"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 1.0,
-        'edges': {'unknown_selector': 'Z'}
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "Invalid edge selector" in str(exc_info.value)
-
 
 def test_fillet_colliding_edges_raises_instead_of_silently_breaking(finishing_builder, thin_walled_tube):
     """A fillet radius too large for the local wall thickness makes OCCT
@@ -359,26 +277,10 @@ def test_require_valid_result_rejects_shape_flagged_invalid_by_occt(finishing_bu
         def val(self):
             return _FakeInvalidShape()
 
-    with pytest.raises(FBE) as exc_info:
+    with pytest.raises(FBE, match="invalid geometry"):
         finishing_builder._require_valid_result(
             _FakeResult(), 'op', 'Fillet', 'test_box', 'radius 5'
         )
-    assert "invalid geometry" in str(exc_info.value)
-
-
-def test_fillet_negative_radius_error(finishing_builder, sample_box):
-    """Test error when radius is negative"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': -1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "must be positive" in str(exc_info.value)
 
 
 # ============================================================================
@@ -455,70 +357,24 @@ def test_chamfer_with_parameter_expression(finishing_builder, sample_box):
     assert part.metadata['finishing_ops'][0]['length'] == 1.5
 
 
-def test_chamfer_direction_selector(finishing_builder, sample_box):
-    """Test chamfer with direction selector"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'length': 0.5,
-        'edges': {'direction': 'Z'}
-    }
-
-    finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    part = finishing_builder.registry.get('chamfer_op')
-    assert part.metadata['finishing_ops'][0]['edges']['direction'] == 'Z'
-
-
-def test_chamfer_parallel_to_selector(finishing_builder, sample_box):
-    """Test chamfer with parallel_to selector"""
+@pytest.mark.parametrize("edges,key,value", [
+    ({'direction': 'Z'}, 'direction', 'Z'),
+    ({'parallel_to': 'X'}, 'parallel_to', 'X'),
+    ({'perpendicular_to': 'Y'}, 'perpendicular_to', 'Y'),
+])
+def test_chamfer_edge_selectors(finishing_builder, sample_box, edges, key, value):
+    """Test chamfer with direction, parallel_to and perpendicular_to selectors"""
     spec = {
         'finish': 'chamfer',
         'input': 'test_box',
         'length': 0.5,
-        'edges': {'parallel_to': 'X'}
+        'edges': edges
     }
 
     finishing_builder.execute_finishing_operation('chamfer_op', spec)
 
     part = finishing_builder.registry.get('chamfer_op')
-    assert part.metadata['finishing_ops'][0]['edges']['parallel_to'] == 'X'
-
-
-def test_chamfer_perpendicular_to_selector(finishing_builder, sample_box):
-    """Test chamfer with perpendicular_to selector"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'length': 0.5,
-        'edges': {'perpendicular_to': 'Y'}
-    }
-
-    finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    part = finishing_builder.registry.get('chamfer_op')
-    assert part.metadata['finishing_ops'][0]['edges']['perpendicular_to'] == 'Y'
-
-
-def test_chamfer_creates_new_named_part(finishing_builder, sample_box):
-    """Test that chamfer creates a new named part (does not modify input in-place)"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'length': 1.0,
-        'edges': 'all'
-    }
-
-    finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    # Result is a new part with the operation name
-    result = finishing_builder.registry.get('chamfer_op')
-    assert result is not None
-    assert 'finishing_ops' in result.metadata
-
-    # Original input part is unchanged
-    original = finishing_builder.registry.get('test_box')
-    assert 'finishing_ops' not in original.metadata
+    assert part.metadata['finishing_ops'][0]['edges'][key] == value
 
 
 def test_chamfer_multiple_operations_same_part(finishing_builder, sample_box):
@@ -546,79 +402,19 @@ def test_chamfer_multiple_operations_same_part(finishing_builder, sample_box):
     assert part2.metadata['finishing_ops'][0]['length'] == 0.3
 
 
-def test_chamfer_missing_input_error(finishing_builder, sample_box):
-    """Test error when input field is missing"""
-    spec = {
-        'finish': 'chamfer',
-        'length': 1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
+@pytest.mark.parametrize("spec,match", [
+    ({'finish': 'chamfer', 'length': 1.0, 'edges': 'all'}, "missing 'input' field"),
+    ({'finish': 'chamfer', 'input': 'test_box', 'edges': 'all'}, "missing 'length' field"),
+    ({'finish': 'chamfer', 'input': 'nonexistent_part', 'length': 1.0, 'edges': 'all'}, "not found"),
+    ({'finish': 'chamfer', 'input': 'test_box', 'length': -1.0, 'edges': 'all'}, "must be positive"),
+    ({'finish': 'chamfer', 'input': 'test_box', 'length': 1.0, 'length2': -0.5, 'edges': 'all'},
+     "must be positive"),
+], ids=['missing_input', 'missing_length', 'nonexistent_part', 'negative_length', 'negative_length2'])
+def test_chamfer_errors(finishing_builder, sample_box, spec, match):
+    """Test chamfer spec validation errors"""
+    with pytest.raises(FinishingBuilderError, match=match):
         finishing_builder.execute_finishing_operation('chamfer_op', spec)
 
-    assert "missing 'input' field" in str(exc_info.value)
-
-
-def test_chamfer_missing_length_error(finishing_builder, sample_box):
-    """Test error when length field is missing"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    assert "missing 'length' field" in str(exc_info.value)
-
-
-def test_chamfer_nonexistent_part_error(finishing_builder):
-    """Test error when input part doesn't exist"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'nonexistent_part',
-        'length': 1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    assert "not found" in str(exc_info.value)
-
-
-def test_chamfer_negative_length_error(finishing_builder, sample_box):
-    """Test error when length is negative"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'length': -1.0,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    assert "must be positive" in str(exc_info.value)
-
-
-def test_chamfer_negative_length2_error(finishing_builder, sample_box):
-    """Test error when length2 is negative"""
-    spec = {
-        'finish': 'chamfer',
-        'input': 'test_box',
-        'length': 1.0,
-        'length2': -0.5,
-        'edges': 'all'
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('chamfer_op', spec)
-
-    assert "must be positive" in str(exc_info.value)
-
 
 # ============================================================================
 # MIXED OPERATIONS TESTS (5 tests)
@@ -657,11 +453,9 @@ def test_unknown_finish_type_error(finishing_builder, sample_box):
         'radius': 1.0
     }
 
-    with pytest.raises(FinishingBuilderError) as exc_info:
+    with pytest.raises(FinishingBuilderError, match="Unknown finishing operation"):
         finishing_builder.execute_finishing_operation('unknown_op', spec)
 
-    assert "Unknown finishing operation" in str(exc_info.value)
-
 
 def test_missing_finish_field_error(finishing_builder, sample_box):
     """Test error when finish field is missing"""
@@ -670,82 +464,66 @@ def test_missing_finish_field_error(finishing_builder, sample_box):
         'radius': 1.0
     }
 
-    with pytest.raises(FinishingBuilderError) as exc_info:
+    with pytest.raises(FinishingBuilderError, match="missing 'finish' field"):
         finishing_builder.execute_finishing_operation('bad_op', spec)
 
-    assert "missing 'finish' field" in str(exc_info.value)
 
-
-def test_invalid_axis_string_error(finishing_builder, sample_box):
-    """Test error when axis string is invalid"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 1.0,
-        'edges': {'direction': 'INVALID'}
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "Invalid axis" in str(exc_info.value)
-
-
-def test_invalid_axis_vector_error(finishing_builder, sample_box):
-    """Test error when axis vector is invalid"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_box',
-        'radius': 1.0,
-        'edges': {'direction': [1, 1, 1]}  # Not a unit vector
-    }
-
-    with pytest.raises(FinishingBuilderError) as exc_info:
-        finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    assert "Unsupported axis vector" in str(exc_info.value)
+@pytest.mark.parametrize("axis,expected", [
+    ([1, 0, 0], 'X'),
+    ((0.0, 1.0, 0.0), 'Y'),
+    ([0, 0, 1], 'Z'),
+    ([0.0, 0.0, 1.0 + 1e-12], 'Z'),  # float noise from upstream arithmetic
+])
+def test_normalize_axis_vector(finishing_builder, axis, expected):
+    """Test unit axis vectors map to CadQuery axis strings"""
+    assert finishing_builder._normalize_axis(axis, 'op') == expected
+
+
+@pytest.mark.parametrize("axis", [
+    [-1, 0, 0],
+    [0, 0, 2],
+    [0.5, 0.5, 0],
+    ['a', 'b', 'c'],
+    ['1', '0', '0'],
+    ('0', '0', '1'),
+    [[1], [0], [0]],
+])
+def test_normalize_axis_unsupported_vector(finishing_builder, axis):
+    """Test non-unit, negative, and non-numeric vectors are rejected"""
+    with pytest.raises(FinishingBuilderError, match="Unsupported axis vector"):
+        finishing_builder._normalize_axis(axis, 'op')
 
 
 # ============================================================================
 # INTEGRATION TESTS (4 tests)
 # ============================================================================
 
-def test_fillet_on_cylinder(finishing_builder, sample_cylinder):
-    """Test fillet operation on cylinder geometry"""
-    spec = {
-        'finish': 'fillet',
-        'input': 'test_cylinder',
-        'radius': 0.5,
-        'edges': 'all'
-    }
-
-    finishing_builder.execute_finishing_operation('fillet_op', spec)
-
-    part = finishing_builder.registry.get('fillet_op')
-    assert 'finishing_ops' in part.metadata
-
-
-def test_chamfer_on_cylinder(finishing_builder, sample_cylinder):
-    """Test chamfer operation on cylinder geometry"""
+@pytest.mark.parametrize("finish,size_key,size", [
+    ('fillet', 'radius', 0.5),
+    ('chamfer', 'length', 0.5),
+])
+def test_finish_on_cylinder(finishing_builder, sample_cylinder, finish, size_key, size):
+    """Test fillet and chamfer operations on cylinder geometry"""
     spec = {
-        'finish': 'chamfer',
+        'finish': finish,
         'input': 'test_cylinder',
-        'length': 0.5,
+        size_key: size,
         'edges': 'all'
     }
 
-    finishing_builder.execute_finishing_operation('chamfer_op', spec)
+    finishing_builder.execute_finishing_operation(f'{finish}_op', spec)
 
-    part = finishing_builder.registry.get('chamfer_op')
-    assert 'finishing_ops' in part.metadata
+    part = finishing_builder.registry.get(f'{finish}_op')
+    assert part.metadata['finishing_ops'][0]['type'] == finish
+    assert part.metadata['finishing_ops'][0][size_key] == size
 
 
-def test_edge_selector_all_axes(finishing_builder, part_registry):
+def test_edge_selector_all_axes(finishing_builder, part_registry, _box_geometry):
     """Test edge selectors with all three axes on separate boxes"""
-    # Create separate boxes for each axis test (can't chain selectors on same part)
+    # Register a separate part per axis (can't chain selectors on same part);
+    # they can share one solid since finishing never modifies its input
     for axis in ['X', 'Y', 'Z']:
-        geometry = cq.Workplane("XY").box(10, 10, 10)
-        part = Part(name=f'box_{axis}', geometry=geometry, metadata={})
+        part = Part(name=f'box_{axis}', geometry=_box_geometry, metadata={})
         part_registry.add(part)
 
         spec = {
@@ -10,6 +10,10 @@ Test Coverage:
 
 Total: 20 tests
 
+Hulls around spheres tessellate finely and take several seconds each;
+those tests are marked ``slow``. For quick feedback run
+``pytest -n auto -m "not slow"``.
+
 Author: TIA
 Version: 0.1.0-alpha (Phase 4A)
 """
@@ -18,7 +22,9 @@ import pytest
 import cadquery as cq
 import numpy as np
 
-from tiacad_core.parser.hull_builder import HullBuilder, HullBuilderError
+from tiacad_core.parser.hull_builder import (
+    HullBuilder, HullBuilderError, _tessellated_vertices, clear_hull_cache
+)
 from tiacad_core.parser.parameter_resolver import ParameterResolver
 from tiacad_core.part import Part, PartRegistry
 from tiacad_core.geometry import MockBackend, CadQueryBackend
@@ -28,46 +34,39 @@ from tiacad_core.geometry import MockBackend, CadQueryBackend
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def registry():
-    """Create a PartRegistry with test parts for hull operations."""
-    reg = PartRegistry()
-
-    # Create four corner posts for hull testing
-    # Post 1: Bottom-left
-    post1 = cq.Workplane("XY").cylinder(10, 2).translate((0, 0, 0))
-    reg.add(Part("post1", post1))
-
-    # Post 2: Bottom-right
-    post2 = cq.Workplane("XY").cylinder(10, 2).translate((20, 0, 0))
-    reg.add(Part("post2", post2))
-
-    # Post 3: Top-left
-    post3 = cq.Workplane("XY").cylinder(10, 2).translate((0, 20, 0))
-    reg.add(Part("post3", post3))
-
-    # Post 4: Top-right
-    post4 = cq.Workplane("XY").cylinder(10, 2).translate((20, 20, 0))
-    reg.add(Part("post4", post4))
-
-    # Add a center elevated post
-    post_center = cq.Workplane("XY").cylinder(15, 2).translate((10, 10, 0))
-    reg.add(Part("post_center", post_center))
-
-    # Add simple spheres for testing
-    sphere1 = cq.Workplane("XY").sphere(5).translate((0, 0, 0))
-    reg.add(Part("sphere1", sphere1))
-
-    sphere2 = cq.Workplane("XY").sphere(5).translate((30, 0, 0))
-    reg.add(Part("sphere2", sphere2))
+@pytest.fixture(scope="session")
+def hull_source_solids():
+    """Build the hull source solids once; hull operations never modify them."""
+    return {
+        # Four corner posts for hull testing
+        'post1': cq.Workplane("XY").cylinder(10, 2).translate((0, 0, 0)),      # Bottom-left
+        'post2': cq.Workplane("XY").cylinder(10, 2).translate((20, 0, 0)),     # Bottom-right
+        'post3': cq.Workplane("XY").cylinder(10, 2).translate((0, 20, 0)),     # Top-left
+        'post4': cq.Workplane("XY").cylinder(10, 2).translate((20, 20, 0)),    # Top-right
+
+        # A center elevated post
+        'post_center': cq.Workplane("XY").cylinder(15, 2).translate((10, 10, 0)),
+
+        # Simple spheres for testing
+        'sphere1': cq.Workplane("XY").sphere(5).translate((0, 0, 0)),
+        'sphere2': cq.Workplane("XY").sphere(5).translate((30, 0, 0)),
+        'sphere3': cq.Workplane("XY").sphere(5).translate((15, 25, 0)),
+
+        # A small box for testing
+        'small_box': cq.Workplane("XY").box(5, 5, 5),
+    }
 
-    sphere3 = cq.Workplane("XY").sphere(5).translate((15, 25, 0))
-    reg.add(Part("sphere3", sphere3))
 
-    # Add a small box for testing
-    small_box = cq.Workplane("XY").box(5, 5, 5)
-    reg.add(Part("small_box", small_box))
+@pytest.fixture
+def registry(hull_source_solids):
+    """Create a PartRegistry with test parts for hull operations.
 
+    Each test gets fresh Part objects (own metadata/backend) wrapping the
+    shared session-scoped solids.
+    """
+    reg = PartRegistry()
+    for name, geometry in hull_source_solids.items():
+        reg.add(Part(name, geometry))
     return reg
 
 
@@ -88,10 +87,29 @@ def builder(registry, resolver):
     return HullBuilder(registry, resolver)
 
 
+@pytest.fixture(scope="module")
+def four_post_hull(hull_source_solids):
+    """Hull around the four corner posts, computed once per module.
+
+    Read-only tests that only inspect the enclosure share this result
+    instead of each running their own OCCT hull.
+    """
+    post_names = ['post1', 'post2', 'post3', 'post4']
+    reg = PartRegistry()
+    for name in post_names:
+        reg.add(Part(name, hull_source_solids[name]))
+
+    HullBuilder(reg, ParameterResolver({})).execute_hull_operation(
+        'enclosure', {'inputs': post_names}
+    )
+    return reg.get('enclosure')
+
+
 # ============================================================================
 # Basic Hull Tests (6 tests)
 # ============================================================================
 
+@pytest.mark.slow
 def test_hull_two_spheres(builder, registry):
     """Test hull around two spheres creates elongated shape."""
     spec = {
@@ -114,6 +132,7 @@ def test_hull_two_spheres(builder, registry):
     assert solid.Volume() > sphere_volume
 
 
+@pytest.mark.slow
 def test_hull_three_spheres(builder, registry):
     """Test hull around three spheres creates triangular prism-like shape."""
     spec = {
@@ -132,26 +151,19 @@ def test_hull_three_spheres(builder, registry):
     assert solid.Volume() > 0
 
 
-def test_hull_four_posts(builder, registry):
+def test_hull_four_posts(four_post_hull):
     """Test hull around four corner posts creates rectangular enclosure."""
-    spec = {
-        'inputs': ['post1', 'post2', 'post3', 'post4']
-    }
-
-    builder.execute_hull_operation('enclosure', spec)
-
-    # Verify result exists
-    assert registry.exists('enclosure')
-    result = registry.get('enclosure')
-    assert result.geometry is not None
+    assert four_post_hull.geometry is not None
 
     # Verify bounding box approximately matches post positions
-    bbox = result.geometry.val().BoundingBox()
+    bbox = four_post_hull.geometry.val().BoundingBox()
 
     # Posts are at (0,0), (20,0), (0,20), (20,20), with radius 2
     # So hull should roughly span from -2 to 22 in X and Y
     assert -3 < bbox.xmin < 0
     assert 20 < bbox.xmax < 23
+    assert -3 < bbox.ymin < 0
+    assert 20 < bbox.ymax < 23
 
 
 def test_hull_five_posts_with_center(builder, registry):
@@ -173,6 +185,7 @@ def test_hull_five_posts_with_center(builder, registry):
     assert bbox.zmax >= 5  # At least half height of corner posts (10/2)
 
 
+@pytest.mark.slow
 def test_hull_mixed_shapes(builder, registry):
     """Test hull with mixed geometry types (sphere, cylinder, box)."""
     spec = {
@@ -188,6 +201,7 @@ def test_hull_mixed_shapes(builder, registry):
     assert result.geometry.val().Volume() > 0
 
 
+@pytest.mark.slow
 def test_hull_metadata_propagation(builder, registry):
     """Test that metadata is properly set on hull result."""
     spec = {
@@ -263,52 +277,17 @@ def test_hull_single_input_preserves_backend(builder, registry):
 # Error Handling Tests (6 tests)
 # ============================================================================
 
-def test_hull_missing_inputs_field(builder):
-    """Test hull fails without inputs field."""
-    spec = {}
-
-    with pytest.raises(HullBuilderError) as exc_info:
-        builder.execute_hull_operation('bad_hull', spec)
-
-    assert "missing required 'inputs' field" in str(exc_info.value).lower()
-
-
-def test_hull_inputs_not_list(builder):
-    """Test hull fails when inputs is not a list."""
-    spec = {
-        'inputs': 'sphere1'  # String instead of list
-    }
-
-    with pytest.raises(HullBuilderError) as exc_info:
-        builder.execute_hull_operation('bad_hull', spec)
-
-    assert "inputs must be a list" in str(exc_info.value).lower()
-
-
-def test_hull_empty_inputs_list(builder):
-    """Test hull fails with empty inputs list."""
-    spec = {
-        'inputs': []
-    }
-
-    with pytest.raises(HullBuilderError) as exc_info:
-        builder.execute_hull_operation('empty_hull', spec)
-
-    assert "at least 1 input" in str(exc_info.value).lower()
-
-
-def test_hull_nonexistent_part(builder, registry):
-    """Test hull fails when input part doesn't exist."""
-    spec = {
-        'inputs': ['sphere1', 'nonexistent_part']
-    }
-
-    with pytest.raises(HullBuilderError) as exc_info:
+@pytest.mark.parametrize("spec,match", [
+    ({}, "missing required 'inputs' field"),
+    ({'inputs': 'sphere1'}, "inputs must be a list"),  # String instead of list
+    ({'inputs': []}, "at least 1 input"),
+    ({'inputs': ['sphere1', 'nonexistent_part']}, "'nonexistent_part' not found"),
+], ids=['missing_inputs', 'inputs_not_list', 'empty_inputs', 'nonexistent_part'])
+def test_hull_invalid_inputs(builder, spec, match):
+    """Test hull fails on missing, malformed, or unknown inputs."""
+    with pytest.raises(HullBuilderError, match=match):
         builder.execute_hull_operation('bad_hull', spec)
 
-    assert "not found" in str(exc_info.value).lower()
-    assert "nonexistent_part" in str(exc_info.value)
-
 
 def test_hull_rejects_non_cadquery_inputs(resolver):
     """Multi-input hull should fail clearly on non-CadQuery-backed parts."""
@@ -319,12 +298,11 @@ def test_hull_rejects_non_cadquery_inputs(resolver):
 
     builder = HullBuilder(registry, resolver)
 
-    with pytest.raises(HullBuilderError) as exc_info:
+    with pytest.raises(HullBuilderError, match="CadQuery-compatible input part"):
         builder.execute_hull_operation('bad_hull', {'inputs': ['box1', 'box2']})
 
-    assert 'cadquery-compatible input part' in str(exc_info.value).lower()
-
 
+@pytest.mark.slow
 def test_hull_with_parameters(registry):
     """Test hull with parameter expressions."""
     params = {
@@ -400,18 +378,10 @@ def test_hull_detects_non_coplanar_points():
 # Integration Tests (4 tests)
 # ============================================================================
 
-def test_hull_integration_simple_enclosure(builder, registry):
+def test_hull_integration_simple_enclosure(four_post_hull):
     """Integration test: Create simple enclosure around corner posts."""
-    spec = {
-        'inputs': ['post1', 'post2', 'post3', 'post4']
-    }
-
-    builder.execute_hull_operation('simple_enclosure', spec)
-
-    result = registry.get('simple_enclosure')
-
     # Verify geometry properties
-    solid = result.geometry.val()
+    solid = four_post_hull.geometry.val()
     bbox = solid.BoundingBox()
 
     # Verify hull spans the expected space
@@ -419,6 +389,7 @@ def test_hull_integration_simple_enclosure(builder, registry):
     assert bbox.ymax - bbox.ymin > 20  # At least 20mm deep
 
 
+@pytest.mark.slow
 def test_hull_integration_with_subsequent_boolean(builder, registry):
     """Integration test: Use hull result in boolean operation."""
     # Create hull
@@ -454,6 +425,30 @@ def test_hull_integration_vertex_extraction(builder, registry):
         assert all(isinstance(coord, (int, float)) for coord in vertex)
 
 
+@pytest.mark.serial
+def test_hull_vertex_extraction_is_memoized(builder, registry):
+    """Repeated extraction from the same source solid tessellates it once."""
+    clear_hull_cache()
+    post_geom = registry.get('post1').geometry
+
+    first = builder._extract_vertices(post_geom)
+    second = builder._extract_vertices(post_geom)
+
+    assert first == second
+    assert first is not second  # callers get their own list
+    info = _tessellated_vertices.cache_info()
+    assert info.misses == 1 and info.hits == 1
+
+    # A translated copy is a different shape and is tessellated separately
+    builder._extract_vertices(registry.get('post2').geometry)
+    assert _tessellated_vertices.cache_info().misses == 2
+
+    # Clearing releases the cached source shapes
+    clear_hull_cache()
+    assert _tessellated_vertices.cache_info().currsize == 0
+
+
+@pytest.mark.slow
 def test_hull_integration_volume_check(builder, registry):
     """Integration test: Verify hull volume is reasonable."""
     # Create hull around three spheres
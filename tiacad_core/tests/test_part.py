@@ -101,6 +101,27 @@ class TestPartPositionTracking:
         assert abs(min_z - (-15)) < 0.01
         assert abs(max_z - 15) < 0.01
 
+    def test_get_bounds_cached_until_geometry_changes(self, monkeypatch):
+        """Bounds are computed once per geometry object"""
+        from tiacad_core.geometry import CadQueryBackend
+
+        backend = CadQueryBackend()
+        calls = []
+        original = backend.get_bounding_box
+        monkeypatch.setattr(
+            backend, 'get_bounding_box', lambda g: calls.append(g) or original(g)
+        )
+        part = Part(name="box", geometry=cq.Workplane('XY').box(10, 10, 10), backend=backend)
+
+        first = part.get_bounds()
+        first['min'] = None  # callers get their own dict
+        assert part.get_bounds()['min'] == pytest.approx((-5, -5, -5))
+        assert len(calls) == 1
+
+        part.geometry = part.geometry.translate((10, 0, 0))
+        assert part.get_bounds()['min'] == pytest.approx((5, -5, -5))
+        assert len(calls) == 2
+
 
 class TestTransformHistory:
     """Test transform tracking"""
@@ -4,7 +4,9 @@ Tests for SelectorResolver - Geometric feature selection
 
 import pytest
 import cadquery as cq
-from tiacad_core.selector_resolver import SelectorResolver, FeatureType, parse_selector
+from tiacad_core.selector_resolver import (
+    SelectorResolver, FeatureType, ParsedSelector, parse_selector
+)
 
 
 class TestParseSelector:
@@ -13,27 +15,32 @@ class TestParseSelector:
     def test_parse_simple_selector(self):
         """Parse simple directional selector"""
         result = parse_selector(">Z")
-        assert result == {'type': 'simple', 'parts': ['>Z']}
+        assert result == ParsedSelector('simple', ('>Z',))
 
     def test_parse_and_combinator(self):
         """Parse AND combinator"""
         result = parse_selector("|Z and >X")
-        assert result == {'type': 'and', 'parts': ['|Z', '>X']}
+        assert result == ParsedSelector('and', ('|Z', '>X'))
 
     def test_parse_or_combinator(self):
         """Parse OR combinator"""
         result = parse_selector(">Z or <Z")
-        assert result == {'type': 'or', 'parts': ['>Z', '<Z']}
+        assert result == ParsedSelector('or', ('>Z', '<Z'))
 
     def test_parse_not_combinator(self):
         """Parse NOT combinator"""
         result = parse_selector("not <Z")
-        assert result == {'type': 'not', 'parts': ['<Z']}
+        assert result == ParsedSelector('not', ('<Z',))
 
     def test_parse_with_whitespace(self):
         """Parse selector with extra whitespace"""
         result = parse_selector("  |Z   and   >X  ")
-        assert result == {'type': 'and', 'parts': ['|Z', '>X']}
+        assert result == ParsedSelector('and', ('|Z', '>X'))
+
+    def test_parse_is_memoized(self):
+        """Repeated parses return the same immutable result"""
+        assert parse_selector(">Z or <Z") is parse_selector(">Z or <Z")
+        assert parse_selector("not <Z")._asdict() == {'type': 'not', 'parts': ('<Z',)}
 
 
 class TestSelectorResolverSimple:
@@ -123,6 +130,12 @@ class TestSelectorResolverAnd:
         with pytest.raises(ValueError, match="Expected exactly one 'and'"):
             self.resolver.resolve(">Z and >X and >Y", FeatureType.FACE)
 
+    @pytest.mark.parametrize("selector", ["|Z and >X\nand <Y", "|Z\tand >X and <Y"])
+    def test_and_invalid_multiple_mixed_whitespace(self, selector):
+        """A second AND separated by tabs/newlines should raise error"""
+        with pytest.raises(ValueError, match="Expected exactly one 'and'"):
+            self.resolver.resolve(selector, FeatureType.FACE)
+
 
 class TestSelectorResolverOr:
     """Test OR combinator"""
@@ -149,6 +162,12 @@ class TestSelectorResolverOr:
         with pytest.raises(ValueError, match="Expected exactly one 'or'"):
             self.resolver.resolve(">Z or >X or >Y", FeatureType.FACE)
 
+    @pytest.mark.parametrize("selector", [">Z or >X\nor <Y", ">Z\tor >X or <Y"])
+    def test_or_invalid_multiple_mixed_whitespace(self, selector):
+        """A second OR separated by tabs/newlines should raise error"""
+        with pytest.raises(ValueError, match="Expected exactly one 'or'"):
+            self.resolver.resolve(selector, FeatureType.FACE)
+
 
 class TestSelectorResolverNot:
     """Test NOT combinator"""
@@ -227,6 +246,12 @@ class TestSelectorResolverEdgeCases:
         result2 = self.resolver.resolve("|Z  and  >X", FeatureType.EDGE)
         assert len(result1) == len(result2)
 
+    def test_and_with_tab_separator(self):
+        """AND combinator separated by tabs still splits correctly"""
+        result1 = self.resolver.resolve("|Z and >X", FeatureType.EDGE)
+        result2 = self.resolver.resolve("|Z\tand\t>X", FeatureType.EDGE)
+        assert set(result1) == set(result2)
+
     def test_empty_intersection(self):
         """AND that results in empty set"""
         result = self.resolver.resolve(">Z and <Z", FeatureType.FACE)
@@ -11,8 +11,10 @@ import pytest
 import cadquery as cq
 
 from tiacad_core.sketch import (
-    Sketch2D, Shape2D, Rectangle2D, Circle2D, Polygon2D, Text2D, SketchError
+    Sketch2D, Shape2D, ShapeOperation, Rectangle2D, Circle2D, Polygon2D, Text2D,
+    SketchError, clear_text_cache
 )
+from tiacad_core.sketch import _text_solid
 
 
 class TestShape2D:
@@ -48,6 +50,7 @@ class TestRectangle2D:
         """Create rectangle with custom center"""
         rect = Rectangle2D(width=10, height=20, center=(5, 10))
         assert rect.center == (5, 10)
+        assert (rect.cx, rect.cy) == (5, 10)
 
     def test_rectangle_with_operation(self):
         """Create rectangle with subtract operation"""
@@ -138,6 +141,35 @@ class TestPolygon2D:
             Polygon2D(points=[(0, 0), (10, 0)])
         assert "at least 3 points" in str(exc_info.value)
 
+    def test_polygon_points_array(self):
+        """Points are also held as a contiguous (N, 2) float64 array"""
+        points = [(0, 0), (10, 0), (10, 10)]
+        poly = Polygon2D(points=points)
+        assert poly.points is points
+        assert poly.points_arr.shape == (3, 2)
+        assert poly.points_arr.dtype == float
+        assert poly.points_arr.flags['C_CONTIGUOUS']
+
+    def test_polygon_points_reassignment_updates_array(self):
+        """Reassigning points re-validates them and rebuilds points_arr"""
+        poly = Polygon2D(points=[(0, 0), (10, 0), (10, 10)])
+        poly.points = [(0, 0), (5, 0), (5, 5), (0, 5)]
+        assert poly.points_arr.shape == (4, 2)
+        assert poly.points_arr[2].tolist() == [5.0, 5.0]
+
+        with pytest.raises(SketchError, match="at least 3 points"):
+            poly.points = [(0, 0), (1, 1)]
+        assert poly.points_arr.shape == (4, 2)
+
+    def test_polygon_non_2d_points_rejected(self):
+        """Points must be [x, y] pairs"""
+        with pytest.raises(SketchError) as exc_info:
+            Polygon2D(points=[(0, 0, 0), (10, 0, 0), (10, 10, 0)])
+        assert "[x, y] pairs" in str(exc_info.value)
+
+        with pytest.raises(SketchError):
+            Polygon2D(points=[(0, 0), (10, 0), (10,)])
+
     def test_polygon_build(self):
         """Polygon builds on workplane"""
         points = [(0, 0), (10, 0), (10, 10), (0, 10)]
@@ -273,6 +305,11 @@ class TestText2D:
         text = Text2D(text="Hello 世界 🌍", size=10)
         assert text.text == "Hello 世界 🌍"
 
+    def test_text_lone_surrogate_rejected(self):
+        """Text that cannot be encoded as UTF-8 is rejected"""
+        with pytest.raises(SketchError, match="Invalid Unicode"):
+            Text2D(text="bad \ud800 text", size=10)
+
     def test_text_parametric_string(self):
         """Text can contain parameter placeholders"""
         text = Text2D(text="${product_name} v${version}", size=10)
@@ -292,6 +329,52 @@ class TestText2D:
             if 'font' not in str(e).lower():
                 raise
 
+    def test_text_build_reuses_cached_glyphs(self):
+        """Rebuilding the same label reuses the cached glyph solid"""
+        _text_solid.cache_clear()
+        first = Text2D(text="PN-1", size=10).build(cq.Workplane("XY"))
+        moved = Text2D(text="PN-1", size=10, position=(20, 5)).build(
+            cq.Workplane("XZ")
+        )
+        assert _text_solid.cache_info().hits == 1
+
+        bb1 = first.val().BoundingBox()
+        bb2 = moved.val().BoundingBox()
+        assert bb2.xlen == pytest.approx(bb1.xlen)
+        assert bb2.xmin == pytest.approx(bb1.xmin + 20)
+        assert moved.val().Volume() == pytest.approx(first.val().Volume())
+
+    @pytest.mark.parametrize("with_base", [False, True])
+    def test_text_build_matches_workplane_text(self, with_base):
+        """Cached placement matches wp.text() with and without a base solid"""
+        wp = cq.Workplane("XY")
+        distance = 0.1
+        if with_base:
+            # Engrave into the top face so the cut actually removes material
+            wp = wp.box(40, 20, 5).faces(">Z").workplane()
+            distance = -2
+        text = Text2D(text="PN-1", size=10, position=(-10, -3))
+
+        result = text.build(wp, extrusion_distance=distance)
+        expected = wp.workplane(offset=0).center(-10, -3).text(
+            "PN-1", 10, distance, font=text.font, halign='left', valign='baseline'
+        )
+        if with_base:
+            assert result.val().Volume() < 40 * 20 * 5
+
+        assert len(result.vals()) == len(expected.vals()) == 1
+        assert result.val().Volume() == pytest.approx(expected.val().Volume())
+        bb, expected_bb = result.val().BoundingBox(), expected.val().BoundingBox()
+        for attr in ('xmin', 'xmax', 'ymin', 'ymax', 'zmin', 'zmax'):
+            assert getattr(bb, attr) == pytest.approx(getattr(expected_bb, attr))
+
+    def test_clear_text_cache(self):
+        """clear_text_cache() drops memoized glyph solids"""
+        Text2D(text="PN-1", size=10).build(cq.Workplane("XY"))
+        assert _text_solid.cache_info().currsize > 0
+        clear_text_cache()
+        assert _text_solid.cache_info().currsize == 0
+
     def test_text_repr(self):
         """Text has useful repr"""
         text = Text2D(text="Hello", size=10, font="Arial", style="bold")
@@ -342,6 +425,7 @@ class TestSketch2D:
                 shapes=[rect]
             )
         assert "Invalid plane" in str(exc_info.value)
+        assert "XY, XZ, YZ" in str(exc_info.value)
 
     def test_sketch_empty_shapes_rejected(self):
         """Sketch must have at least one shape"""
@@ -380,6 +464,40 @@ class TestSketch2D:
         profile = sketch.build_profile()
         assert profile is not None
 
+    def test_sketch_partitions_shapes_by_operation(self):
+        """add_shapes/subtract_shapes preserve sketch order per operation"""
+        rect = Rectangle2D(width=20, height=20)
+        hole1 = Circle2D(radius=2, center=(-5, 0), operation='subtract')
+        boss = Circle2D(radius=3, center=(20, 0))
+        hole2 = Circle2D(radius=2, center=(5, 0), operation='subtract')
+        sketch = Sketch2D(
+            name='test',
+            plane='XY',
+            origin=(0, 0, 0),
+            shapes=[rect, hole1, boss, hole2]
+        )
+        assert sketch.add_shapes == (rect, boss)
+        assert sketch.subtract_shapes == (hole1, hole2)
+        assert hole1.operation is ShapeOperation.SUBTRACT
+
+    def test_sketch_partitions_follow_shapes(self):
+        """Shapes can't be edited in place; reassigning re-partitions them"""
+        rect = Rectangle2D(width=20, height=20)
+        hole = Circle2D(radius=2, operation='subtract')
+        sketch = Sketch2D(
+            name='test',
+            plane='XY',
+            origin=(0, 0, 0),
+            shapes=[rect]
+        )
+        assert sketch.shapes == (rect,)
+        with pytest.raises(AttributeError):
+            sketch.shapes.append(hole)
+
+        sketch.shapes = [rect, hole]
+        assert sketch.add_shapes == (rect,)
+        assert sketch.subtract_shapes == (hole,)
+
     def test_sketch_all_subtract_shapes_rejected(self):
         """Sketch must have at least one 'add' shape"""
         hole = Circle2D(radius=5, operation='subtract')
@@ -180,6 +180,26 @@ class TestSpatialRefFrame:
         assert abs(np.dot(frame.x_axis, frame.z_axis)) < 1e-10
         assert abs(np.dot(frame.y_axis, frame.z_axis)) < 1e-10
 
+    def test_rotation_matrix_matches_frame(self):
+        """rotation_matrix() is the frame's 3x3 block, cached until orientation changes"""
+        ref = SpatialRef(position=[1, 2, 3], orientation=[1, 1, 0], ref_type='face')
+
+        rotation = ref.rotation_matrix()
+        assert_array_almost_equal(rotation, ref.frame.to_transform_matrix()[:3, :3])
+        assert ref.rotation_matrix() is rotation
+        assert not rotation.flags.writeable
+
+        ref.orientation = np.array([0.0, 0.0, 1.0])
+        assert_array_almost_equal(ref.rotation_matrix()[:, 2], [0, 0, 1])
+
+    def test_rotation_cache_not_in_repr(self):
+        """The cached matrix doesn't show up in repr"""
+        a = SpatialRef(position=[0, 0, 0], orientation=[0, 0, 1])
+        b = SpatialRef(position=[0, 0, 0], orientation=[0, 0, 1])
+        a.rotation_matrix()
+        assert repr(a) == repr(b)
+        assert "_rotation_cache" not in repr(a)
+
 
 class TestFrameCreation:
     """Test Frame creation methods"""
@@ -271,6 +291,16 @@ class TestFrameCreation:
 class TestFrameTransformations:
     """Test Frame transformation methods"""
 
+    def test_to_rotation_matrix_matches_transform_block(self):
+        """3x3 rotation matrix equals the transform's upper-left block"""
+        frame = Frame.from_normal([10, 20, 30], [1, 2, 3])
+
+        rotation = frame.to_rotation_matrix()
+
+        assert rotation.shape == (3, 3)
+        assert rotation.dtype == np.float64
+        assert_array_almost_equal(rotation, frame.to_transform_matrix()[:3, :3])
+
     def test_to_transform_matrix_identity(self):
         """Test transformation matrix for world-aligned frame"""
         frame = Frame(
@@ -16,12 +16,18 @@ import numpy as np
 
 from tiacad_core.testing.measurements import (
     measure_distance,
+    measure_distances,
+    measure_distances_grid,
+    find_neighbors_within,
+    clear_reference_cache,
     measure_angle,
     distance_between_refs,
     angle_between_refs,
     check_alignment,
     get_bounding_box_dimensions,
+    get_bounding_box_dimensions_batch,
     get_distance_between_points,
+    get_distances_between_points,
     parts_in_contact,
     build_contact_graph,
     is_fully_connected,
@@ -196,6 +202,101 @@ class TestMeasureDistance:
         assert abs(dist - 5.0) < 0.1
 
 
+class TestMeasureDistances:
+    """Test measure_distances() batch utility"""
+
+    def setup_method(self):
+        """Three boxes spaced along X"""
+        backend = CadQueryBackend()
+        self.boxes = [
+            Part(
+                name=f"box{i}",
+                geometry=cq.Workplane("XY").center(10 * i, 0).box(2, 2, 2),
+                backend=backend
+            )
+            for i in range(3)
+        ]
+
+    def test_matches_single_measurements(self):
+        """Batch result agrees with per-pair measure_distance"""
+        b0, b1, b2 = self.boxes
+        pairs = [(b0, b1, "center", "center"), (b0, b2, "center", "face_top")]
+        dists = measure_distances(pairs)
+
+        assert dists.shape == (2,)
+        for dist, (p1, p2, r1, r2) in zip(dists, pairs):
+            assert dist == pytest.approx(measure_distance(p1, p2, r1, r2))
+
+    def test_empty_pairs(self):
+        """No pairs yields an empty array"""
+        assert measure_distances([]).shape == (0,)
+
+    def test_geometry_change_invalidates_cached_reference(self):
+        """Replacing a part's geometry is picked up on the next measurement"""
+        clear_reference_cache()
+        b0, b1, _ = self.boxes
+        assert measure_distance(b0, b1) == pytest.approx(10.0)
+        assert measure_distance(b0, b1) == pytest.approx(10.0)
+
+        b1.geometry = cq.Workplane("XY").center(20, 0).box(2, 2, 2)
+        assert measure_distance(b0, b1) == pytest.approx(20.0)
+
+    def test_invalid_part_in_batch(self):
+        """A non-Part anywhere in the batch raises MeasurementError"""
+        with pytest.raises(MeasurementError, match="part2 must be a Part instance"):
+            measure_distances([(self.boxes[0], None, "center", "center")])
+
+
+class TestMeasureDistancesGrid:
+    """Test measure_distances_grid() all-pairs utility"""
+
+    def setup_method(self):
+        """Four boxes spaced 10mm apart along X"""
+        backend = CadQueryBackend()
+        self.boxes = [
+            Part(
+                name=f"box{i}",
+                geometry=cq.Workplane("XY").center(10 * i, 0).box(2, 2, 2),
+                backend=backend
+            )
+            for i in range(4)
+        ]
+
+    def test_full_grid(self):
+        """Without a cutoff every pair is measured"""
+        grid = measure_distances_grid(self.boxes)
+        expected = 10.0 * np.abs(np.subtract.outer(np.arange(4), np.arange(4)))
+        assert grid.shape == (4, 4)
+        assert np.allclose(grid, expected)
+
+    def test_cutoff_reports_far_pairs_as_inf(self):
+        """With max_distance only nearby pairs get a finite distance"""
+        grid = measure_distances_grid(self.boxes, max_distance=10.5)
+        assert np.allclose(np.diag(grid), 0.0)
+        assert grid[0, 1] == pytest.approx(10.0)
+        assert grid[1, 0] == pytest.approx(10.0)
+        assert np.isinf(grid[0, 2])
+        assert np.isinf(grid[3, 0])
+
+    def test_matches_measure_distance(self):
+        """Grid entries agree with pairwise measure_distance"""
+        grid = measure_distances_grid(self.boxes, ref="face_top")
+        assert grid[1, 3] == pytest.approx(
+            measure_distance(self.boxes[1], self.boxes[3], "face_top", "face_top")
+        )
+
+    def test_empty_and_single(self):
+        """Degenerate inputs give empty / zero grids"""
+        assert measure_distances_grid([]).shape == (0, 0)
+        assert measure_distances_grid(self.boxes[:1]).tolist() == [[0.0]]
+        assert measure_distances_grid(self.boxes[:1], max_distance=1.0).tolist() == [[0.0]]
+
+    def test_invalid_part(self):
+        """A non-Part raises MeasurementError"""
+        with pytest.raises(MeasurementError, match="must be Part instances"):
+            measure_distances_grid([self.boxes[0], None])
+
+
 class TestAngleAndAlignment:
     """Test angle_between_refs(), measure_angle(), and check_alignment()"""
 
@@ -392,6 +493,32 @@ class TestGetBoundingBoxDimensions:
             get_bounding_box_dimensions("not a part")
 
 
+class TestGetBoundingBoxDimensionsBatch:
+    """Test get_bounding_box_dimensions_batch() SoA helper"""
+
+    def test_matches_scalar_helper(self):
+        """Each row agrees with get_bounding_box_dimensions"""
+        backend = CadQueryBackend()
+        parts = [
+            Part(name="box", geometry=cq.Workplane("XY").box(10, 20, 30), backend=backend),
+            Part(name="cyl", geometry=cq.Workplane("XY").cylinder(20, 5), backend=backend),
+        ]
+        batch = get_bounding_box_dimensions_batch(parts)
+
+        assert batch['min'].shape == (2, 3)
+        assert batch['width'].shape == (2,)
+        for i, part in enumerate(parts):
+            single = get_bounding_box_dimensions(part)
+            for key in ('width', 'height', 'depth'):
+                assert batch[key][i] == pytest.approx(single[key])
+            assert batch['center'][i] == pytest.approx(single['center'])
+
+    def test_invalid_part(self):
+        """Non-Part entries raise MeasurementError"""
+        with pytest.raises(MeasurementError):
+            get_bounding_box_dimensions_batch([None])
+
+
 class TestGetDistanceBetweenPoints:
     """Test get_distance_between_points() helper"""
 
@@ -460,6 +587,25 @@ class TestGetDistanceBetweenPoints:
             get_distance_between_points(p1, p2)
 
 
+class TestGetDistancesBetweenPoints:
+    """Test get_distances_between_points() batch helper"""
+
+    def test_matches_scalar_helper(self):
+        """Row-wise results agree with get_distance_between_points"""
+        a = np.array([[0, 0, 0], [1, 2, 3], [-1, 0, 5]], dtype=float)
+        b = np.array([[3, 4, 0], [1, 2, 3], [2, 4, 5]], dtype=float)
+        dists = get_distances_between_points(a, b)
+
+        assert dists.shape == (3,)
+        for row, dist in enumerate(dists):
+            assert dist == pytest.approx(get_distance_between_points(a[row], b[row]))
+
+    def test_shape_mismatch(self):
+        """Mismatched batch lengths raise ValueError"""
+        with pytest.raises(ValueError, match="points2 must match"):
+            get_distances_between_points([[0, 0, 0]], [[0, 0, 0], [1, 1, 1]])
+
+
 class TestMeasurementErrorHandling:
     """Test error handling across measurement utilities"""
 
@@ -599,6 +745,49 @@ class TestPartsInContact:
         assert parts_in_contact(a, b, tolerance=0.01) is False
         assert parts_in_contact(a, b, tolerance=0.1) is True
 
+    def test_bbox_overlap_without_surface_contact(self):
+        # Boxes overlap but the solids don't: the exact test must still run.
+        a = self._box_at("a", 0)
+        ring = Part(
+            name="ring",
+            geometry=cq.Workplane("XY").circle(20).circle(15).extrude(10, both=True),
+            backend=CadQueryBackend(),
+        )
+        assert parts_in_contact(a, ring) is False
+
+
+class TestFindNeighborsWithin:
+    """Test find_neighbors_within() bounding-box broad phase."""
+
+    def _box_at(self, name, x, size=10):
+        return Part(
+            name=name,
+            geometry=cq.Workplane("XY").center(x, 0).box(size, size, size),
+            backend=CadQueryBackend(),
+        )
+
+    def test_touching_and_distant(self):
+        parts = [self._box_at("a", 0), self._box_at("b", 10), self._box_at("c", 50)]
+        assert find_neighbors_within(parts, 0.1) == [(0, 1)]
+
+    def test_tolerance_bridges_gap(self):
+        parts = [self._box_at("a", 0), self._box_at("b", 10.5)]
+        assert find_neighbors_within(parts, 0.1) == []
+        assert find_neighbors_within(parts, 1.0) == [(0, 1)]
+
+    def test_mixed_sizes(self):
+        # A large plate touching small boxes far from its centre is still found.
+        parts = [
+            self._box_at("plate", 0, size=100),
+            self._box_at("edge", 52),
+            self._box_at("far", 200),
+        ]
+        assert find_neighbors_within(parts, 0.1) == [(0, 1)]
+
+    def test_fewer_than_two_parts(self):
+        assert find_neighbors_within([], 0.1) == []
+        assert find_neighbors_within([self._box_at("a", 0)], 0.1) == []
+
 
 class TestContactGraphConnectivity:
     """Test build_contact_graph() + is_fully_connected()."""
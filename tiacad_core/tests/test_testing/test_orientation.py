@@ -16,11 +16,18 @@ import numpy as np
 
 from tiacad_core.testing.orientation import (
     get_orientation_angles,
+    get_orientation_angles_batch,
+    _rotation_matrix_to_euler_angles,
     get_normal_vector,
+    get_normal_vectors,
     parts_aligned,
+    parts_aligned_many,
+    alignment_matrix,
+    clear_reference_cache,
     OrientationError,
 )
 from tiacad_core.part import Part, PartRegistry
+from tiacad_core.geometry.spatial_references import Frame
 from tiacad_core.geometry import CadQueryBackend
 import cadquery as cq
 
@@ -91,6 +98,39 @@ class TestGetOrientationAngles:
         # Cylinder top should have orientation
         assert angles['has_orientation'] is True
 
+    def test_axis_aligned_faces_match_full_computation(self):
+        """Canonical-normal fast path returns the same angles as the frame path"""
+        box = Part(
+            name="box",
+            geometry=cq.Workplane("XY").box(10, 10, 10),
+            backend=self.backend
+        )
+
+        for face in ("face_top", "face_bottom", "face_left", "face_right",
+                     "face_front", "face_back"):
+            angles = get_orientation_angles(box, reference=face)
+            normal = get_normal_vector(box, face)
+            rotation = Frame.from_normal(np.zeros(3), normal).to_transform_matrix()[:3, :3]
+            expected = np.degrees(_rotation_matrix_to_euler_angles(rotation))
+            assert (angles['roll'], angles['pitch'], angles['yaw']) == pytest.approx(
+                tuple(expected), abs=1e-9
+            )
+
+    def test_axis_aligned_face_skips_euler_conversion(self, monkeypatch):
+        """Axis-aligned normals are served from the precomputed table"""
+        from tiacad_core.testing import orientation
+
+        def fail(_R):
+            raise AssertionError("Euler conversion should not run")
+
+        monkeypatch.setattr(orientation, "_rotation_matrix_to_euler_angles", fail)
+        box = Part(
+            name="box",
+            geometry=cq.Workplane("XY").box(10, 10, 10),
+            backend=self.backend
+        )
+        assert get_orientation_angles(box, reference="face_top")['has_orientation'] is True
+
     def test_invalid_part_raises_error(self):
         """Test that invalid part raises OrientationError"""
         with pytest.raises(OrientationError, match="must be a Part instance"):
@@ -108,6 +148,49 @@ class TestGetOrientationAngles:
             get_orientation_angles(box, reference="nonexistent_reference")
 
 
+class TestGetOrientationAnglesBatch:
+    """Test get_orientation_angles_batch() and the stacked Euler conversion"""
+
+    def setup_method(self):
+        backend = CadQueryBackend()
+        self.parts = [
+            Part(name="box", geometry=cq.Workplane("XY").box(10, 10, 10), backend=backend),
+            Part(name="cyl", geometry=cq.Workplane("XY").cylinder(20, 5), backend=backend),
+        ]
+
+    def test_matches_scalar_results(self):
+        """Batch angles agree with per-part get_orientation_angles"""
+        for reference in ("face_top", "face_front", "center"):
+            batch = get_orientation_angles_batch(self.parts, reference=reference)
+            for k, part in enumerate(self.parts):
+                single = get_orientation_angles(part, reference=reference)
+                assert batch['has_orientation'][k] == single['has_orientation']
+                for key in ('roll', 'pitch', 'yaw'):
+                    assert batch[key][k] == pytest.approx(single[key], abs=1e-9)
+
+    def test_empty(self):
+        """No parts yields empty arrays"""
+        batch = get_orientation_angles_batch([])
+        assert batch['roll'].shape == (0,)
+        assert batch['has_orientation'].shape == (0,)
+
+    def test_invalid_part_raises_error(self):
+        with pytest.raises(OrientationError, match="must be a Part instance"):
+            get_orientation_angles_batch([self.parts[0], "not a part"])
+
+    def test_stacked_euler_matches_scalar(self):
+        """Stacked conversion matches the single-matrix path, incl. gimbal lock"""
+        rng = np.random.default_rng(0)
+        q, _ = np.linalg.qr(rng.normal(size=(8, 3, 3)))
+        gimbal = np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]])
+        stack = np.concatenate([q, gimbal[None]])
+
+        angles = _rotation_matrix_to_euler_angles(stack)
+        assert angles.shape == (9, 3)
+        for R, row in zip(stack, angles):
+            assert row == pytest.approx(np.array(_rotation_matrix_to_euler_angles(R)))
+
+
 class TestGetNormalVector:
     """Test get_normal_vector() utility"""
 
@@ -115,6 +198,44 @@ class TestGetNormalVector:
         """Setup test fixtures"""
         self.backend = CadQueryBackend()
 
+    def teardown_method(self):
+        clear_reference_cache()
+
+    def test_geometry_change_invalidates_cached_reference(self):
+        """Repeated lookups are memoized but follow a replaced geometry"""
+        box = Part(
+            name="box",
+            geometry=cq.Workplane("XY").box(10, 10, 10),
+            backend=self.backend
+        )
+        anchor = Part(
+            name="anchor",
+            geometry=cq.Workplane("XY").box(2, 2, 2).translate((0, 0, 30)),
+            backend=self.backend
+        )
+        assert parts_aligned(box, anchor, axis='z', ref1="face_top")
+        assert parts_aligned(box, anchor, axis='z', ref1="face_top")
+
+        box.geometry = box.geometry.translate((5, 0, 0))
+        assert not parts_aligned(box, anchor, axis='z', ref1="face_top")
+        assert get_normal_vector(box, "face_top") == pytest.approx([0, 0, 1])
+
+    def test_normal_is_read_only_unless_copied(self):
+        """Default result is a read-only view; copy=True gives a writable array"""
+        box = Part(
+            name="box",
+            geometry=cq.Workplane("XY").box(10, 10, 10),
+            backend=self.backend
+        )
+
+        normal = get_normal_vector(box, "face_top")
+        with pytest.raises(ValueError):
+            normal[0] = 5.0
+
+        writable = get_normal_vector(box, "face_top", copy=True)
+        writable *= -1
+        assert get_normal_vector(box, "face_top") == pytest.approx([0, 0, 1])
+
     def test_box_face_top_normal_points_up(self):
         """Test that top face normal points upward"""
         box = Part(
@@ -219,6 +340,35 @@ class TestGetNormalVector:
             get_normal_vector("not a part", "face_top")
 
 
+class TestGetNormalVectors:
+    """Test get_normal_vectors() batch utility"""
+
+    def setup_method(self):
+        self.box = Part(
+            name="box",
+            geometry=cq.Workplane("XY").box(10, 10, 10),
+            backend=CadQueryBackend()
+        )
+
+    def test_all_box_faces_point_outward(self):
+        """Six box faces give six axis-aligned unit normals"""
+        faces = ["face_top", "face_bottom", "face_left",
+                 "face_right", "face_front", "face_back"]
+        normals = get_normal_vectors(self.box, faces)
+
+        assert normals.shape == (6, 3)
+        assert np.allclose(np.linalg.norm(normals, axis=1), 1.0)
+        for face, normal in zip(faces, normals):
+            assert normal == pytest.approx(get_normal_vector(self.box, face))
+
+    def test_empty_refs(self):
+        assert get_normal_vectors(self.box, []).shape == (0, 3)
+
+    def test_point_reference_raises_error(self):
+        with pytest.raises(OrientationError, match="'center' has no orientation"):
+            get_normal_vectors(self.box, ["face_top", "center"])
+
+
 class TestPartsAligned:
     """Test parts_aligned() utility"""
 
@@ -365,6 +515,87 @@ class TestPartsAligned:
             parts_aligned(box, "not a part", axis='z')
 
 
+class TestPartsAlignedMany:
+    """Test parts_aligned_many() batch utility"""
+
+    def setup_method(self):
+        backend = CadQueryBackend()
+        self.boxes = [
+            Part(
+                name=f"box{k}",
+                geometry=cq.Workplane("XY").box(2, 2, 2).translate(offset),
+                backend=backend
+            )
+            for k, offset in enumerate([(0, 0, 0), (0, 0, 10), (3, 0, 0), (0, 4, 20)])
+        ]
+
+    def test_matches_scalar_results(self):
+        """Batch result agrees with per-pair parts_aligned"""
+        b0, b1, b2, b3 = self.boxes
+        pairs = [
+            (b0, b1, "center", "center"),
+            (b0, b2, "center", "center"),
+            (b0, b3, "face_top", "face_bottom"),
+            (b1, b2, "face_top", "center"),
+        ]
+        for axis in ('x', 'y', 'z'):
+            result = parts_aligned_many(pairs, axis=axis, tolerance=0.1)
+            assert result.dtype == bool
+            assert result.tolist() == [
+                parts_aligned(p1, p2, axis=axis, ref1=r1, ref2=r2, tolerance=0.1)
+                for p1, p2, r1, r2 in pairs
+            ]
+
+    def test_empty_pairs(self):
+        assert parts_aligned_many([]).shape == (0,)
+
+    def test_invalid_inputs_raise_error(self):
+        with pytest.raises(OrientationError, match="part2 must be a Part instance"):
+            parts_aligned_many([(self.boxes[0], None, "center", "center")])
+        with pytest.raises(OrientationError, match="axis must be"):
+            parts_aligned_many([], axis='w')
+
+
+class TestAlignmentMatrix:
+    """Test alignment_matrix() all-pairs utility"""
+
+    def setup_method(self):
+        backend = CadQueryBackend()
+        offsets = [(0, 0, 0), (0, 0, 10), (3, 0, 0), (0, 0, -7), (3, 0, 5)]
+        self.parts = [
+            Part(
+                name=f"part{k}",
+                geometry=cq.Workplane("XY").box(2, 2, 2).translate(offset),
+                backend=backend
+            )
+            for k, offset in enumerate(offsets)
+        ]
+
+    def test_matches_pairwise_parts_aligned(self):
+        """Every entry agrees with parts_aligned on that pair"""
+        for axis in ('x', 'y', 'z'):
+            matrix = alignment_matrix(self.parts, axis=axis, tolerance=0.1)
+            assert matrix.shape == (5, 5)
+            for a, part_a in enumerate(self.parts):
+                for b, part_b in enumerate(self.parts):
+                    assert matrix[a, b] == parts_aligned(
+                        part_a, part_b, axis=axis, tolerance=0.1
+                    )
+
+    def test_coaxial_groups(self):
+        """Z-aligned groups are {0, 1, 3} and {2, 4}"""
+        matrix = alignment_matrix(self.parts, axis='z', tolerance=0.1)
+        assert np.flatnonzero(matrix[0]).tolist() == [0, 1, 3]
+        assert np.flatnonzero(matrix[2]).tolist() == [2, 4]
+
+    def test_empty_and_invalid(self):
+        assert alignment_matrix([]).shape == (0, 0)
+        with pytest.raises(OrientationError, match="must be a Part instance"):
+            alignment_matrix([self.parts[0], "not a part"])
+        with pytest.raises(OrientationError, match="axis must be"):
+            alignment_matrix(self.parts, axis='q')
+
+
 class TestOrientationIntegration:
     """Integration tests combining multiple orientation utilities"""
 